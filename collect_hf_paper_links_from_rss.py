@@ -5,56 +5,159 @@ Fetch an RSS feed from a URL and extract all <item><link> values.
 """
 
 import argparse
+import json
 import logging
+import os
 import sys
-from typing import List
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
 
 import requests
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - lxml ships with feedgen
+    import xml.etree.ElementTree as ET
 
 __version__ = "0.1.0"
 
+# Bytes pulled from the socket per parser feed when streaming a feed
+_STREAM_CHUNK_SIZE = 64 * 1024
 
-def fetch_rss(url: str, timeout) -> str:
+# ETag / Last-Modified validators from the last successful fetch, per feed URL
+RSS_META_PATH = Path(__file__).parent / ".rss_meta.json"
+
+
+class FeedNotModified(Exception):
+    """Raised by a conditional fetch when the server answers 304 Not Modified."""
+
+
+def _load_rss_meta() -> Dict[str, Dict[str, str]]:
+    try:
+        return json.loads(RSS_META_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _validators(headers) -> Dict[str, str]:
+    return {name: headers[name] for name in ("ETag", "Last-Modified") if headers.get(name)}
+
+
+def save_rss_meta(url: str, validators: Dict[str, str]) -> None:
+    """Remember *validators* (as returned by ``get_links_from_rss``) for *url*.
+
+    Callers should only do this once the feed's items have been fully
+    processed; otherwise the next conditional fetch gets a 304 and skips
+    whatever failed.
+    """
+    if not validators:
+        return
+    meta = _load_rss_meta()
+    meta[url] = validators
+    tmp = RSS_META_PATH.with_name(RSS_META_PATH.name + ".tmp")
+    tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    os.replace(tmp, RSS_META_PATH)
+
+
+def _conditional_headers(url: str) -> Dict[str, str]:
+    validators = _load_rss_meta().get(url, {})
+    headers = {}
+    if validators.get("ETag"):
+        headers["If-None-Match"] = validators["ETag"]
+    if validators.get("Last-Modified"):
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    return headers
+
+
+def fetch_rss(url: str, timeout) -> bytes:
     """
     Download the RSS feed XML from the given URL.
     
     :param url: RSS feed URL
     :param timeout: Request timeout in seconds
-    :return: XML content as text
+    :return: Raw XML bytes (the parser handles the declared encoding)
     :raises: requests.exceptions.RequestException on network errors
     """
     resp = requests.get(url, timeout=timeout)
     resp.raise_for_status()
-    return resp.text
+    return resp.content
+
+
+def _item_parser():
+    """Return an incremental parser that emits ``end`` events for <item>."""
+    if hasattr(ET, "LXML_VERSION"):
+        return ET.XMLPullParser(events=("end",), tag="item")
+    return ET.XMLPullParser(events=("end",))
+
 
+def _drain_links(parser, links: List[str]) -> None:
+    """Collect links from the items completed so far and release them."""
+    for _, item in parser.read_events():
+        # RSS 2.0 standard: items are under channel/item
+        if item.tag != "item":
+            continue
+        link = item.findtext("link")
+        if link and link.strip():
+            links.append(link.strip())
+        item.clear()
+        # lxml keeps cleared siblings attached to the parent; drop them too
+        if hasattr(item, "getprevious"):
+            while item.getprevious() is not None:
+                del item.getparent()[0]
 
-def parse_links(xml_content: str) -> List[str]:
+
+def parse_links(xml_content: Union[bytes, str]) -> List[str]:
     """
     Parse RSS XML content and extract all <item><link> values.
+
+    Items are released as soon as their link has been read, so large feeds
+    never materialize as a full DOM.
     
-    :param xml_content: RSS feed as string
+    :param xml_content: RSS feed as bytes (or string)
     :return: List of URLs found in <item><link>
     """
-    root = ET.fromstring(xml_content)
-    # RSS 2.0 standard: items are under channel/item
-    links = []
-    for item in root.findall("./channel/item"):
-        link_el = item.find("link")
-        if link_el is not None and link_el.text:
-            links.append(link_el.text.strip())
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode("utf-8")
+    parser = _item_parser()
+    links: List[str] = []
+    parser.feed(xml_content)
+    parser.close()
+    _drain_links(parser, links)
     return links
 
 
-def get_links_from_rss(url: str, timeout: float=10.0) -> List[str]:
+def get_links_from_rss(
+    url: str, timeout: float=10.0, conditional: bool = False
+) -> Tuple[List[str], Dict[str, str]]:
     """
-    Convenience wrapper: fetch + parse.
+    Stream the feed and parse it while it downloads.
+
+    Response chunks are fed straight into an incremental parser, so parsing
+    overlaps with the network transfer and the feed is never buffered whole.
+
+    With *conditional*, the validators saved from the previous fetch are sent
+    as ``If-None-Match`` / ``If-Modified-Since``. The response's validators
+    are returned, not saved; pass them to ``save_rss_meta`` once the links
+    have been handled.
     
     :param url: RSS feed URL
-    :return: List of links
+    :param conditional: Skip unchanged feeds using HTTP validators
+    :return: ``(links, validators)``
+    :raises FeedNotModified: if *conditional* and the feed is unchanged
     """
-    xml = fetch_rss(url, timeout)
-    return parse_links(xml)
+    links: List[str] = []
+    parser = _item_parser()
+    kwargs = {"headers": _conditional_headers(url)} if conditional else {}
+    with requests.get(url, stream=True, timeout=timeout, **kwargs) as resp:
+        if conditional and resp.status_code == 304:
+            raise FeedNotModified(url)
+        resp.raise_for_status()
+        for chunk in resp.iter_content(_STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+            _drain_links(parser, links)
+        parser.close()
+        _drain_links(parser, links)
+        validators = _validators(resp.headers)
+    return links, validators
 
 
 def main():
@@ -76,7 +179,7 @@ def main():
     logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
 
     try:
-        links = get_links_from_rss(args.url)
+        links, _ = get_links_from_rss(args.url)
     except requests.exceptions.RequestException as e:
         logging.error(f"Failed to fetch RSS feed: {e}")
         sys.exit(1)
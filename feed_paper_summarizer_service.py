@@ -28,24 +28,34 @@ import logging.handlers
 import os
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 import re
 from glob import glob
 from queue import Queue
 from threading import Lock
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover – Windows
+    fcntl = None
+
+import requests
 from tqdm import tqdm
 import json
 import markdown
 from feedgen.feed import FeedGenerator
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - lxml ships with feedgen
+    import xml.etree.ElementTree as ET
 
 # ---------------------------------------------------------------------------
 # Local modules – assume we're run from the repo root or installed package
 # ---------------------------------------------------------------------------
 try:
-    from collect_hf_paper_links_from_rss import get_links_from_rss  # type: ignore
+    from collect_hf_paper_links_from_rss import FeedNotModified, get_links_from_rss, save_rss_meta  # type: ignore
     import paper_summarizer as ps  # type: ignore
 except ModuleNotFoundError as _e:  # pragma: no cover
     raise SystemExit(
@@ -57,6 +67,16 @@ except ModuleNotFoundError as _e:  # pragma: no cover
 __version__ = "0.2.0"
 _LOG = logging.getLogger("feed_service")
 
+# Footnote-style reference block at the end of extracted markdown
+_REFERENCES_RE = re.compile(r'\^\[\d+\](.*\n)+')
+
+# (summary_or_markdown_path, pdf_url, paper_subject, summary_text); all None on failure
+PaperResult = Tuple[Optional[Path], Optional[str], Optional[str], Optional[str]]
+
+# Shared converter for RSS item bodies; reset() between documents is much
+# cheaper than rebuilding the parser and its extension tables each time.
+_RSS_MD = markdown.Markdown()
+
 # Global log listener for cleanup
 _log_listener = None
 
@@ -169,53 +189,103 @@ def _cleanup_corrupted_pdfs():
         _LOG.info("Cleaned up %d corrupted PDF files", corrupted_count)
 
 
+# Helper – atomic writes and per-summary locking
+# ---------------------------------------------------------------------------
+
+_path_locks: dict[str, Lock] = {}
+_path_locks_guard = Lock()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write *text* to *path* via a temp file so readers never see partial output."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+@contextmanager
+def _summary_lock(summary_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock for *summary_path* across threads and processes.
+
+    Uses ``flock`` on a sidecar file under ``.locks/`` where available and
+    falls back to an in-process lock elsewhere.
+    """
+    lock_dir = summary_path.parent / ".locks"
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    lock_path = lock_dir / (summary_path.name + ".lock")
+
+    if fcntl is None:
+        with _path_locks_guard:
+            lock = _path_locks.setdefault(str(lock_path), Lock())
+        with lock:
+            yield
+        return
+
+    with open(lock_path, "a") as fh:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
 # Helper – wrap the paper_summarizer pipeline for a single URL
 # ---------------------------------------------------------------------------
 
 def extract_first_header(markdown_text):
-    match = re.search(r'^##\s+(.+)$', markdown_text, re.MULTILINE)
-    if match:
-        return match.group(1).replace("**", '').strip()
-    return ""
+    """Return the first ``## `` header line (the paper title), bold markers removed."""
+    if markdown_text.startswith("## "):
+        start = 3
+    else:
+        pos = markdown_text.find("\n## ")
+        if pos < 0:
+            return ""
+        start = pos + 4
+    end = markdown_text.find("\n", start)
+    line = markdown_text[start:] if end < 0 else markdown_text[start:end]
+    return line.replace("**", '').strip()
+
+def _fetch_paper(
+    url: str, local: bool = False, session: Optional[requests.Session] = None
+) -> Tuple[Path, Path, str, str]:
+    """Resolve, download and extract *url* – the I/O-bound half of the pipeline.
+
+    Returns ``(pdf_path, md_path, pdf_url, markdown_text)``; raises on failure.
+    *session* defaults to ``paper_summarizer.SESSION``.
+    """
+    pdf_url = ps.resolve_pdf_url(url, session=session)  # type: ignore[attr-defined]
+    if local:
+        pdf_path = ps.download_pdf(pdf_url, session=session, skip_download=True)  # type: ignore[attr-defined]
+    else:
+        pdf_path = ps.download_pdf(pdf_url, session=session)  # type: ignore[attr-defined]
+    md_path = ps.extract_markdown(pdf_path)  # type: ignore[attr-defined]
+    text = ps.read_markdown(md_path)  # type: ignore[attr-defined]
+    return pdf_path, md_path, pdf_url, text
 
-def _summarize_url(
+
+def _summarize_paper(
     url: str,
+    pdf_path: Path,
+    md_path: Path,
+    pdf_url: str,
+    text: str,
     api_key: Optional[str] = None,
     base_url: Optional[str] = None,
     provider: str = "deepseek",
     model: str = "deepseek-chat",
     max_input_char: int = 50000,
     extract_only: bool = False,
-    local: bool = False,
     max_workers: int = 1,
-) -> Tuple[Optional[Path], Optional[str], Optional[str]]:
-    """Run the full summarization pipeline for *url*.
-
-    Returns the Path to the generated summary markdown and the download url for the paper, 
-    or *None* on failure. Only very high‑level logs are emitted here – fine‑grained steps are already
-    logged inside ``paper_summarizer``.
-    """
-    if extract_only:
-        _LOG.info("📄  Extracting text from %s", url)
-    else:
-        _LOG.info("📝  Summarizing %s", url)
-
+) -> PaperResult:
+    """Summarize and tag an already extracted paper – the LLM-bound half of the pipeline."""
     try:
-        pdf_url = ps.resolve_pdf_url(url)  # type: ignore[attr-defined]
-        if local:
-            pdf_path = ps.download_pdf(pdf_url, skip_download=True)  # type: ignore[attr-defined]
-        else:
-            pdf_path = ps.download_pdf(pdf_url)  # type: ignore[attr-defined]
-        md_path = ps.extract_markdown(pdf_path)  # type: ignore[attr-defined]
-
-        text = md_path.read_text(encoding="utf-8")
         paper_subject = extract_first_header(text)
 
         # If extract_only mode, return the markdown path directly
         if extract_only:
             _LOG.info("✅  Extracted text saved to %s ", md_path)
-            return md_path, pdf_url, paper_subject
-        text = re.sub(r'\^\[\d+\](.*\n)+', '', text) # remove references
+            return md_path, pdf_url, paper_subject, None
+        text = _REFERENCES_RE.sub('', text) # remove references
         if max_input_char > 0:
             text = text[:max_input_char]
 
@@ -223,62 +293,160 @@ def _summarize_url(
 
         f_name = pdf_path.stem + ".md"
         summary_path = ps.SUMMARY_DIR / f_name  # type: ignore[attr-defined]
-        if summary_path.exists():
-            _LOG.warning(f"{summary_path} existed")
-            # Ensure tags exist even if summary already cached
+        # Only one worker/process may summarize a given paper at a time; the
+        # existence check must sit inside the lock to collapse duplicates.
+        with _summary_lock(summary_path):
+            if summary_path.exists():
+                _LOG.warning(f"{summary_path} existed")
+                summary_text = summary_path.read_text(encoding="utf-8", errors="ignore")
+                # Ensure tags exist even if summary already cached
+                try:
+                    tags_path = ps.SUMMARY_DIR / (pdf_path.stem + ".tags.json")  # type: ignore[attr-defined]
+                    if not tags_path.exists():
+                        _LOG.info("🏷️  Backfilling tags for %s…", pdf_path.stem)
+                        tag_raw = ps.generate_tags_from_summary(
+                            summary_text,
+                            api_key=api_key,
+                            base_url=base_url,
+                            provider=provider,
+                            model=model,
+                        )  # type: ignore[attr-defined]
+                        tag_obj = tag_raw if isinstance(tag_raw, dict) else {"tags": list(tag_raw or []), "top": []}
+                        _write_atomic(tags_path, json.dumps(tag_obj, ensure_ascii=False, indent=2))
+                        _LOG.info("✅  Backfilled %d tag(s) for %s", len(tag_obj.get("tags", [])), pdf_path.stem)
+                except Exception as exc:
+                    _LOG.exception("Failed to backfill tags for %s: %s", pdf_path.stem, exc)
+                return summary_path, pdf_url, paper_subject, summary_text
+            chunks_summary_out_path = ps.CHUNKS_SUMMARY_DIR / f_name
+            logging.info(f"Start summarizing {md_path}...")
+            summary, chunks_summary = ps.progressive_summary(  # type: ignore[attr-defined]
+                chunks,
+                summary_path=summary_path,
+                chunk_summary_path=chunks_summary_out_path,
+                api_key=api_key,
+                base_url=base_url,
+                provider=provider,
+                model=model,
+                max_workers=max_workers,
+            )
+
+            _write_atomic(chunks_summary_out_path, chunks_summary)
+            _write_atomic(summary_path, summary)
+
+            # Generate and persist tags alongside the summary
             try:
+                _LOG.info("🏷️  Generating tags for %s…", pdf_path.stem)
+                tag_raw = ps.generate_tags_from_summary(summary, api_key=api_key, 
+                                                      base_url=base_url, provider=provider, model=model)  # type: ignore[attr-defined]
+                tag_obj = tag_raw if isinstance(tag_raw, dict) else {"tags": list(tag_raw or []), "top": []}
                 tags_path = ps.SUMMARY_DIR / (pdf_path.stem + ".tags.json")  # type: ignore[attr-defined]
-                if not tags_path.exists():
-                    _LOG.info("🏷️  Backfilling tags for %s…", pdf_path.stem)
-                    summary_text = summary_path.read_text(encoding="utf-8", errors="ignore")
-                    tag_raw = ps.generate_tags_from_summary(
-                        summary_text,
-                        api_key=api_key,
-                        base_url=base_url,
-                        provider=provider,
-                        model=model,
-                    )  # type: ignore[attr-defined]
-                    tag_obj = tag_raw if isinstance(tag_raw, dict) else {"tags": list(tag_raw or []), "top": []}
-                    tags_path.write_text(json.dumps(tag_obj, ensure_ascii=False, indent=2), encoding="utf-8")
-                    _LOG.info("✅  Backfilled %d tag(s) for %s", len(tag_obj.get("tags", [])), pdf_path.stem)
+                _write_atomic(tags_path, json.dumps(tag_obj, ensure_ascii=False, indent=2))
+                _LOG.info("✅  Saved %d tag(s) for %s", len(tag_obj.get("tags", [])), pdf_path.stem)
             except Exception as exc:
-                _LOG.exception("Failed to backfill tags for %s: %s", pdf_path.stem, exc)
-            return summary_path, pdf_url, paper_subject
-        chunks_summary_out_path = ps.CHUNKS_SUMMARY_DIR / f_name
-        logging.info(f"Start summarizing {md_path}...")
-        summary, chunks_summary = ps.progressive_summary(  # type: ignore[attr-defined]
-            chunks,
-            summary_path=summary_path,
-            chunk_summary_path=chunks_summary_out_path,
-            api_key=api_key,
-            base_url=base_url,
-            provider=provider,
-            model=model,
-            max_workers=max_workers,
-        )
-
-        chunks_summary_out_path.write_text(chunks_summary, encoding="utf-8")
-        summary_path.write_text(summary, encoding="utf-8")
-
-        # Generate and persist tags alongside the summary
-        try:
-            _LOG.info("🏷️  Generating tags for %s…", pdf_path.stem)
-            tag_raw = ps.generate_tags_from_summary(summary, api_key=api_key, 
-                                                  base_url=base_url, provider=provider, model=model)  # type: ignore[attr-defined]
-            tag_obj = tag_raw if isinstance(tag_raw, dict) else {"tags": list(tag_raw or []), "top": []}
-            tags_path = ps.SUMMARY_DIR / (pdf_path.stem + ".tags.json")  # type: ignore[attr-defined]
-            tags_path.write_text(json.dumps(tag_obj, ensure_ascii=False, indent=2), encoding="utf-8")
-            _LOG.info("✅  Saved %d tag(s) for %s", len(tag_obj.get("tags", [])), pdf_path.stem)
-        except Exception as exc:
-            _LOG.exception("Failed to generate tags for %s: %s", pdf_path.stem, exc)
-
-        _LOG.info("✅  Done – summary saved to %s", summary_path)
-        return summary_path, pdf_url, paper_subject
+                _LOG.exception("Failed to generate tags for %s: %s", pdf_path.stem, exc)
+
+            _LOG.info("✅  Done – summary saved to %s", summary_path)
+            return summary_path, pdf_url, paper_subject, summary
 
     except Exception as exc:  # pylint: disable=broad-except
         _LOG.error("❌  %s – %s", url, exc)
         _LOG.exception(exc)
-        return None, None, None
+        return None, None, None, None
+
+
+def _summarize_url(
+    url: str,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    provider: str = "deepseek",
+    model: str = "deepseek-chat",
+    max_input_char: int = 50000,
+    extract_only: bool = False,
+    local: bool = False,
+    max_workers: int = 1,
+    session: Optional[requests.Session] = None,
+) -> PaperResult:
+    """Run the full summarization pipeline for *url*.
+
+    Returns the Path to the generated summary markdown, the download url for the paper,
+    the paper title and the summary text, or all *None* on failure. Only very high‑level logs are emitted here – fine‑grained steps are already
+    logged inside ``paper_summarizer``.
+    """
+    if extract_only:
+        _LOG.info("📄  Extracting text from %s", url)
+    else:
+        _LOG.info("📝  Summarizing %s", url)
+
+    try:
+        fetched = _fetch_paper(url, local=local, session=session)
+    except Exception as exc:  # pylint: disable=broad-except
+        _LOG.error("❌  %s – %s", url, exc)
+        _LOG.exception(exc)
+        return None, None, None, None
+
+    return _summarize_paper(
+        url,
+        *fetched,
+        api_key=api_key,
+        base_url=base_url,
+        provider=provider,
+        model=model,
+        max_input_char=max_input_char,
+        extract_only=extract_only,
+        max_workers=max_workers,
+    )
+
+
+def _run_pipeline(
+    links: List[str],
+    download_workers: int,
+    summary_workers: int,
+    local: bool = False,
+    desc: str = "Summaries:",
+    session: Optional[requests.Session] = None,
+    **summary_kwargs,
+) -> List[PaperResult]:
+    """Process *links* with separate download and summary pools.
+
+    Downloads/extraction run on a wide I/O pool; each paper is handed to the
+    LLM pool as soon as its markdown is ready, so network and inference
+    overlap instead of running back to back inside one worker.
+    """
+    produced: List[PaperResult] = [(None, None, None, None)] * len(links)
+
+    with (
+        ThreadPoolExecutor(max_workers=download_workers, thread_name_prefix="fetch") as fetch_pool,
+        ThreadPoolExecutor(max_workers=summary_workers, thread_name_prefix="summary") as summary_pool,
+    ):
+        fetches = {fetch_pool.submit(_fetch_paper, link, local, session): idx for idx, link in enumerate(links)}
+        summaries = {}
+        try:
+            with tqdm(total=len(links), desc=desc) as bar:
+                for fut in as_completed(fetches):
+                    idx = fetches[fut]
+                    try:
+                        fetched = fut.result()
+                    except Exception as exc:  # pylint: disable=broad-except
+                        _LOG.error("❌  %s – %s", links[idx], exc)
+                        bar.update(1)
+                        continue
+                    summaries[summary_pool.submit(_summarize_paper, links[idx], *fetched, **summary_kwargs)] = idx
+
+                for fut in as_completed(summaries):
+                    idx = summaries[fut]
+                    try:
+                        produced[idx] = fut.result()
+                    except Exception as exc:  # pylint: disable=broad-except
+                        _LOG.error("Task failed for link %d (%s): %s", idx, links[idx], exc)
+                    bar.update(1)
+        except KeyboardInterrupt:
+            _LOG.warning("🛑  Processing interrupted by user. Cancelling remaining tasks...")
+            for future in (*fetches, *summaries):
+                if not future.done():
+                    future.cancel()
+            raise  # Re-raise to be caught by main handler
+
+    return produced
 
 # ---------------------------------------------------------------------------
 # Local discovery helpers
@@ -353,7 +521,7 @@ def _tags_only_run(provider: str = "deepseek", base_url: str = "https://api.deep
             summary_text = md_path.read_text(encoding="utf-8", errors="ignore")
             tags = ps.generate_tags_from_summary(summary_text, provider=provider,
                                                base_url=base_url, model=model, api_key=api_key)  # type: ignore[attr-defined]
-            tags_path.write_text(json.dumps({"tags": tags}, ensure_ascii=False, indent=2), encoding="utf-8")
+            _write_atomic(tags_path, json.dumps({"tags": tags}, ensure_ascii=False, indent=2))
             _LOG.info("✅  Saved %d tag(s) for %s", len(tags), paper_id)
             updated += 1
         except Exception as exc:  # pylint: disable=broad-except
@@ -366,19 +534,17 @@ def _tags_only_run(provider: str = "deepseek", base_url: str = "https://api.deep
 # Aggregate summaries → single Markdown file
 # ---------------------------------------------------------------------------
 
-def _aggregate_summaries(paths: List[Path], out_file: Path, feed_url: str) -> None:
-    """Concatenate individual summaries to *out_file* with a brief header."""
+def _aggregate_summaries(summaries: List[Tuple[Path, str]], out_file: Path, feed_url: str) -> None:
+    """Concatenate individual ``(path, summary_text)`` pairs to *out_file* with a brief header."""
     header = (
         f"# Batch Summary – {feed_url}\n"
         f"_Generated: {_dt.datetime.now().isoformat(timespec='seconds')}_\n\n"
     )
 
-    with out_file.open("w", encoding="utf-8") as fh:
-        fh.write(header)
-        for path in paths:
-            fh.write(f"\n---\n\n## {path.stem}\n\n")
-            fh.write(path.read_text(encoding="utf-8"))
-            fh.write("\n")
+    parts: List[str] = [header]
+    for path, summary_text in summaries:
+        parts.append(f"\n---\n\n## {path.stem}\n\n{summary_text}\n")
+    _write_atomic(out_file, "".join(parts))
     _LOG.info("📄  Aggregated summaries written to %s", out_file)
 
 # ---------------------------------------------------------------------------
@@ -429,10 +595,13 @@ def _parse_args(argv: List[str] | None = None) -> argparse.Namespace:  # noqa: D
     p.add_argument("--model", help="Model name for the selected provider")
     p.add_argument("--proxy", help="Proxy URL to use for PDF downloads (if needed)")
     p.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Concurrent workers (default: CPU count)")
+    p.add_argument("--download-workers", dest="download_workers", type=int, default=32,
+                   help="Concurrent PDF download/extraction workers (default: 32)")
     p.add_argument("--output", type=Path, default=Path("output.md"), help="Aggregate markdown output file")
     p.add_argument("--output_rss_path", type=Path, default=Path("hugging-face-ai-papers-rss.xml"), help="RSS xml file output path.")
     p.add_argument("--rebuild", action="store_true", help="Whether to rebuild the rss xml file using all existing summaries.")
     p.add_argument("--local", action="store_true", help="Process local cached papers instead of fetching RSS.")
+    p.add_argument("--force", action="store_true", help="Process the feed even if it has not changed since the last run.")
     p.add_argument("--tags-only", action="store_true", help="Only generate tags for existing summaries and exit.")
     p.add_argument("--extract-only", action="store_true", help="Only extract PDF text to markdown (no LLM calls, no summaries, no tags, no RSS generation).")
     p.add_argument("--debug", action="store_true", help="Verbose logging")
@@ -452,9 +621,10 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
     # Clean up any corrupted PDFs that might exist
     _cleanup_corrupted_pdfs()
 
-    # Proxy support – rebuild the session inside paper_summarizer if needed
+    # Proxy support – a dedicated session threaded through the pipeline
+    session = None
     if args.proxy:
-        ps.SESSION = ps.build_session(args.proxy)  # type: ignore[attr-defined]
+        session = ps.build_session(args.proxy)  # type: ignore[attr-defined]
         _LOG.warning("Using proxy %s", args.proxy)
 
     # Get provider configuration
@@ -476,6 +646,10 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
     # ------------------------------------------------------------------
     # 1. Collect links
     # ------------------------------------------------------------------
+    # Feed validators to persist once every paper went through; saving them
+    # earlier would turn a rerun after a failure into a 304 no-op
+    rss_validators: dict[str, str] = {}
+    conditional = False
     if args.local:
         _LOG.info("📦  Local mode enabled – discovering cached papers…")
         links = _collect_local_links()
@@ -487,7 +661,13 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
     else:
         _LOG.info("🔗  Fetching RSS feed…")
         try:
-            links = get_links_from_rss(args.rss_url, timeout=20.0)
+            # A rebuild must run even when the upstream feed is unchanged, and
+            # an extract-only run must leave the feed "new" for the summarize run
+            conditional = not (args.force or args.rebuild or args.extract_only)
+            links, rss_validators = get_links_from_rss(args.rss_url, timeout=20.0, conditional=conditional)
+        except FeedNotModified:
+            _LOG.info("✨  Feed unchanged since last run – nothing to do.")
+            sys.exit(0)
         except Exception as exc:  # pylint: disable=broad-except
             _LOG.error("Failed to fetch RSS: %s", exc)
             sys.exit(1)
@@ -501,48 +681,27 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
     # ------------------------------------------------------------------
     # 2. Parallel summarization
     # ------------------------------------------------------------------
-    _LOG.info("🧵  Starting summarization with %d worker(s)…", args.workers)
-    produced: List[Tuple[Optional[Path], Optional[str]]] = [(None, None)] * len(links)
-
-    with ThreadPoolExecutor(max_workers=args.workers) as pool:
-        futures = {
-            pool.submit(
-                _summarize_url,
-                link,
-                api_key=provider_config["api_key"],
-                base_url=provider_config["base_url"],
-                provider=provider_config["provider"],
-                model=provider_config["model"],
-                max_input_char=int(args.max_input_char),
-                extract_only=args.extract_only,
-                local=args.local,
-                max_workers=args.workers,
-            ): idx
-            for idx, link in enumerate(links)
-        }
-        try:
-            desc = "Text Extraction:" if args.extract_only else "Summaries:"
-            for fut in tqdm(as_completed(futures), total=len(futures), desc=desc):
-                try:
-                    result = fut.result(timeout=30)  # 30 seconds timeout per task
-                    produced[futures[fut]] = result
-                except Exception as exc:
-                    idx = futures[fut]
-                    _LOG.error("Task failed for link %d (%s): %s", idx, links[idx] if idx < len(links) else "unknown", exc)
-                    produced[idx] = (None, None, None)  # Mark as failed
-        except KeyboardInterrupt:
-            _LOG.warning("🛑  Processing interrupted by user. Cancelling remaining tasks...")
-            # Cancel all pending futures
-            for future in futures:
-                if not future.done():
-                    future.cancel()
-            # Wait a bit for running tasks to finish
-            import time
-            time.sleep(2)
-            raise  # Re-raise to be caught by main handler
+    _LOG.info(
+        "🧵  Starting pipeline with %d download worker(s) and %d summary worker(s)…",
+        args.download_workers, args.workers,
+    )
+    produced = _run_pipeline(
+        links,
+        download_workers=args.download_workers,
+        summary_workers=args.workers,
+        local=args.local,
+        desc="Text Extraction:" if args.extract_only else "Summaries:",
+        session=session,
+        api_key=provider_config["api_key"],
+        base_url=provider_config["base_url"],
+        provider=provider_config["provider"],
+        model=provider_config["model"],
+        max_input_char=int(args.max_input_char),
+        extract_only=args.extract_only,
+        max_workers=args.workers,
+    )
 
     successes = [p for p in produced if p[0]]
-    success_summaries_paths = [s[0] for s in successes]
     if args.extract_only:
         _LOG.info("✔️  %d/%d papers extracted to markdown successfully", len(successes), len(links))
     else:
@@ -559,7 +718,7 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
     # ------------------------------------------------------------------
     if not args.extract_only:
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        _aggregate_summaries(success_summaries_paths, args.output, args.rss_url)
+        _aggregate_summaries([(s[0], s[3]) for s in successes], args.output, args.rss_url)
 
     # ------------------------------------------------------------------
     # 4. Generate rss xml file (skip in extract_only mode)
@@ -567,16 +726,20 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
     if not args.extract_only:
         RSS_FILE_PATH = args.output_rss_path
         # Step 1: Read existing RSS file if it exists
-        existing_entries = []
+        existing_entries: set[str] = set()
+        existing_items: List[Tuple[str, str, str]] = []
         if not args.rebuild:
             if os.path.exists(RSS_FILE_PATH):
-                tree = ET.parse(RSS_FILE_PATH)
-                root = tree.getroot()
+                root = ET.parse(str(RSS_FILE_PATH)).getroot()
 
-                # Extract existing RSS entries (items)
-                for item in root.findall(".//item"):
-                    paper_url = item.find("link").text
-                    existing_entries.append(paper_url)
+                # Extract existing RSS entries (items) in a single pass
+                for item in root.iter("item"):
+                    title = item.findtext("title")
+                    link = item.findtext("link")
+                    desc = item.findtext("description")
+                    existing_entries.add(link)
+                    if title is not None and link is not None and desc is not None:
+                        existing_items.append((title, link, desc))
 
         # Step 2: Initialize a FeedGenerator for the new RSS feed
         fg = FeedGenerator()
@@ -598,33 +761,33 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
                     pdf_url = "https://arxiv.org/pdf/" + p.split(os.path.sep)[-1].replace('.md', ".pdf")
                     summary_path = Path(p.replace('markdown/', 'summary/'))
                     if summary_path.exists():
-                        successes.append((summary_path, pdf_url, paper_subject))
+                        successes.append((summary_path, pdf_url, paper_subject, None))
 
         # Step 3: Process and add new items to the RSS feed
         new_items = []
-        for path, paper_url, *rest in successes:
-            # Handle inconsistent data structure - some items might be missing paper_subject
-            paper_subject = rest[0] if rest else "Unknown Title"
+        for path, paper_url, paper_subject, summary_text in successes:
+            # Check if this paper has already been added by checking the URL
+            if paper_url in existing_entries:
+                _LOG.debug(f"Paper {paper_url} already exists in RSS feed, skipping")
+                continue
 
-            # Validate that the summary file exists before trying to read it
-            if not path.exists():
+            # Rebuilt entries carry no text; validate the file exists before reading it
+            if summary_text is None and not path.exists():
                 _LOG.warning(f"Summary file {path} does not exist, skipping RSS entry")
                 continue
 
             try:
-                paper_summary_markdown_content = path.read_text(encoding="utf-8")
-                paper_summary_html = markdown.markdown(paper_summary_markdown_content)
-
-                # Check if this paper has already been added by checking the URL
-                if paper_url not in existing_entries:
-                    # Add a new entry to the RSS feed
-                    entry = fg.add_entry()
-                    entry.title(f"{paper_subject}")
-                    entry.link(href=paper_url)
-                    entry.description(paper_summary_html)
-                    new_items.append(entry)
-                else:
-                    _LOG.debug(f"Paper {paper_url} already exists in RSS feed, skipping")
+                paper_summary_markdown_content = (
+                    summary_text if summary_text is not None else path.read_bytes().decode("utf-8")
+                )
+                paper_summary_html = _RSS_MD.reset().convert(paper_summary_markdown_content)
+
+                # Add a new entry to the RSS feed
+                entry = fg.add_entry()
+                entry.title(f"{paper_subject}")
+                entry.link(href=paper_url)
+                entry.description(paper_summary_html)
+                new_items.append(entry)
             except Exception as e:
                 _LOG.error(f"Failed to process {path} for RSS: {e}")
                 continue
@@ -632,20 +795,11 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
         # Step 4: Recreate existing entries from the preserved data
         if not args.rebuild and existing_entries:
             _LOG.info(f"Found {len(existing_entries)} existing RSS entries, recreating them...")
-            # Read the existing RSS file and recreate entries
-            tree = ET.parse(RSS_FILE_PATH)
-            root = tree.getroot()
-
-            for item in root.findall(".//item"):
-                title_elem = item.find("title")
-                link_elem = item.find("link")
-                desc_elem = item.find("description")
-
-                if title_elem is not None and link_elem is not None and desc_elem is not None:
-                    entry = fg.add_entry()
-                    entry.title(title_elem.text or "Unknown Title")
-                    entry.link(href=link_elem.text or "")
-                    entry.description(desc_elem.text or "")
+            for title, link, desc in existing_items:
+                entry = fg.add_entry()
+                entry.title(title or "Unknown Title")
+                entry.link(href=link or "")
+                entry.description(desc or "")
 
         # Step 5: Keep only the latest 30 items in the RSS feed
         current_entries = fg.entry()
@@ -670,12 +824,18 @@ def main(argv: List[str] | None = None) -> None:  # noqa: D401
             fg = fg_truncated
 
         # Step 6: Write the updated feed back to the RSS file
-        with open(RSS_FILE_PATH, 'w', encoding="utf-8") as rss_file:
-            rss_file.write(fg.rss_str(pretty=True).decode('utf-8'))
+        with open(RSS_FILE_PATH, 'wb') as rss_file:
+            rss_file.write(fg.rss_str(pretty=True))
 
         total_entries = len(fg.entry())
         _LOG.info(f"📢 RSS feed updated: {len(new_items)} new items added, {total_entries} total items in feed")
 
+    if conditional:
+        if len(successes) == len(links):
+            save_rss_meta(args.rss_url, rss_validators)
+        else:
+            _LOG.info("Some papers failed – the feed will be refetched on the next run.")
+
     _LOG.info("✨  All done!")
 
 
@@ -10,14 +10,22 @@ This revision:
 from __future__ import annotations
 
 import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import logging
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import hashlib
+import html
 import json
+import mmap
+import multiprocessing
 from pathlib import Path
+from threading import Lock, Thread, get_ident
 import time
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Awaitable, Iterable, List, Optional, Tuple
 import re
 
 import pymupdf4llm
@@ -26,7 +34,13 @@ try:
 except ImportError:
     fitz = None
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from langchain_core.prompts import PromptTemplate
 from langchain_deepseek import ChatDeepSeek
@@ -42,6 +56,12 @@ __version__ = "0.2.0"
 MODEL_NAME = "deepseek-chat"
 CHUNK_LENGTH = 5000
 CHUNK_OVERLAP_RATIO = 0.05
+# Concurrent chunk-summary requests per paper
+CHUNK_WORKERS = int(os.getenv("CHUNK_WORKERS", "4"))
+# Chunks summarized per LLM request; keeps one batched prompt around 15K chars
+CHUNK_BATCH_SIZE = int(os.getenv("CHUNK_BATCH_SIZE", str(max(1, 15000 // CHUNK_LENGTH))))
+# Attempts per chunk when the LLM returns an empty summary
+CHUNK_RETRIES = 3
 
 DEFAULT_PROXY_URL = "socks5://127.0.0.1:1081"
 
@@ -60,16 +80,55 @@ CHUNKS_SUMMARY_DIR = SUMMARY_DIR / "chunks"
 for d in (PDF_DIR, MD_DIR, SUMMARY_DIR, CHUNKS_SUMMARY_DIR):
     d.mkdir(exist_ok=True)
 
+# Known landing-page patterns rewritten to a PDF URL without any request
+_PDF_RULES: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"^https?://(?:www\.)?huggingface\.co/papers/([^/?#]+)"), r"https://arxiv.org/pdf/\1.pdf"),
+    (re.compile(r"^https?://tldr\.takara\.ai/p/([^/?#]+)"), r"https://arxiv.org/pdf/\1.pdf"),
+    (re.compile(r"^https?://(?:www\.)?arxiv\.org/(?:abs|pdf)/([^?#]+?)(?:\.pdf)?/?$"), r"https://arxiv.org/pdf/\1.pdf"),
+]
+
+# First quoted href ending in .pdf on a landing page
+_PDF_HREF_RE = re.compile(rb"""href\s*=\s*["']([^"']+?\.pdf)["']""", re.IGNORECASE)
+
+# Content-addressed cache of per-chunk LLM summaries
+CHUNK_CACHE_DIR = SUMMARY_DIR / "chunk_cache"
+
+# Persistent landing-page → PDF URL cache
+URL_CACHE_PATH = BASE_DIR / ".url_cache.json"
+URL_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+
+# Streaming block size for PDF downloads; the progress bar is refreshed at
+# most once per block.
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
 _LOG = logging.getLogger("paper_summarizer")
 
+# Prompt templates are read-only after construction, so parse them once and
+# share them across all worker threads.
+PROMPTS_DIR = BASE_DIR / "prompts"
+_CHUNK_PROMPT = PromptTemplate.from_file(PROMPTS_DIR / "chunk_summary.md", encoding="utf-8")
+_FINAL_PROMPT = PromptTemplate.from_file(PROMPTS_DIR / "summary.md", encoding="utf-8")
+_CHUNK_BATCH_PROMPT = PromptTemplate.from_file(PROMPTS_DIR / "chunk_summary_batch.md", encoding="utf-8")
+_TAGS_PROMPT = PromptTemplate.from_file(PROMPTS_DIR / "tags.md", encoding="utf-8")
+
 
 # ---------------------------------------------------------------------------
 # Proxy & session
 # ---------------------------------------------------------------------------
 
 
+# Connections kept per host; must cover the download pool so threads never
+# wait on connection checkout (requests defaults to 10).
+HTTP_POOL_SIZE = 64
+
+
 def build_session(proxy_url: Optional[str] = None) -> requests.Session:
     session = requests.Session()
+    # No adapter-level retries: download_pdf already retries whole downloads
+    # (including truncated bodies), and stacking both multiplies the attempts.
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     if proxy_url:
         _LOG.warning("Using proxy: %s", proxy_url)
         session.proxies.update({"http": proxy_url, "https": proxy_url})
@@ -127,37 +186,100 @@ def _verify_pdf_integrity(pdf_path: Path) -> bool:
         return False
 
 
+# ---------------------------------------------------------------------------
+# Resolved URL cache
+# ---------------------------------------------------------------------------
+
+_url_cache: Optional[dict] = None
+_url_cache_path: Optional[Path] = None
+_url_cache_lock = Lock()
+
+
+def _url_cache_key(url: str) -> str:
+    return hashlib.sha256(url.strip().rstrip("/").encode("utf-8")).hexdigest()
+
+
+def _load_url_cache() -> dict:
+    """Return the in-memory view of the URL cache, loading it on first use."""
+    global _url_cache, _url_cache_path  # pylint: disable=global-statement
+    if _url_cache is None or _url_cache_path != URL_CACHE_PATH:
+        try:
+            _url_cache = json.loads(URL_CACHE_PATH.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            _url_cache = {}
+        _url_cache_path = URL_CACHE_PATH
+    return _url_cache
+
+
+def _url_cache_get(url: str) -> Optional[str]:
+    with _url_cache_lock:
+        hit = _load_url_cache().get(_url_cache_key(url))
+    if hit and time.time() - hit.get("ts", 0) < URL_CACHE_TTL:
+        return hit.get("pdf")
+    return None
+
+
+def _url_cache_put(url: str, pdf_url: str) -> None:
+    with _url_cache_lock:
+        cache = _load_url_cache()
+        cache[_url_cache_key(url)] = {"pdf": pdf_url, "ts": time.time()}
+        tmp = URL_CACHE_PATH.with_name(URL_CACHE_PATH.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(cache), encoding="utf-8")
+            os.replace(tmp, URL_CACHE_PATH)
+        except OSError as e:
+            _LOG.debug("Could not persist URL cache: %s", e)
+
+
 # ---------------------------------------------------------------------------
 # Networking helpers
 # ---------------------------------------------------------------------------
 
 
-def resolve_pdf_url(url: str, session: requests.Session = SESSION) -> str:
-    """Return a direct PDF link for *url*."""
-    if "huggingface.co/papers" in url:
-        pdf = url.replace("huggingface.co/papers", "arxiv.org/pdf") + ".pdf"
-        return pdf
-    elif "tldr.takara.ai/p" in url:
-        pdf = url.replace("tldr.takara.ai/p", "arxiv.org/pdf") + ".pdf"
-        return pdf
-    elif url.endswith(".pdf"):
+def resolve_pdf_url(url: str, session: Optional[requests.Session] = None) -> str:
+    """Return a direct PDF link for *url*.
+
+    Landing pages that need an HTTP round-trip are remembered in
+    ``URL_CACHE_PATH`` for ``URL_CACHE_TTL`` seconds. *session* defaults to
+    the module-level ``SESSION``.
+    """
+    if url.endswith(".pdf"):
         return url
+    for pattern, template in _PDF_RULES:
+        m = pattern.match(url)
+        if m:
+            return m.expand(template)
+
+    cached = _url_cache_get(url)
+    if cached:
+        _LOG.debug("Resolved PDF URL cache hit: %s", url)
+        return cached
 
-    resp = session.get(url, timeout=30)
+    resp = (session or SESSION).get(url, timeout=30)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    match = _PDF_HREF_RE.search(resp.content)
+    if match:
+        href = html.unescape(match.group(1).decode("utf-8", "ignore"))
+        pdf = requests.compat.urljoin(url, href)
+        _url_cache_put(url, pdf)
+        return pdf
+
+    # Unquoted or otherwise unusual markup – fall back to a full parse
+    soup = BeautifulSoup(resp.text, _HTML_PARSER)
     for a in soup.find_all("a", href=True):
         if a["href"].lower().endswith(".pdf"):
             pdf = requests.compat.urljoin(url, a["href"])
+            _url_cache_put(url, pdf)
             return pdf
 
     raise ValueError("No PDF link found on page.")
 
 
 def download_pdf(
-    pdf_url: str, output_dir: Path = PDF_DIR, session: requests.Session = SESSION, max_retries: int = 3, skip_download: bool = False
+    pdf_url: str, output_dir: Path = PDF_DIR, session: Optional[requests.Session] = None, max_retries: int = 3, skip_download: bool = False
 ) -> Path:
     """Download the PDF or skip if already present. Ensures complete downloads only."""
+    session = session or SESSION
     output_dir.mkdir(parents=True, exist_ok=True)
     filename = pdf_url.rstrip("/").split("/")[-1]
     if not filename.lower().endswith(".pdf"):
@@ -209,10 +331,11 @@ def _download_pdf_single_attempt(
 
         total = int(resp.headers.get("content-length", 0))
         downloaded_size = 0
+        pending = 0  # bytes not yet reported to the progress bar
         last_progress_time = time.time()
         
         with (
-            open(temp_path, "wb") as f,
+            open(temp_path, "wb", buffering=0) as f,
             tqdm(
                 desc=f"Downloading {filename}",
                 total=total,
@@ -221,18 +344,23 @@ def _download_pdf_single_attempt(
                 unit_divisor=1024,
             ) as bar,
         ):
-            for chunk in resp.iter_content(2048):
+            for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
                 if chunk:  # Filter out keep-alive chunks
                     f.write(chunk)
                     downloaded_size += len(chunk)
-                    bar.update(len(chunk))
-                    
+                    pending += len(chunk)
+                    if pending >= DOWNLOAD_CHUNK_SIZE:
+                        bar.update(pending)
+                        pending = 0
+
                     # Check for progress timeout (stalled download)
                     current_time = time.time()
                     if current_time - last_progress_time > 30:  # 30 seconds without progress
                         raise TimeoutError("Download stalled - no progress for 30 seconds")
                     last_progress_time = current_time
-        
+            if pending:
+                bar.update(pending)
+
         # Verify download completeness
         if total > 0 and downloaded_size != total:
             raise ValueError(f"Download incomplete: expected {total} bytes, got {downloaded_size} bytes")
@@ -263,6 +391,73 @@ def _download_pdf_single_attempt(
 # PDF → Markdown
 # ---------------------------------------------------------------------------
 
+# PyMuPDF is not thread-safe, so long papers are split into contiguous page
+# ranges and each range is converted in a separate process.
+EXTRACT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+_MIN_PAGES_PER_RANGE = 8
+# MuPDF leaks memory across documents; recycle workers after this many ranges
+EXTRACT_TASKS_PER_CHILD = int(os.getenv("EXTRACT_TASKS_PER_CHILD", "5"))
+
+_extract_pool: Optional[ProcessPoolExecutor] = None
+_extract_pool_lock = Lock()
+
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    global _extract_pool  # pylint: disable=global-statement
+    with _extract_pool_lock:
+        if _extract_pool is None:
+            # spawn: forking a process that already runs threads is unsafe
+            _extract_pool = ProcessPoolExecutor(
+                max_workers=EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=EXTRACT_TASKS_PER_CHILD,
+            )
+    return _extract_pool
+
+
+def _markdown_for_pages(pdf_path: str, pages: Optional[List[int]]) -> str:
+    # Header levels are still derived from the whole document, so the ranges
+    # concatenate to the same output as a single call.
+    return pymupdf4llm.to_markdown(pdf_path, pages=pages)
+
+
+def _to_markdown_parallel(pdf_path: Path) -> str:
+    """Convert *pdf_path* with ``pymupdf4llm`` in the worker pool.
+
+    Long documents fan out by page range; short ones run as a single task so
+    every conversion lands in a recycled worker rather than this process.
+    """
+    global _extract_pool  # pylint: disable=global-statement
+    if EXTRACT_WORKERS <= 1:
+        return pymupdf4llm.to_markdown(str(pdf_path))
+
+    page_count = 0
+    if fitz:
+        try:
+            with fitz.open(str(pdf_path)) as doc:
+                page_count = doc.page_count
+        except Exception:  # let the worker report the real error
+            page_count = 0
+
+    n_ranges = min(EXTRACT_WORKERS, page_count // _MIN_PAGES_PER_RANGE)
+    if n_ranges <= 1:
+        ranges: List[Optional[List[int]]] = [None]
+    else:
+        step = -(-page_count // n_ranges)
+        ranges = [list(range(start, min(start + step, page_count))) for start in range(0, page_count, step)]
+
+    pool = _get_extract_pool()
+    try:
+        return "".join(pool.map(_markdown_for_pages, [str(pdf_path)] * len(ranges), ranges))
+    except BrokenProcessPool:
+        _LOG.warning("Extraction pool died – retrying %s as a single task", pdf_path)
+        with _extract_pool_lock:
+            if _extract_pool is pool:
+                _extract_pool = None
+    # One retry on a fresh pool; if the document kills that too, the error
+    # propagates and extract_markdown falls back to plain-text extraction.
+    return _get_extract_pool().submit(_markdown_for_pages, str(pdf_path), None).result()
+
 
 def extract_markdown(pdf_path: Path, md_dir: Path = MD_DIR, max_retries: int = 3) -> Path:
     """Extract markdown text, caching if already done."""
@@ -286,7 +481,7 @@ def extract_markdown(pdf_path: Path, md_dir: Path = MD_DIR, max_retries: int = 3
 
         # Method 1: Primary - pymupdf4llm
         try:
-            md_text = pymupdf4llm.to_markdown(str(pdf_path))
+            md_text = _to_markdown_parallel(pdf_path)
             if md_text and md_text.strip():
                 break  # Success!
         except Exception as e:
@@ -344,6 +539,18 @@ def extract_markdown(pdf_path: Path, md_dir: Path = MD_DIR, max_retries: int = 3
     return md_path
 
 
+def read_markdown(md_path: Path) -> str:
+    """Decode a cached markdown file straight from a memory map.
+
+    Avoids the intermediate bytes buffer of ``read_text`` for large papers.
+    """
+    with open(md_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Text chunking
 # ---------------------------------------------------------------------------
@@ -358,16 +565,15 @@ def chunk_text(
     if overlap >= max_chars:
         raise ValueError("overlap must be less than chunk size")
 
-    chunks: List[str] = []
-    start = 0
-    while start < len(text):
-        end = min(len(text), start + max_chars)
-        chunks.append(text[start:end])
-        start = end - overlap
-
-        if end == len(text):
-            break
-    return chunks
+    if not text:
+        return []
+    if len(text) <= max_chars:
+        return [text]
+    # Chunk i starts at i * step; the last one is the first that reaches the end.
+    n = len(text)
+    step = max_chars - overlap
+    starts = range(0, max(n - max_chars, 0) + step, step)
+    return [text[s:s + max_chars] for s in starts]
 
 
 # ---------------------------------------------------------------------------
@@ -375,48 +581,78 @@ def chunk_text(
 # ---------------------------------------------------------------------------
 
 
-def llm_invoke(
-    messages: List[BaseMessage], 
-    api_key: Optional[str] = None, 
+# Clients are cached per configuration so their HTTP connection pools (and
+# TLS sessions) are reused across calls and threads.
+
+
+@functools.lru_cache(maxsize=8)
+def _get_deepseek_llm(api_key: str, base_url: Optional[str] = None, model: str = MODEL_NAME) -> ChatDeepSeek:
+    """Return a shared DeepSeek client so HTTP connections are kept alive."""
+    return ChatDeepSeek(
+        model=model,
+        max_tokens=None,
+        timeout=None,
+        max_retries=2,
+        api_key=api_key,
+        api_base=base_url,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_openai_llm(api_key: str, base_url: str, model: str) -> ChatOpenAI:
+    """Return a shared OpenAI-compatible client."""
+    return ChatOpenAI(
+        model=model,
+        api_key=api_key,
+        base_url=base_url,
+        max_tokens=None,
+        timeout=120,
+        max_retries=2,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_ollama_llm(base_url: str, model: str) -> OllamaLLM:
+    """Return a shared Ollama client."""
+    return OllamaLLM(
+        model=model,
+        base_url=base_url,
+        timeout=120,  # Ollama can be slower
+    )
+
+
+def _resolve_endpoint(
+    provider: str, base_url: Optional[str] = None, model: Optional[str] = None
+) -> Tuple[Optional[str], str]:
+    """Return the ``(base_url, model)`` *provider* will actually use.
+
+    Fills the same env/default values as ``_resolve_llm``; DeepSeek keeps
+    ``base_url=None`` to mean the client's built-in endpoint.
+    """
+    if provider.lower() == "ollama":
+        base_url = base_url or os.getenv("OLLAMA_BASE_URL", DEFAULT_OLLAMA_BASE_URL)
+        model = model or os.getenv("OLLAMA_MODEL", DEFAULT_OLLAMA_MODEL)
+    elif provider.lower() == "openai":
+        base_url = base_url or os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+        model = model or os.getenv("OPENAI_MODEL", DEFAULT_OPENAI_MODEL)
+    else:
+        model = model or MODEL_NAME
+    return base_url, model
+
+
+def _resolve_llm(
+    provider: str,
+    api_key: Optional[str] = None,
     base_url: Optional[str] = None,
-    provider: str = DEFAULT_LLM_PROVIDER,
-    model: str = None,
-    **kwargs
-) -> AIMessage:
-    """Invoke LLM with support for DeepSeek, Ollama, and OpenAI-compatible providers."""
-    
+    model: Optional[str] = None,
+):
+    """Build (or fetch the shared) client for *provider*, filling env defaults."""
+    base_url, model = _resolve_endpoint(provider, base_url, model)
     if provider.lower() == "ollama":
         # Use Ollama
-        if not base_url:
-            base_url = os.getenv("OLLAMA_BASE_URL", DEFAULT_OLLAMA_BASE_URL)
-        if not model:
-            model = os.getenv("OLLAMA_MODEL", DEFAULT_OLLAMA_MODEL)
-            
         _LOG.debug("Using Ollama provider: %s at %s", model, base_url)
         
-        llm = OllamaLLM(
-            model=model,
-            base_url=base_url,
-            timeout=120,  # Ollama can be slower
-        )
-        
-        # Convert messages to text for Ollama (simpler interface)
-        if len(messages) == 1:
-            prompt = messages[0].content
-        else:
-            # Handle conversation format
-            prompt = "\n\n".join([f"{'User' if isinstance(m, HumanMessage) else 'Assistant'}: {m.content}" for m in messages])
-        
-        response = llm.invoke(prompt)
-        
-        # Clean up Ollama response to extract only the actual output
-        # Ollama may include <think> tags mixed with output, unlike DeepSeek Chat
-        cleaned_content = response
-        if isinstance(cleaned_content, str):
-            # Remove <think>...</think> blocks
-            cleaned_content = re.sub(r'<think>.*?</think>', '', cleaned_content, flags=re.DOTALL)
-        
-        return AIMessage(content=cleaned_content)
+        return _get_ollama_llm(base_url, model)
         
     elif provider.lower() == "openai":
         # Use OpenAI-compatible API (including DeepSeek, Anthropic, etc.)
@@ -425,22 +661,9 @@ def llm_invoke(
         if not api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable or pass --api-key")
             
-        if not base_url:
-            base_url = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
-        if not model:
-            model = os.getenv("OPENAI_MODEL", DEFAULT_OPENAI_MODEL)
-            
         _LOG.debug("Using OpenAI-compatible provider: %s at %s", model, base_url)
         
-        llm = ChatOpenAI(
-            model=model,
-            api_key=api_key,
-            base_url=base_url,
-            max_tokens=None,
-            timeout=120,
-            max_retries=2,
-        )
-        return llm.invoke(messages)
+        return _get_openai_llm(api_key, base_url, model)
         
     else:
         # Use DeepSeek (default)
@@ -449,17 +672,166 @@ def llm_invoke(
         if not api_key:
             raise ValueError("DeepSeek API key required. Set DEEPSEEK_API_KEY environment variable or pass --api-key")
             
-        _LOG.debug("Using DeepSeek provider: %s", MODEL_NAME)
+        _LOG.debug("Using DeepSeek provider: %s", model)
         
-        llm = ChatDeepSeek(
-            model=MODEL_NAME,
-            max_tokens=None,
-            timeout=None,
-            max_retries=2,
-            api_key=api_key,
-            api_base=base_url,
-        )
-        return llm.invoke(messages)
+        return _get_deepseek_llm(api_key, base_url, model)
+
+
+def _ollama_prompt(messages: List[BaseMessage]) -> str:
+    """Convert messages to text for Ollama (simpler interface)."""
+    if len(messages) == 1:
+        return messages[0].content
+    # Handle conversation format
+    return "\n\n".join([f"{'User' if isinstance(m, HumanMessage) else 'Assistant'}: {m.content}" for m in messages])
+
+
+def _ollama_message(response) -> AIMessage:
+    """Clean up Ollama response to extract only the actual output.
+
+    Ollama may include <think> tags mixed with output, unlike DeepSeek Chat.
+    """
+    cleaned_content = response
+    if isinstance(cleaned_content, str):
+        # Remove <think>...</think> blocks
+        cleaned_content = re.sub(r'<think>.*?</think>', '', cleaned_content, flags=re.DOTALL)
+    return AIMessage(content=cleaned_content)
+
+
+def llm_invoke(
+    messages: List[BaseMessage], 
+    api_key: Optional[str] = None, 
+    base_url: Optional[str] = None,
+    provider: str = DEFAULT_LLM_PROVIDER,
+    model: str = None,
+    **kwargs
+) -> AIMessage:
+    """Invoke LLM with support for DeepSeek, Ollama, and OpenAI-compatible providers."""
+    llm = _resolve_llm(provider, api_key=api_key, base_url=base_url, model=model)
+    if provider.lower() == "ollama":
+        return _ollama_message(llm.invoke(_ollama_prompt(messages)))
+    return llm.invoke(messages)
+
+
+async def allm_invoke(
+    messages: List[BaseMessage],
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    provider: str = DEFAULT_LLM_PROVIDER,
+    model: str = None,
+    **kwargs
+) -> AIMessage:
+    """Async counterpart of :func:`llm_invoke` built on the clients' ``ainvoke``."""
+    llm = _resolve_llm(provider, api_key=api_key, base_url=base_url, model=model)
+    if provider.lower() == "ollama":
+        return _ollama_message(await llm.ainvoke(_ollama_prompt(messages)))
+    return await llm.ainvoke(messages)
+
+
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_loop_lock = Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _async_loop  # pylint: disable=global-statement
+    with _async_loop_lock:
+        if _async_loop is None:
+            loop = asyncio.new_event_loop()
+            Thread(target=loop.run_forever, name="llm-async", daemon=True).start()
+            _async_loop = loop
+    return _async_loop
+
+
+def _run_async(coro):
+    """Run *coro* on the shared background event loop and wait for the result.
+
+    Cached LLM clients keep their connections bound to the loop that opened
+    them, so all async work goes through one long-lived loop. This also works
+    when the caller is itself inside a running loop (e.g. Jupyter).
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+
+async def _run_tasks(coros: Iterable[Awaitable[Any]], desc: Optional[str] = None) -> None:
+    """Await *coros* concurrently; the first failure cancels the rest.
+
+    The background loop outlives any one paper, so siblings left running
+    after an error would keep calling the LLM for a summary that is lost.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        done = asyncio.as_completed(tasks)
+        if desc:
+            done = tqdm(done, total=len(tasks), desc=desc)
+        for future in done:
+            await future
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _chunk_cache_key(
+    chunk: str,
+    prompt_text: str,
+    provider: str,
+    model: Optional[str],
+    base_url: Optional[str] = None,
+) -> str:
+    """Key a chunk summary by endpoint, resolved model, prompt template and chunk content."""
+    base_url, model = _resolve_endpoint(provider, base_url, model)
+    h = hashlib.sha256()
+    for part in (provider.lower(), base_url or "", model, prompt_text, chunk):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _chunk_cache_get(key: str) -> Optional[str]:
+    try:
+        return (CHUNK_CACHE_DIR / f"{key}.txt").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write *text* to *path* via a temp file and ``os.replace``.
+
+    Readers never see partial output, and the rename bumps the directory
+    mtime that the web UI keys its entries cache on.
+    """
+    # pid + thread id: papers summarized in parallel may share a path
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _chunk_cache_put(key: str, content: str) -> None:
+    if not content or not content.strip():
+        return
+    CHUNK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _write_atomic(CHUNK_CACHE_DIR / f"{key}.txt", content)
+
+
+def _format_batch_sections(chunks: List[str]) -> str:
+    return "\n".join(f"<<<SEC {n}>>>\n{chunk}\n<<<END>>>" for n, chunk in enumerate(chunks, 1))
+
+
+def _parse_batch_summaries(content: str, expected: int) -> Optional[List[str]]:
+    """Pull the ``summaries`` array out of a batched reply; None if it is unusable."""
+    start, end = content.find("{"), content.rfind("}")
+    if start < 0 or end <= start:
+        return None
+    try:
+        summaries = json.loads(content[start:end + 1]).get("summaries")
+    except (ValueError, AttributeError):
+        return None
+    if (
+        not isinstance(summaries, list)
+        or len(summaries) != expected
+        or not all(isinstance(x, str) and x.strip() for x in summaries)
+    ):
+        return None
+    return summaries
 
 
 def progressive_summary(
@@ -470,7 +842,8 @@ def progressive_summary(
     base_url: Optional[str] = None,
     provider: str = DEFAULT_LLM_PROVIDER,
     model: str = None,
-    max_workers: int = 4,
+    max_workers: int = CHUNK_WORKERS,
+    batch_size: int = CHUNK_BATCH_SIZE,
 ) -> Tuple[str, str]:
     if summary_path.exists():
         _LOG.info(f"Summary cache hit for {summary_path}.")
@@ -479,26 +852,73 @@ def progressive_summary(
     chunks = list(chunks)
 
     summaries: List[str] = [None] * len(chunks)
-
-    def _summarize_one(idx: int, chunk: str):
-        msg = HumanMessage(
-            PromptTemplate.from_file(
-                os.path.join("prompts", "chunk_summary.md"), encoding="utf-8"
-            ).format(chunk_content=chunk)
+    # results are keyed by the template that produced them: a chunk may be
+    # summarized alone (_CHUNK_PROMPT) or inside a batch (_CHUNK_BATCH_PROMPT)
+    keys = [_chunk_cache_key(chunk, _CHUNK_PROMPT.template, provider, model, base_url) for chunk in chunks]
+    batch_keys = [_chunk_cache_key(chunk, _CHUNK_BATCH_PROMPT.template, provider, model, base_url) for chunk in chunks]
+    # repeated chunks are summarized once and copied afterwards
+    first_idx: dict = {}
+    for idx, key in enumerate(keys):
+        first_idx.setdefault(key, idx)
+    unique = sorted(first_idx.values())
+
+    async def _summarize_one(idx: int, limit: asyncio.Semaphore) -> None:
+        msg = HumanMessage(_CHUNK_PROMPT.format(chunk_content=chunks[idx]))
+        for attempt in range(CHUNK_RETRIES):
+            if attempt:
+                await asyncio.sleep(2 ** (attempt - 1))
+            async with limit:
+                resp = await allm_invoke([msg], api_key=api_key, base_url=base_url, provider=provider, model=model)
+            if resp.content and resp.content.strip():
+                break
+            _LOG.warning("Empty summary for chunk %d (attempt %d/%d)", idx, attempt + 1, CHUNK_RETRIES)
+        else:
+            raise RuntimeError(f"LLM returned an empty summary for chunk {idx} after {CHUNK_RETRIES} attempts")
+        summaries[idx] = resp.content
+        _chunk_cache_put(keys[idx], resp.content)
+
+    async def _summarize_batch(indices: List[int], limit: asyncio.Semaphore) -> None:
+        # identical chunks (reruns, overlapping papers) reuse the stored result
+        pending = []
+        for idx in indices:
+            cached = _chunk_cache_get(keys[idx])
+            if cached is None:
+                cached = _chunk_cache_get(batch_keys[idx])
+            if cached is not None:
+                summaries[idx] = cached
+            else:
+                pending.append(idx)
+        if len(pending) == 1:
+            await _summarize_one(pending[0], limit)
+        elif pending:
+            msg = HumanMessage(_CHUNK_BATCH_PROMPT.format(
+                section_count=len(pending),
+                sections=_format_batch_sections([chunks[i] for i in pending]),
+            ))
+            async with limit:
+                resp = await allm_invoke([msg], api_key=api_key, base_url=base_url, provider=provider, model=model)
+            parsed = _parse_batch_summaries(resp.content, len(pending))
+            if parsed is None:
+                _LOG.warning("Unusable batched reply for %d chunks – summarizing them one by one", len(pending))
+                await _run_tasks(_summarize_one(i, limit) for i in pending)
+                return
+            for idx, content in zip(pending, parsed):
+                summaries[idx] = content
+                _chunk_cache_put(batch_keys[idx], content)
+
+    async def _summarize_all():
+        # every batch request is in flight at once, capped at max_workers
+        limit = asyncio.Semaphore(max(1, max_workers))
+        step = max(1, batch_size)
+        await _run_tasks(
+            (_summarize_batch(unique[i:i + step], limit) for i in range(0, len(unique), step)),
+            desc="Summarizing",
         )
-        resp = llm_invoke([msg], api_key=api_key, base_url=base_url, provider=provider, model=model)
-        return idx, resp.content
 
     if not chunk_summary_path.exists():
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(_summarize_one, i, c): i for i, c in enumerate(chunks)
-            }
-            for future in tqdm(
-                as_completed(futures), total=len(futures), desc="Summarizing"
-            ):
-                i, summary = future.result()
-                summaries[i] = summary
+        _run_async(_summarize_all())
+        for idx, key in enumerate(keys):
+            summaries[idx] = summaries[first_idx[key]]
         joined = "\n\n".join(summaries)
     else:
         joined = open(chunk_summary_path, "r").read()
@@ -506,11 +926,7 @@ def progressive_summary(
     # Final pass
     final = llm_invoke(
         [
-            AIMessage(
-                PromptTemplate.from_file(
-                    os.path.join("prompts", "summary.md"), encoding="utf-8"
-                ).format()
-            ),
+            AIMessage(_FINAL_PROMPT.format()),
             HumanMessage(joined),
         ],
         api_key=api_key,
@@ -526,6 +942,27 @@ def progressive_summary(
 # Tag generation from summary
 # ---------------------------------------------------------------------------
 
+_FENCED_RE = re.compile(r"```(?:json|\w+)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
+_JSON_OBJ_RE = re.compile(r"\{[\s\S]*\}")
+_ALLOWED_TOP = frozenset(
+    {"llm", "nlp", "cv", "ml", "rl", "agents", "systems", "theory", "robotics", "audio", "multimodal"}
+)
+
+
+def _clean_tag_list(values) -> List[str]:
+    """Stringify and strip *values*, dropping empties."""
+    return [t for t in (str(v).strip() for v in values) if t]
+
+
+def _tags_from_json(data) -> Tuple[List[str], List[str]]:
+    """Return ``(tags, top)`` from a parsed tags reply (object, or bare array of tags)."""
+    if isinstance(data, dict):
+        return _clean_tag_list(data.get("tags", [])), _clean_tag_list(data.get("top", []))
+    if isinstance(data, list):
+        # backward compatibility: array treated as detailed tags only
+        return _clean_tag_list(data), []
+    return [], []
+
 
 def generate_tags_from_summary(
     summary_text: str,
@@ -539,9 +976,7 @@ def generate_tags_from_summary(
 
     Reads prompt from prompts/tags.md. Returns a dict: {"top": [..], "tags": [..]}.
     """
-    tmpl = PromptTemplate.from_file(
-        os.path.join("prompts", "tags.md"), encoding="utf-8"
-    ).format(summary_content=summary_text)
+    tmpl = _TAGS_PROMPT.format(summary_content=summary_text)
 
     resp = llm_invoke([HumanMessage(content=tmpl)], api_key=api_key, base_url=base_url, provider=provider, model=model)
     raw = (resp.content or "").strip()
@@ -551,36 +986,19 @@ def generate_tags_from_summary(
         raw = re.sub(r'<think>.*?</think>', '', raw, flags=re.DOTALL)
 
     # Strip fenced code blocks if present, e.g., ```json ... ``` or ``` ... ```
-    fenced_match = re.search(r"```(?:json|\w+)?\s*([\s\S]*?)\s*```", raw, re.IGNORECASE)
+    fenced_match = _FENCED_RE.search(raw)
     if fenced_match:
         raw = fenced_match.group(1).strip()
 
     # Try strict JSON parse first
     try:
-        data = json.loads(raw)
-        if isinstance(data, dict):
-            tags = [str(t).strip() for t in data.get("tags", []) if str(t).strip()]
-            top = [str(t).strip() for t in data.get("top", []) if str(t).strip()]
-        elif isinstance(data, list):
-            # backward compatibility: array treated as detailed tags only
-            tags = [str(t).strip() for t in data if str(t).strip()]
-            top = []
-        else:
-            tags, top = [], []
+        tags, top = _tags_from_json(json.loads(raw))
     except Exception:
         # Try to locate a JSON object or array within the text
-        obj = re.search(r"\{[\s\S]*\}", raw)
+        obj = _JSON_OBJ_RE.search(raw)
         if obj:
             try:
-                data = json.loads(obj.group(0))
-                if isinstance(data, dict):
-                    tags = [str(t).strip() for t in data.get("tags", []) if str(t).strip()]
-                    top = [str(t).strip() for t in data.get("top", []) if str(t).strip()]
-                elif isinstance(data, list):
-                    tags = [str(t).strip() for t in data if str(t).strip()]
-                    top = []
-                else:
-                    tags, top = [], []
+                tags, top = _tags_from_json(json.loads(obj.group(0)))
             except Exception:
                 tags, top = [], []
         else:
@@ -618,12 +1036,11 @@ def generate_tags_from_summary(
         normalized.extend(extras)
 
     # normalize top-level too and ensure subset of allowed set
-    allowed_top = {"llm","nlp","cv","ml","rl","agents","systems","theory","robotics","audio","multimodal"}
     top_norm: List[str] = []
     seen_top = set()
     for t in top:
-        k = " ".join(str(t).split()).lower()
-        if k in allowed_top and k not in seen_top:
+        k = " ".join(t.split()).lower()
+        if k in _ALLOWED_TOP and k not in seen_top:
             seen_top.add(k)
             top_norm.append(k)
 
@@ -635,15 +1052,68 @@ def generate_tags_from_summary(
 # ---------------------------------------------------------------------------
 
 
+def process_one(
+    url: str,
+    session: Optional[requests.Session] = None,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    provider: str = DEFAULT_LLM_PROVIDER,
+    model: Optional[str] = None,
+    max_workers: int = CHUNK_WORKERS,
+) -> Path:
+    """Run the whole pipeline for *url* and return the summary path."""
+    _LOG.info("Resolving PDF URL for %s", url)
+    pdf_url = resolve_pdf_url(url, session=session)
+    _LOG.info("PDF URL: %s", pdf_url)
+
+    pdf_path = download_pdf(pdf_url, session=session)
+    _LOG.info("PDF cached at %s", pdf_path)
+
+    md_path = extract_markdown(pdf_path)
+    _LOG.info("Markdown at %s", md_path)
+
+    text = read_markdown(md_path)
+    chunks = chunk_text(text)
+    _LOG.info("Split into %d chunks", len(chunks))
+
+    summary_path = SUMMARY_DIR / (pdf_path.stem + ".md")
+    chunk_summary_path = CHUNKS_SUMMARY_DIR / (pdf_path.stem + ".md")
+    summary, chunk_summaries = progressive_summary(
+        chunks,
+        summary_path=summary_path,
+        chunk_summary_path=chunk_summary_path,
+        api_key=api_key,
+        base_url=base_url,
+        provider=provider,
+        model=model,
+        max_workers=max_workers,
+    )
+    _write_atomic(chunk_summary_path, chunk_summaries)
+    _write_atomic(summary_path, summary)
+    return summary_path
+
+
+def _read_urls(urls_file: str) -> List[str]:
+    """Read one URL per line from *urls_file* (``-`` for stdin), skipping blanks and ``#`` comments."""
+    if urls_file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(urls_file).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
-        description="Summarize an academic paper via LLM (DeepSeek or Ollama)"
+        description="Summarize academic papers via LLM (DeepSeek, Ollama or OpenAI-compatible)"
     )
-    parser.add_argument("url", help="Paper URL (PDF or landing page)")
+    parser.add_argument("url", nargs="?", help="Paper URL (PDF or landing page)")
+    parser.add_argument("--urls-file", help="File with one paper URL per line ('-' reads stdin)")
+    parser.add_argument("--workers", type=int, default=4, help="Papers processed concurrently (default: 4)")
     parser.add_argument("--api-key", help="DeepSeek/OpenAI API key")
     parser.add_argument("--base-url", help="Base URL for OpenAI-compatible LLM API (e.g., https://api.openai.com/v1)")
-    parser.add_argument("--provider", choices=["deepseek", "ollama"], default=DEFAULT_LLM_PROVIDER,
+    parser.add_argument("--provider", choices=["deepseek", "ollama", "openai"], default=DEFAULT_LLM_PROVIDER,
                        help=f"LLM provider to use (default: {DEFAULT_LLM_PROVIDER})")
+    parser.add_argument("--model", help="Model name for the selected provider")
     parser.add_argument("--ollama-base-url", default=DEFAULT_OLLAMA_BASE_URL,
                        help=f"Ollama service base URL (default: {DEFAULT_OLLAMA_BASE_URL})")
     parser.add_argument("--ollama-model", default=DEFAULT_OLLAMA_MODEL,
@@ -652,41 +1122,52 @@ def main() -> None:
     parser.add_argument("--debug", action="store_true", help="Verbose logging")
     args = parser.parse_args()
 
-    if args.proxy:
-        global SESSION  # pylint: disable=global-statement
-        SESSION = build_session(args.proxy)
-
     logging.basicConfig(
         level=logging.DEBUG if args.debug else logging.INFO,
         format="%(levelname)s: %(message)s",
     )
 
-    try:
-        _LOG.info("Resolving PDF URL for %s", args.url)
-        pdf_url = resolve_pdf_url(args.url)
-        _LOG.info("PDF URL: %s", pdf_url)
-
-        pdf_path = download_pdf(pdf_url)
-        _LOG.info("PDF cached at %s", pdf_path)
-
-        md_path = extract_markdown(pdf_path)
-        _LOG.info("Markdown at %s", md_path)
-
-        text = md_path.read_text(encoding="utf-8")
-        chunks = chunk_text(text)
-        _LOG.info("Split into %d chunks", len(chunks))
-
-        summary_path = SUMMARY_DIR / (pdf_path.stem + ".md")
-        summary = progressive_summary(
-            chunks, summary_path=summary_path, api_key=args.api_key,
-            base_url=args.base_url, provider=args.provider, ollama_base_url=args.ollama_base_url, 
-            ollama_model=args.ollama_model
-        )
-        summary_path.write_text(summary.content, encoding="utf-8")
-        print("\n" + "=" * 80 + "\nFINAL SUMMARY saved to:\n" + str(summary_path))
-
-    except Exception as e:
-        _LOG.error("Error: %s", e)
+    urls = [args.url] if args.url else []
+    if args.urls_file:
+        urls += _read_urls(args.urls_file)
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        parser.error("provide a URL or --urls-file")
+
+    # One session shared by all workers; requests.Session is safe for
+    # concurrent independent requests and pools connections per host.
+    session = build_session(args.proxy) if args.proxy else SESSION
+
+    base_url, model = args.base_url, args.model
+    if args.provider == "ollama":
+        base_url = base_url or args.ollama_base_url
+        model = model or args.ollama_model
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {
+            pool.submit(
+                process_one,
+                url,
+                session=session,
+                api_key=args.api_key,
+                base_url=base_url,
+                provider=args.provider,
+                model=model,
+            ): url
+            for url in urls
+        }
+        for fut in as_completed(futures):
+            url = futures[fut]
+            try:
+                summary_path = fut.result()
+            except Exception as e:  # pylint: disable=broad-except
+                failed += 1
+                _LOG.error("Error for %s: %s", url, e)
+                continue
+            print("\n" + "=" * 80 + f"\nFINAL SUMMARY for {url} saved to:\n" + str(summary_path))
+
+    if failed:
         sys.exit(1)
 
 
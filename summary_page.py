@@ -1,16 +1,25 @@
 import os
 import json
+import functools
+import glob
+import gzip
+import hashlib
+import sqlite3
 import subprocess
 import re
 import string
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, date, timezone, timedelta
 
 from flask import (
     Flask,
-    render_template_string,
+    render_template,
     abort,
-    send_from_directory,
+    send_file,
     request,
     make_response,
     jsonify,
@@ -22,6 +31,16 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 import markdown
 import math
 
+try:  # optional faster JSON for user data and tag files
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional faster renderer; python-markdown remains the fallback
+    from markdown_it import MarkdownIt
+except ImportError:
+    MarkdownIt = None
+
 app = Flask(__name__)
 app.wsgi_app = ProxyFix(
         app.wsgi_app,
@@ -51,89 +70,313 @@ def is_admin_user(uid: str) -> bool:
 # Helpers
 # -----------------------------------------------------------------------------
 
+def _json_loads(data: bytes | str):
+    """Parse JSON bytes/str; raises ``json.JSONDecodeError`` on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = True) -> bytes:
+    """Serialize *obj* as UTF-8 JSON bytes (single line when ``indent=False``)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* so readers never see a partial file.
+
+    The temp name is unique per process and thread, so concurrent writers
+    race only on the final rename (last one wins).
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb", buffering=0) as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+_MD_EXTENSIONS = ["fenced_code", "tables", "codehilite", "toc", "attr_list"]
+# Markdown instances are not thread-safe; keep one per worker thread.
+_MD_LOCAL = threading.local()
+
+
+def _highlight_code(code: str, lang: str, _attrs: str) -> str:
+    """Pygments highlighting for markdown-it fences (``""`` = escape as-is)."""
+    if not lang:
+        return ""
+    try:
+        from pygments import highlight
+        from pygments.formatters import HtmlFormatter
+        from pygments.lexers import get_lexer_by_name
+        return highlight(code, get_lexer_by_name(lang), HtmlFormatter(nowrap=True))
+    except Exception:
+        return ""
+
+
+def _build_markdown_it():
+    # html=True matches python-markdown, which passes inline HTML through
+    md = MarkdownIt("commonmark", {"html": True, "highlight": _highlight_code}).enable(["table", "strikethrough"])
+    try:
+        from mdit_py_plugins.anchors import anchors_plugin
+        from mdit_py_plugins.attrs import attrs_plugin
+        md.use(anchors_plugin, max_level=6).use(attrs_plugin)
+    except ImportError:
+        pass
+    return md
+
+
+# MarkdownIt keeps no per-document state, so one instance serves all threads.
+_MD_IT = _build_markdown_it() if MarkdownIt is not None else None
+
+# Bump when rendering changes in a way the config below does not capture
+# (e.g. highlighting), so persisted HTML is regenerated.
+_RENDER_SCHEMA = 1
+
+
+def _render_version() -> str:
+    """Short hash of the active renderer's configuration.
+
+    Enabling a rule or extension changes the HTML for unchanged Markdown, so
+    the on-disk cache must not outlive the config that produced it.
+    """
+    if _MD_IT is not None:
+        rules = {chain: sorted(names) for chain, names in _MD_IT.get_active_rules().items()}
+        config = ["mdit", {k: v for k, v in _MD_IT.options.items() if k != "highlight"}, rules]
+    else:
+        config = ["pymd", _MD_EXTENSIONS]
+    blob = json.dumps([_RENDER_SCHEMA, *config], sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:8]
+
+
+_RENDER_VERSION = _render_version()
+
+
+def _convert_markdown(md_text: str) -> str:
+    if _MD_IT is not None:
+        return _MD_IT.render(md_text)
+    md = getattr(_MD_LOCAL, "md", None)
+    if md is None:
+        md = _MD_LOCAL.md = markdown.Markdown(extensions=_MD_EXTENSIONS)
+    return md.reset().convert(md_text)
+
+
+# Rendered HTML keyed by a digest of the Markdown text, so a summary that is
+# rewritten with identical content (new mtime) is not parsed again.
+RENDER_MEMO_SIZE = 512
+_RENDER_MEMO: OrderedDict[tuple[bool, bytes], str] = OrderedDict()
+_RENDER_MEMO_LOCK = threading.Lock()
+
+
 def render_markdown(md_text: str) -> str:
     """Convert Markdown → HTML (GitHub-flavoured-ish)."""
-    return markdown.markdown(
-        md_text,
-        extensions=[
-            "fenced_code",
-            "tables",
-            "codehilite",
-            "toc",
-            "attr_list",
-        ],
-    )
+    key = (_MD_IT is not None, hashlib.blake2b(md_text.encode("utf-8"), digest_size=16).digest())
+    with _RENDER_MEMO_LOCK:
+        html = _RENDER_MEMO.get(key)
+        if html is not None:
+            _RENDER_MEMO.move_to_end(key)
+            return html
+    html = _convert_markdown(md_text)
+    with _RENDER_MEMO_LOCK:
+        _RENDER_MEMO[key] = html
+        if len(_RENDER_MEMO) > RENDER_MEMO_SIZE:
+            _RENDER_MEMO.popitem(last=False)
+    return html
 
 
 _ENTRIES_CACHE: dict = {
     "meta": None,           # list of dicts without preview_html
-    "count": 0,
-    "latest_mtime": 0.0,    # max mtime among md/tag files
+    "dir_key": None,        # (SUMMARY_DIR, its mtime_ns) when meta was built
+    "files_key": None,      # newest summary/tag file mtime_ns seen by the last scan
+    "checked": 0.0,         # time.monotonic() of the last scan
+    "index": None,          # tag → ids lookups and the unfiltered clouds
 }
 
+# Rewriting a file in place (an editor, rsync) leaves the directory mtime
+# alone, so a matching dir_key is re-verified by a scan at most this often.
+ENTRIES_RECHECK_SECONDS = 5.0
+
+
+def _invalidate_entries_cache() -> None:
+    _ENTRIES_CACHE["meta"] = None
+    _ENTRIES_CACHE["dir_key"] = None
+    _ENTRIES_CACHE["files_key"] = None
+    _ENTRIES_CACHE["index"] = None
+
+
+def _tag_clouds(entries_meta: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Return ``(tag_cloud, top_cloud)`` sorted by frequency then name."""
+    tag_counts: dict[str, int] = {}
+    top_counts: dict[str, int] = {}
+    for e in entries_meta:
+        for t in e.get("detail_tags", []) or []:
+            tag_counts[t] = tag_counts.get(t, 0) + 1
+        for t in e.get("top_tags", []) or []:
+            top_counts[t] = top_counts.get(t, 0) + 1
+
+    tag_cloud = sorted(
+        ({"name": k, "count": v} for k, v in tag_counts.items()),
+        key=lambda item: (-item["count"], item["name"]),
+    )
+    top_cloud = sorted(
+        ({"name": k, "count": v} for k, v in top_counts.items()),
+        key=lambda item: (-item["count"], item["name"]),
+    )
+    return tag_cloud, top_cloud
+
+
+def _build_entries_index(entries_meta: list[dict]) -> dict:
+    """Invert entries → tags once per cache build.
+
+    ``by_tag`` maps any tag (detail or top) to entry ids, ``by_top`` only top
+    tags, ``trigrams`` each 3-char substring to the tags containing it;
+    ``by_id`` maps entry id to ``(position, meta)`` in listing order;
+    ``tag_cloud``/``top_cloud`` are the clouds of the full corpus.
+    """
+    by_tag: dict[str, set[str]] = {}
+    by_top: dict[str, set[str]] = {}
+    for e in entries_meta:
+        for t in e.get("detail_tags") or []:
+            by_tag.setdefault(t, set()).add(e["id"])
+        for t in e.get("top_tags") or []:
+            by_tag.setdefault(t, set()).add(e["id"])
+            by_top.setdefault(t, set()).add(e["id"])
+    trigrams: dict[str, set[str]] = {}
+    for t in by_tag:
+        for i in range(len(t) - 2):
+            trigrams.setdefault(t[i:i + 3], set()).add(t)
+    tag_cloud, top_cloud = _tag_clouds(entries_meta)
+    return {
+        "by_id": {e["id"]: (pos, e) for pos, e in enumerate(entries_meta)},
+        "by_tag": by_tag,
+        "by_top": by_top,
+        "trigrams": trigrams,
+        "tag_cloud": tag_cloud,
+        "top_cloud": top_cloud,
+    }
+
+
+def _ids_matching_tag_query(index: dict, query: str) -> set[str]:
+    """Ids of entries with any tag containing *query* as a substring."""
+    if len(query) >= 3:
+        postings = [index["trigrams"].get(query[i:i + 3], set()) for i in range(len(query) - 2)]
+        candidates = set.intersection(*postings)
+    else:
+        candidates = index["by_tag"].keys()
+    return set().union(*(index["by_tag"][t] for t in candidates if query in t))
+
+
+def _entries_index() -> dict:
+    """Lookup structures matching the current ``_scan_entries_meta`` result."""
+    _scan_entries_meta()
+    return _ENTRIES_CACHE["index"] or _build_entries_index([])
+
+
+def _normalize_tags(values) -> list[str]:
+    return [t for t in (str(v).strip().lower() for v in values) if t]
+
+
+def _parse_tags(data) -> tuple[list[str], list[str]]:
+    """Return ``(top_tags, detail_tags)`` from a parsed ``.tags.json``.
+
+    Supports legacy ``[..]``, flat ``{"top": [...], "tags": [...]}`` and
+    nested ``{"tags": {"top": [...], "tags": [...]}}``.
+    """
+    if isinstance(data, list):
+        return [], _normalize_tags(data)
+    if not isinstance(data, dict):
+        return [], []
+    container = data
+    if isinstance(data.get("tags"), dict):
+        container = data.get("tags") or {}
+    top = container.get("top")
+    detail = container.get("tags")
+    return (
+        _normalize_tags(top) if isinstance(top, list) else [],
+        _normalize_tags(detail) if isinstance(detail, list) else [],
+    )
+
+
+# str(tag file path) -> (mtime_ns, top_tags, detail_tags)
+_TAG_CACHE: dict[str, tuple[int, list[str], list[str]]] = {}
+
+
+def _load_tags(path: Path, mtime_ns: int) -> tuple[list[str], list[str]]:
+    """Parsed tags for *path*, re-read only when its mtime changes."""
+    key = str(path)
+    cached = _TAG_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+    try:
+        top, detail = _parse_tags(_json_loads(path.read_bytes()))
+    except Exception:
+        top, detail = [], []
+    _TAG_CACHE[key] = (mtime_ns, top, detail)
+    return top, detail
+
 
 def _scan_entries_meta() -> list[dict]:
     """Scan summary directory and build metadata for all entries (no HTML).
 
     Returns a list of dicts with keys: id, updated, tags, top_tags, detail_tags.
-    This function also maintains a lightweight cache to avoid re-reading tag
-    files on every request when nothing changed.
+    The result is cached keyed on the summary directory's own mtime, so an
+    unchanged corpus usually costs a single ``stat`` per request.  The
+    pipeline writes summaries and tag files via temp file + ``os.replace``,
+    which bumps that mtime; in-place rewrites by other tools are caught by
+    re-scanning every ``ENTRIES_RECHECK_SECONDS`` and comparing the newest
+    file mtime.
     """
-    md_files = list(SUMMARY_DIR.glob("*.md"))
-    count = len(md_files)
-    # compute latest mtime considering the md file and its .tags.json sibling
-    latest_mtime = 0.0
-    for p in md_files:
-        try:
-            latest_mtime = max(latest_mtime, p.stat().st_mtime)
-            t = p.with_suffix("")
-            t = t.with_name(t.name + ".tags.json")
-            if t.exists():
-                latest_mtime = max(latest_mtime, t.stat().st_mtime)
-        except Exception:
-            continue
-
-    if (
-        _ENTRIES_CACHE.get("meta") is not None
-        and _ENTRIES_CACHE.get("count") == count
-        and float(_ENTRIES_CACHE.get("latest_mtime") or 0.0) >= float(latest_mtime)
-    ):
-        return list(_ENTRIES_CACHE["meta"])  # type: ignore[index]
+    try:
+        dir_key = (str(SUMMARY_DIR), SUMMARY_DIR.stat().st_mtime_ns)
+    except OSError:
+        return []
+    cached = _ENTRIES_CACHE.get("meta")
+    fresh_dir = cached is not None and _ENTRIES_CACHE.get("dir_key") == dir_key
+    now = time.monotonic()
+    if fresh_dir and now - _ENTRIES_CACHE["checked"] < ENTRIES_RECHECK_SECONDS:
+        return list(cached)  # type: ignore[arg-type]
+
+    # one directory pass: summaries and tag files with their mtimes
+    md_mtimes: dict[str, int] = {}
+    tag_mtimes: dict[str, int] = {}
+    with os.scandir(SUMMARY_DIR) as it:
+        for entry in it:
+            name = entry.name
+            try:
+                if name.endswith(".tags.json"):
+                    tag_mtimes[name] = entry.stat().st_mtime_ns
+                elif name.endswith(".md") and entry.is_file():
+                    md_mtimes[name[:-3]] = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+    files_key = max([*md_mtimes.values(), *tag_mtimes.values()], default=0)
+    _ENTRIES_CACHE["checked"] = now
+    if fresh_dir and _ENTRIES_CACHE.get("files_key") == files_key:
+        return list(cached)  # type: ignore[arg-type]
 
     entries_meta: list[dict] = []
-    for path in md_files:
+    for stem, mtime_ns in md_mtimes.items():
         try:
-            stat = path.stat()
-            updated = datetime.fromtimestamp(stat.st_mtime)
+            updated = datetime.fromtimestamp(mtime_ns / 1e9)
 
             # load tags saved alongside the summary (no markdown rendering here)
-            tags: list[str] = []
+            tags_name = stem + ".tags.json"
             top_tags: list[str] = []
             detail_tags: list[str] = []
-            tags_file = path.with_suffix("")
-            tags_file = tags_file.with_name(tags_file.name + ".tags.json")
-            try:
-                if tags_file.exists():
-                    data = json.loads(tags_file.read_text(encoding="utf-8"))
-                    # support legacy [..], flat {"top": [...], "tags": [...]},
-                    # and nested {"tags": {"top": [...], "tags": [...]}}
-                    if isinstance(data, list):
-                        detail_tags = [str(t).strip().lower() for t in data if str(t).strip()]
-                    elif isinstance(data, dict):
-                        container = data
-                        if isinstance(data.get("tags"), dict):
-                            container = data.get("tags") or {}
-                        if isinstance(container.get("top"), list):
-                            top_tags = [str(t).strip().lower() for t in container.get("top") if str(t).strip()]
-                        if isinstance(container.get("tags"), list):
-                            detail_tags = [str(t).strip().lower() for t in container.get("tags") if str(t).strip()]
-                    tags = (top_tags or []) + (detail_tags or [])
-            except Exception:
-                tags = []
+            if tags_name in tag_mtimes:
+                top_tags, detail_tags = _load_tags(SUMMARY_DIR / tags_name, tag_mtimes[tags_name])
+            tags = top_tags + detail_tags
 
             entries_meta.append(
                 {
-                    "id": path.stem,
+                    "id": stem,
                     "updated": updated,
                     "tags": tags,
                     "top_tags": top_tags,
@@ -145,23 +388,129 @@ def _scan_entries_meta() -> list[dict]:
 
     entries_meta.sort(key=lambda e: e["updated"], reverse=True)
     _ENTRIES_CACHE["meta"] = list(entries_meta)
-    _ENTRIES_CACHE["count"] = count
-    _ENTRIES_CACHE["latest_mtime"] = latest_mtime
+    _ENTRIES_CACHE["dir_key"] = dir_key
+    _ENTRIES_CACHE["files_key"] = files_key
+    _ENTRIES_CACHE["index"] = _build_entries_index(entries_meta)
     return entries_meta
 
 
+# Index cards only show a clipped preview, so read at most this many bytes.
+PREVIEW_BYTES = 4096
+
+
+def _read_preview(path: Path, limit: int) -> tuple[str, bool]:
+    """Return the first *limit* bytes of *path* cut at the last full line.
+
+    The second element tells whether the file was truncated.  An unterminated
+    code fence is closed so the snippet still renders as Markdown.
+    """
+    with path.open("rb") as fh:
+        data = fh.read(limit + 1)
+    if len(data) <= limit:
+        return data.decode("utf-8", errors="ignore"), False
+    data = data[:limit]
+    cut = data.rfind(b"\n")
+    if cut > 0:
+        data = data[:cut]
+    text = data.decode("utf-8", errors="ignore")
+    if sum(1 for ln in text.splitlines() if ln.lstrip().startswith("```")) % 2:
+        text += "\n```"
+    return text, True
+
+
+def _read_md(path: Path) -> str:
+    """Read a summary file in one syscall and decode it once."""
+    return path.read_bytes().decode("utf-8", errors="ignore")
+
+
+def _html_cache_path(md_path: Path) -> Path:
+    """On-disk HTML for *md_path*, named after the active renderer and its config.
+
+    Lives in a subdirectory so writing it does not bump SUMMARY_DIR's mtime
+    (which keys the entries cache).
+    """
+    renderer = "mdit" if _MD_IT is not None else "pymd"
+    return md_path.parent / ".html_cache" / f"{md_path.stem}.{renderer}-{_RENDER_VERSION}.html"
+
+
+def _render_full(md_path: Path, mtime_ns: int) -> str:
+    """Full HTML for *md_path*, reusing the on-disk copy while it is fresh."""
+    html_path = _html_cache_path(md_path)
+    try:
+        if html_path.stat().st_mtime_ns >= mtime_ns:
+            return html_path.read_bytes().decode("utf-8")
+    except OSError:
+        pass
+    html = render_markdown(_read_md(md_path))
+    try:
+        html_path.parent.mkdir(exist_ok=True)
+        _atomic_write_bytes(html_path, html.encode("utf-8"))
+    except OSError:
+        pass  # read-only deployments still serve the rendered HTML
+    return html
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_cached(path_str: str, mtime_ns: int, limit: int | None = None) -> tuple[str, bool]:
+    """Render a summary file (or its first *limit* bytes) once per (path, mtime).
+
+    Rewriting the file changes its mtime and therefore the cache key, so stale
+    HTML is never served.  Full renders are also persisted next to the summary
+    so they survive restarts.  Returns ``(html, truncated)``.
+    """
+    path = Path(path_str)
+    if limit is None:
+        return _render_full(path, mtime_ns), False
+    md_text, truncated = _read_preview(path, limit)
+    return render_markdown(md_text), truncated
+
+
+def _prerender_all() -> None:
+    """Fill the on-disk HTML cache for every summary (run in the background)."""
+    for md_path in SUMMARY_DIR.glob("*.md"):
+        try:
+            _render_file(md_path)
+        except Exception:
+            continue
+
+
+def _render_file(md_path: Path, limit: int | None = None) -> tuple[str, bool]:
+    return _render_cached(str(md_path), md_path.stat().st_mtime_ns, limit)
+
+
+# Threads used to read and render one page of previews concurrently
+RENDER_WORKERS = 8
+_RENDER_POOL: ThreadPoolExecutor | None = None
+_RENDER_POOL_LOCK = threading.Lock()
+
+
+def _get_render_pool() -> ThreadPoolExecutor:
+    global _RENDER_POOL
+    with _RENDER_POOL_LOCK:
+        if _RENDER_POOL is None:
+            _RENDER_POOL = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="md")
+    return _RENDER_POOL
+
+
+def _render_preview(arxiv_id: str) -> tuple[str, bool]:
+    try:
+        return _render_file(SUMMARY_DIR / f"{arxiv_id}.md", PREVIEW_BYTES)
+    except Exception:
+        return "", False
+
+
 def _render_page_entries(entries_meta: list[dict]) -> list[dict]:
     """Given a slice of entries meta, materialize preview_html for each."""
+    ids = [meta["id"] for meta in entries_meta]
+    if len(ids) > 1:
+        previews = list(_get_render_pool().map(_render_preview, ids))
+    else:
+        previews = [_render_preview(i) for i in ids]
     rendered: list[dict] = []
-    for meta in entries_meta:
-        try:
-            md_path = SUMMARY_DIR / f"{meta['id']}.md"
-            md_text = md_path.read_text(encoding="utf-8", errors="ignore")
-            preview_html = render_markdown(md_text)
-        except Exception:
-            preview_html = ""
+    for meta, (preview_html, truncated) in zip(entries_meta, previews):
         item = dict(meta)
         item["preview_html"] = preview_html
+        item["preview_truncated"] = truncated
         rendered.append(item)
     return rendered
 
@@ -173,17 +522,100 @@ def _user_file(uid: str) -> Path:
     return USER_DATA_DIR / f"{uid}.json"
 
 
+def _user_events_file(uid: str) -> Path:
+    return USER_DATA_DIR / f"{uid}.events.jsonl"
+
+
+def _archived_events_files(uid: str) -> list[Path]:
+    """Rotated ``{uid}.events.<timestamp>.jsonl`` logs, oldest first."""
+    return sorted(USER_DATA_DIR.glob(f"{glob.escape(uid)}.events.*.jsonl"))
+
+
+_EVENTS_LOCK = threading.Lock()
+# The live events log is rotated to a timestamped archive past this size so
+# appends stay cheap no matter how long a user has been active.
+EVENTS_ROTATE_BYTES = 8 * 1024 * 1024
+
+
+def _rotate_events_if_large(uid: str) -> None:
+    """Must be called with ``_EVENTS_LOCK`` held."""
+    log = _user_events_file(uid)
+    try:
+        if log.stat().st_size < EVENTS_ROTATE_BYTES:
+            return
+    except FileNotFoundError:
+        return
+    stamp = datetime.now().strftime("%Y-%m-%d_%H%M%S%f")
+    os.replace(log, log.with_name(f"{uid}.events.{stamp}.jsonl"))
+
+
+def _migrate_json_events(uid: str) -> None:
+    """Move a legacy ``events`` array from ``{uid}.json`` into the JSONL log.
+
+    Legacy events are older than anything already appended, so they are
+    written first. Must be called with ``_EVENTS_LOCK`` held.
+    """
+    path = _user_file(uid)
+    if not path.exists():
+        return
+    try:
+        data = _json_loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return
+    if not isinstance(data, dict) or "events" not in data:
+        return
+    events = data.pop("events")
+    if isinstance(events, list) and events:
+        log = _user_events_file(uid)
+        tmp = log.with_name(log.name + ".tmp")
+        with tmp.open("wb") as fh:
+            for evt in events:
+                fh.write(_json_dumps(evt, indent=False) + b"\n")
+            if log.exists():
+                fh.write(log.read_bytes())
+        os.replace(tmp, log)
+    if data:
+        save_user_data(uid, data)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def iter_events(uid: str):
+    """Yield the user's analytics events, oldest first, archives included."""
+    with _EVENTS_LOCK:
+        _migrate_json_events(uid)
+        paths = _archived_events_files(uid) + [_user_events_file(uid)]
+    for path in paths:
+        try:
+            fh = path.open("rb")
+        except FileNotFoundError:
+            continue
+        with fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                try:
+                    yield _json_loads(line)
+                except json.JSONDecodeError:  # torn last line after a crash
+                    continue
+
+
 def load_user_data(uid: str) -> dict:
     """Load full user data structure with backward compatibility.
 
     Shape:
     {
-      "read": {arxiv_id: "YYYY-MM-DD" | null, ...},
+      "read": {arxiv_id: "YYYY-MM-DD" | null, ...},   # legacy, see reads.db
       "events": [ {"ts": ISO8601, "type": str, "arxiv_id": str|None, "meta": dict|None, "path": str|None, "ua": str|None}, ... ]
     }
+
+    Read status now lives in ``reads.db``; a ``read`` key only remains in
+    files that have not been migrated yet. Events come from the append-only
+    ``{uid}.events.jsonl`` log; prefer ``iter_events`` when streaming them.
     """
+    events = list(iter_events(uid))
     try:
-        data = json.loads(_user_file(uid).read_text())
+        data = _json_loads(_user_file(uid).read_bytes())
     except (FileNotFoundError, json.JSONDecodeError):
         data = {}
 
@@ -196,29 +628,111 @@ def load_user_data(uid: str) -> dict:
     else:
         read_map = {}
 
-    events = data.get("events")
-    if not isinstance(events, list):
-        events = []
-
     return {"read": read_map, "events": events}
 
 
+def save_user_data(uid: str, data: dict) -> None:
+    _atomic_write_bytes(_user_file(uid), _json_dumps(data))
+
+
+# ------------------------- read status (SQLite) ------------------------------
+
+# One connection per database path (tests repoint USER_DATA_DIR); sqlite3
+# connections are shared across request threads behind a lock.
+_READS_CONNS: dict[str, sqlite3.Connection] = {}
+_READS_LOCK = threading.Lock()
+
+
+def _migrate_json_reads(conn: sqlite3.Connection) -> None:
+    """Move legacy ``read`` maps out of ``{uid}.json`` into the reads table."""
+    for path in USER_DATA_DIR.glob("*.json"):
+        try:
+            data = _json_loads(path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            continue
+        if not isinstance(data, dict) or "read" not in data:
+            continue
+        raw_read = data.pop("read")
+        if isinstance(raw_read, list):
+            raw_read = {str(rid): None for rid in raw_read}
+        if isinstance(raw_read, dict):
+            conn.executemany(
+                "INSERT OR IGNORE INTO reads(uid, arxiv_id, read_at) VALUES (?, ?, ?)",
+                [(path.stem, str(k), v) for k, v in raw_read.items()],
+            )
+        conn.commit()
+        save_user_data(path.stem, data)
+
+
+def _reads_db() -> sqlite3.Connection:
+    """Return the shared connection to ``USER_DATA_DIR/reads.db``.
+
+    Must be called with ``_READS_LOCK`` held.
+    """
+    db_path = str(USER_DATA_DIR / "reads.db")
+    conn = _READS_CONNS.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: commits append to the log without an fsync each, so a
+        # mark_read costs about as much as an in-memory write.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        fresh = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='reads'"
+        ).fetchone() is None
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS reads("
+            "uid TEXT NOT NULL, arxiv_id TEXT NOT NULL, read_at TEXT, "
+            "PRIMARY KEY(uid, arxiv_id))"
+        )
+        conn.commit()
+        if fresh:
+            _migrate_json_reads(conn)
+        _READS_CONNS[db_path] = conn
+    return conn
+
+
 def load_read_map(uid: str) -> dict[str, str | None]:
-    data = load_user_data(uid)
-    return data.get("read", {})
+    """Return ``{arxiv_id: read_at}`` for *uid* (read_at is local ISO time)."""
+    with _READS_LOCK:
+        rows = _reads_db().execute(
+            "SELECT arxiv_id, read_at FROM reads WHERE uid=?", (uid,)
+        ).fetchall()
+    return dict(rows)
+
+
+def add_read(uid: str, arxiv_id: str, read_at: str | None) -> None:
+    with _READS_LOCK:
+        conn = _reads_db()
+        conn.execute(
+            "INSERT OR REPLACE INTO reads(uid, arxiv_id, read_at) VALUES (?, ?, ?)",
+            (uid, arxiv_id, read_at),
+        )
+        conn.commit()
 
 
-def save_user_data(uid: str, data: dict) -> None:
-    _user_file(uid).write_text(
-        json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+def remove_read(uid: str, arxiv_id: str) -> None:
+    with _READS_LOCK:
+        conn = _reads_db()
+        conn.execute("DELETE FROM reads WHERE uid=? AND arxiv_id=?", (uid, arxiv_id))
+        conn.commit()
 
 
-def save_read_map(uid: str, read_map: dict[str, str | None]):
-    """Persist read map, preserving other fields (like events)."""
-    data = load_user_data(uid)
-    data["read"] = read_map
-    save_user_data(uid, data)
+def clear_reads(uid: str) -> None:
+    with _READS_LOCK:
+        conn = _reads_db()
+        conn.execute("DELETE FROM reads WHERE uid=?", (uid,))
+        conn.commit()
+
+
+def count_reads_on(uid: str, day_iso: str) -> int:
+    """Count reads whose stored date (``YYYY-MM-DD[THH:MM:SS...]``) is *day_iso*."""
+    with _READS_LOCK:
+        row = _reads_db().execute(
+            "SELECT COUNT(*) FROM reads WHERE uid=? AND substr(read_at, 1, 10)=?",
+            (uid, day_iso),
+        ).fetchone()
+    return int(row[0])
 
 
 def append_event(uid: str, event_type: str, arxiv_id: str | None = None, meta: dict | None = None, ts: str | None = None):
@@ -227,7 +741,6 @@ def append_event(uid: str, event_type: str, arxiv_id: str | None = None, meta: d
     If ts is provided (ISO 8601, preferably with timezone offset), it will be
     used. Otherwise, we store the server local timezone timestamp with offset.
     """
-    data = load_user_data(uid)
     evt = {
         "ts": ts or datetime.now().astimezone().isoformat(timespec="seconds"),
         "type": event_type,
@@ -236,16 +749,51 @@ def append_event(uid: str, event_type: str, arxiv_id: str | None = None, meta: d
         "path": request.path if request else None,
         "ua": request.headers.get("User-Agent") if request else None,
     }
-    data.setdefault("events", []).append(evt)
-    save_user_data(uid, data)
+    line = _json_dumps(evt, indent=False) + b"\n"
+    with _EVENTS_LOCK:
+        _migrate_json_events(uid)
+        _rotate_events_if_large(uid)
+        with _user_events_file(uid).open("ab") as fh:
+            fh.write(line)
 
 # -----------------------------------------------------------------------------
 # Templates (plain strings — no Python f-strings)                               
 # -----------------------------------------------------------------------------
 
-BASE_CSS = open(os.path.join('ui', 'base.css'), 'r', encoding='utf-8').read()
-INDEX_TEMPLATE = open(os.path.join('ui', 'index.html'), 'r', encoding='utf-8').read()
-DETAIL_TEMPLATE = open(os.path.join('ui', 'detail.html'), 'r', encoding='utf-8').read()
+UI_DIR = Path(__file__).parent / "ui"
+BASE_CSS = (UI_DIR / "base.css").read_bytes()
+INDEX_TEMPLATE = (UI_DIR / "index.html").read_text(encoding="utf-8")
+DETAIL_TEMPLATE = (UI_DIR / "detail.html").read_text(encoding="utf-8")
+# content hash appended to the stylesheet URL so long browser caching is safe
+BASE_CSS_VERSION = hashlib.sha1(BASE_CSS).hexdigest()[:10]
+
+# Compiled once; render_template_string would re-compile the source per request.
+INDEX_TMPL = app.jinja_env.from_string(INDEX_TEMPLATE)
+DETAIL_TMPL = app.jinja_env.from_string(DETAIL_TEMPLATE)
+# part of every page ETag so a redeploy with new templates invalidates them
+_TEMPLATE_VERSION = hashlib.sha1((INDEX_TEMPLATE + DETAIL_TEMPLATE).encode("utf-8")).hexdigest()[:10]
+
+
+def _page_etag(*parts) -> str:
+    """Weak validator for a rendered page built from *parts*."""
+    return hashlib.sha1(repr((_TEMPLATE_VERSION, BASE_CSS_VERSION) + parts).encode("utf-8")).hexdigest()[:20]
+
+
+def _not_modified(etag: str) -> Response | None:
+    """A 304 response when the client already holds *etag*, else None."""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    resp = Response(status=304)
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+
+def _with_etag(resp: Response, etag: str) -> Response:
+    # no-cache: browsers may keep the page but must revalidate it each time
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
 
 # -----------------------------------------------------------------------------
 # Routes
@@ -255,6 +803,7 @@ DETAIL_TEMPLATE = open(os.path.join('ui', 'detail.html'), 'r', encoding='utf-8')
 def index():
     uid = request.cookies.get("uid")
     entries_meta = _scan_entries_meta()
+    entries_index = _entries_index()
     # tag filtering (from query string)
     active_tag = (request.args.get("tag") or "").strip().lower() or None
     tag_query = (request.args.get("q") or "").strip().lower()
@@ -263,57 +812,46 @@ def index():
     unread_count = None
     read_total = None
     read_today = None
+    read_map = load_read_map(uid) if uid else {}
+    etag = _page_etag(
+        "index",
+        _ENTRIES_CACHE.get("dir_key"),
+        _ENTRIES_CACHE.get("files_key"),
+        request.query_string,
+        uid,
+        sorted(read_map.items(), key=lambda kv: kv[0]),
+        date.today().isoformat(),
+        os.getenv("ADMIN_USER_IDS", ""),
+    )
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
     if uid:
-        read_map = load_read_map(uid)
-        read_ids = set(read_map.keys())
-        unread_count = len([e for e in entries_meta if e["id"] not in read_ids])
-        entries_meta = [e for e in entries_meta if e["id"] not in read_ids]
+        read_ids = set(read_map)
+        unread_count = len(entries_meta) - len(read_ids & entries_index["by_id"].keys())
+        if unread_count < len(entries_meta):
+            entries_meta = [e for e in entries_meta if e["id"] not in read_ids]
         read_total = len(read_ids)
         # Count how many read today, based on stored per-paper read date/time (YYYY-MM-DD[THH:MM:SS])
-        today_iso = date.today().isoformat()
-        read_today = 0
-        for d in read_map.values():
-            if not d:
-                continue
-            try:
-                # match date prefix for both date-only and datetime strings
-                if str(d).split('T', 1)[0] == today_iso:
-                    read_today += 1
-            except Exception:
-                continue
+        read_today = count_reads_on(uid, date.today().isoformat())
     # apply tag-based filters if present
+    filtered = bool(uid or active_tag or tag_query or active_tops)
     if active_tag:
-        entries_meta = [e for e in entries_meta if active_tag in (e.get("detail_tags") or []) or active_tag in (e.get("top_tags") or [])]
+        tagged_ids = entries_index["by_tag"].get(active_tag, set())
+        entries_meta = [e for e in entries_meta if e["id"] in tagged_ids]
     if tag_query:
-        def matches_query(tags: list[str] | None, query: str) -> bool:
-            if not tags:
-                return False
-            for t in tags:
-                if query in t:
-                    return True
-            return False
-        entries_meta = [e for e in entries_meta if matches_query(e.get("detail_tags"), tag_query) or matches_query(e.get("top_tags"), tag_query)]
+        query_ids = _ids_matching_tag_query(entries_index, tag_query)
+        entries_meta = [e for e in entries_meta if e["id"] in query_ids]
     if active_tops:
-        entries_meta = [e for e in entries_meta if any(t in (e.get("top_tags") or []) for t in active_tops)]
-
-    # compute tag cloud from filtered entries only (meta only, no HTML work)
-    tag_counts: dict[str, int] = {}
-    top_counts: dict[str, int] = {}
-    for e in entries_meta:
-        for t in e.get("detail_tags", []) or []:
-            tag_counts[t] = tag_counts.get(t, 0) + 1
-        for t in e.get("top_tags", []) or []:
-            top_counts[t] = top_counts.get(t, 0) + 1
+        top_ids = set().union(*(entries_index["by_top"].get(t, set()) for t in active_tops))
+        entries_meta = [e for e in entries_meta if e["id"] in top_ids]
 
-    # sort tags by frequency then name
-    tag_cloud = sorted(
-        ({"name": k, "count": v} for k, v in tag_counts.items()),
-        key=lambda item: (-item["count"], item["name"]),
-    )
-    top_cloud = sorted(
-        ({"name": k, "count": v} for k, v in top_counts.items()),
-        key=lambda item: (-item["count"], item["name"]),
-    )
+    # compute tag cloud from filtered entries only (meta only, no HTML work);
+    # the unfiltered cloud is precomputed with the entries cache
+    if filtered:
+        tag_cloud, top_cloud = _tag_clouds(entries_meta)
+    else:
+        tag_cloud, top_cloud = entries_index["tag_cloud"], entries_index["top_cloud"]
 
     # when searching, show only related detailed tags in the filter bar
     if tag_query:
@@ -344,8 +882,8 @@ def index():
     admin_users = [admin_id.strip() for admin_id in os.getenv("ADMIN_USER_IDS", "").split(",") if admin_id.strip()]
 
     resp = make_response(
-        render_template_string(
-            INDEX_TEMPLATE,
+        render_template(
+            INDEX_TMPL,
             entries=entries,
             uid=uid,
             unread_count=unread_count,
@@ -363,7 +901,7 @@ def index():
             admin_users=admin_users,
         )
     )
-    return resp
+    return _with_etag(resp, etag)
 
 
 @app.route("/set_user", methods=["POST"])
@@ -381,10 +919,8 @@ def mark_read(arxiv_id):
     uid = request.cookies.get("uid")
     if not uid:
         return jsonify({"error": "no-uid"}), 400
-    read_map = load_read_map(uid)
     # store local date-time with timezone offset for more precise analytics
-    read_map[str(arxiv_id)] = datetime.now().astimezone().isoformat(timespec="seconds")
-    save_read_map(uid, read_map)
+    add_read(uid, str(arxiv_id), datetime.now().astimezone().isoformat(timespec="seconds"))
     return jsonify({"status": "ok"})
 
 
@@ -393,9 +929,7 @@ def unmark_read(arxiv_id):
     uid = request.cookies.get("uid")
     if not uid:
         return jsonify({"error": "no-uid"}), 400
-    read_map = load_read_map(uid)
-    read_map.pop(str(arxiv_id), None)
-    save_read_map(uid, read_map)
+    remove_read(uid, str(arxiv_id))
     return jsonify({"status": "ok"})
 
 
@@ -405,7 +939,11 @@ def reset_read():
     if not uid:
         return jsonify({"error": "no-uid"}), 400
     try:
+        clear_reads(uid)
         _user_file(uid).unlink(missing_ok=True)
+        _user_events_file(uid).unlink(missing_ok=True)
+        for archived in _archived_events_files(uid):
+            archived.unlink(missing_ok=True)
     except Exception:
         pass
     return jsonify({"status": "reset"})
@@ -414,42 +952,39 @@ def reset_read():
 @app.route("/summary/<arxiv_id>")
 def view_summary(arxiv_id):
     md_path = SUMMARY_DIR / f"{arxiv_id}.md"
-    if not md_path.exists():
+    try:
+        md_mtime_ns = md_path.stat().st_mtime_ns
+    except OSError:
         abort(404)
-    md_text = md_path.read_text(encoding="utf-8", errors="ignore")
-    uid = request.cookies.get("uid")
-    html_content = render_markdown(md_text)
+    tpath = SUMMARY_DIR / f"{arxiv_id}.tags.json"
+    try:
+        tags_mtime_ns = tpath.stat().st_mtime_ns
+    except OSError:
+        tags_mtime_ns = None
+    etag = _page_etag("summary", arxiv_id, md_mtime_ns, tags_mtime_ns)
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+    html_content, _ = _render_file(md_path)
     # load tags for this paper
     tags: list[str] = []
-    tpath = md_path.with_suffix("")
-    tpath = tpath.with_name(tpath.name + ".tags.json")
-    try:
-        if tpath.exists():
-            data = json.loads(tpath.read_text(encoding="utf-8"))
-            # support flat and nested
-            if isinstance(data, list):
-                tags = [str(t).strip().lower() for t in data if str(t).strip()]
-            elif isinstance(data, dict):
-                container = data
-                if isinstance(data.get("tags"), dict):
-                    container = data.get("tags") or {}
-                raw = []
-                if isinstance(container.get("top"), list):
-                    raw.extend(container.get("top") or [])
-                if isinstance(container.get("tags"), list):
-                    raw.extend(container.get("tags") or [])
-                tags = [str(t).strip().lower() for t in raw if str(t).strip()]
-    except Exception:
-        tags = []
-    return render_template_string(DETAIL_TEMPLATE, content=html_content, arxiv_id=arxiv_id, tags=tags)
+    if tags_mtime_ns is not None:
+        top, detail = _load_tags(tpath, tags_mtime_ns)
+        tags = top + detail
+    resp = make_response(render_template(DETAIL_TMPL, content=html_content, arxiv_id=arxiv_id, tags=tags))
+    return _with_etag(resp, etag)
+
+
+# Browser cache lifetime for raw Markdown; revalidated with ETag/Last-Modified after
+RAW_MAX_AGE = 3600
 
 
 @app.route("/raw/<arxiv_id>.md")
 def raw_markdown(arxiv_id):
     md_path = SUMMARY_DIR / f"{arxiv_id}.md"
-    if not md_path.exists():
+    if not md_path.is_file():
         abort(404)
-    return send_from_directory(md_path.parent, md_path.name, mimetype="text/markdown")
+    return send_file(md_path, mimetype="text/markdown", conditional=True, max_age=RAW_MAX_AGE)
 
 
 @app.route("/read")
@@ -457,23 +992,18 @@ def read_papers():
     uid = request.cookies.get("uid")
     if not uid:
         return redirect(url_for("index"))
-    read_map = load_read_map(uid)
-    entries_meta = _scan_entries_meta()
-    read_entries_meta = [e for e in entries_meta if e["id"] in set(read_map.keys())]
+    by_id = _entries_index()["by_id"]
+    # look up only the read ids, then restore listing order
+    read_entries_meta = [e for _, e in sorted(by_id[i] for i in load_read_map(uid) if i in by_id)]
     # allow optional tag filter on read list
     active_tag = (request.args.get("tag") or "").strip().lower() or None
     tag_query = (request.args.get("q") or "").strip().lower()
     if active_tag:
-        read_entries_meta = [e for e in read_entries_meta if active_tag in (e.get("tags") or []) or active_tag in (e.get("top_tags") or [])]
+        tagged_ids = _entries_index()["by_tag"].get(active_tag, set())
+        read_entries_meta = [e for e in read_entries_meta if e["id"] in tagged_ids]
     if tag_query:
-        def matches_query(tags: list[str] | None, query: str) -> bool:
-            if not tags:
-                return False
-            for t in tags:
-                if query in t:
-                    return True
-            return False
-        read_entries_meta = [e for e in read_entries_meta if matches_query(e.get("tags"), tag_query)]
+        query_ids = _ids_matching_tag_query(_entries_index(), tag_query)
+        read_entries_meta = [e for e in read_entries_meta if e["id"] in query_ids]
     # tag cloud for read entries
     tag_counts: dict[str, int] = {}
     for e in read_entries_meta:
@@ -507,8 +1037,8 @@ def read_papers():
     # Get admin users list for template
     admin_users = [admin_id.strip() for admin_id in os.getenv("ADMIN_USER_IDS", "").split(",") if admin_id.strip()]
     
-    return render_template_string(
-        INDEX_TEMPLATE,
+    return render_template(
+        INDEX_TMPL,
         entries=entries,
         uid=uid,
         unread_count=None,
@@ -527,25 +1057,67 @@ def read_papers():
 
 @app.get("/assets/base.css")
 def base_css():
-    return Response(BASE_CSS, mimetype="text/css")
+    resp = Response(BASE_CSS, mimetype="text/css")
+    # the URL carries the content hash, so the body never changes under it
+    resp.headers["Cache-Control"] = "public, max-age=86400, immutable"
+    resp.set_etag(BASE_CSS_VERSION)
+    return resp.make_conditional(request)
 
 
-@app.get("/favicon.svg")
-def favicon_svg():
-    svg = (
-        """
-<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"64\" height=\"64\" viewBox=\"0 0 64 64\">
+@app.context_processor
+def _inject_css_version():
+    return {"css_version": BASE_CSS_VERSION}
+
+
+# Responses smaller than this are not worth compressing
+GZIP_MIN_BYTES = 500
+_GZIP_MIMETYPES = {"text/html", "text/css", "text/markdown", "application/json", "image/svg+xml"}
+
+
+@app.after_request
+def _gzip_response(resp):
+    """Gzip text responses for clients that accept it."""
+    if (
+        resp.status_code != 200
+        or "Content-Encoding" in resp.headers
+        or resp.mimetype not in _GZIP_MIMETYPES
+        or not request.accept_encodings["gzip"]
+    ):
+        return resp
+    if resp.direct_passthrough:
+        # send_file: buffer the file so it can be compressed
+        resp.direct_passthrough = False
+    elif resp.is_streamed:
+        return resp
+    data = resp.get_data()
+    if len(data) < GZIP_MIN_BYTES:
+        return resp
+    resp.set_data(gzip.compress(data, compresslevel=6))
+    resp.headers["Content-Encoding"] = "gzip"
+    resp.vary.add("Accept-Encoding")
+    etag, _ = resp.get_etag()
+    if etag:
+        # same representation, different bytes: keep the tag but make it weak
+        # so If-None-Match still matches while byte-level identity is not claimed
+        resp.set_etag(etag, weak=True)
+    return resp
+
+
+# Built once at import; the route only attaches cache headers.
+FAVICON_SVG = (
+    """
+<svg xmlns="http://www.w3.org/2000/svg" width="64" height="64" viewBox="0 0 64 64">
   <defs>
-    <linearGradient id=\"gLight\" x1=\"0\" y1=\"0\" x2=\"1\" y2=\"1\">
-      <stop offset=\"0%\" stop-color=\"#6366f1\"/>
-      <stop offset=\"100%\" stop-color=\"#22d3ee\"/>
+    <linearGradient id="gLight" x1="0" y1="0" x2="1" y2="1">
+      <stop offset="0%" stop-color="#6366f1"/>
+      <stop offset="100%" stop-color="#22d3ee"/>
     </linearGradient>
-    <linearGradient id=\"gDark\" x1=\"0\" y1=\"0\" x2=\"1\" y2=\"1\">
-      <stop offset=\"0%\" stop-color=\"#1d4ed8\"/>
-      <stop offset=\"100%\" stop-color=\"#06b6d4\"/>
+    <linearGradient id="gDark" x1="0" y1="0" x2="1" y2="1">
+      <stop offset="0%" stop-color="#1d4ed8"/>
+      <stop offset="100%" stop-color="#06b6d4"/>
     </linearGradient>
-    <filter id=\"shadow\" x=\"-20%\" y=\"-20%\" width=\"140%\" height=\"140%\">
-      <feDropShadow dx=\"0\" dy=\"2\" stdDeviation=\"2\" flood-color=\"#000\" flood-opacity=\".25\"/>
+    <filter id="shadow" x="-20%" y="-20%" width="140%" height="140%">
+      <feDropShadow dx="0" dy="2" stdDeviation="2" flood-color="#000" flood-opacity=".25"/>
     </filter>
   </defs>
   <style>
@@ -563,30 +1135,40 @@ def favicon_svg():
   </style>
 
   <!-- vivid gradient background, light/dark aware -->
-  <rect class=\"light-only\" x=\"4\" y=\"4\" width=\"56\" height=\"56\" rx=\"14\" fill=\"url(#gLight)\"/>
-  <rect class=\"dark-only\"  x=\"4\" y=\"4\" width=\"56\" height=\"56\" rx=\"14\" fill=\"url(#gDark)\"/>
+  <rect class="light-only" x="4" y="4" width="56" height="56" rx="14" fill="url(#gLight)"/>
+  <rect class="dark-only"  x="4" y="4" width="56" height="56" rx="14" fill="url(#gDark)"/>
 
   <!-- stylized book with bookmark and spark -->
-  <g filter=\"url(#shadow)\">
+  <g filter="url(#shadow)">
     <!-- book body -->
-    <rect x=\"17\" y=\"16\" width=\"30\" height=\"34\" rx=\"6\" class=\"fg\"/>
+    <rect x="17" y="16" width="30" height="34" rx="6" class="fg"/>
     <!-- page lines -->
-    <rect x=\"22\" y=\"22\" width=\"20\" height=\"2\" rx=\"1\" opacity=\".25\"/>
-    <rect x=\"22\" y=\"28\" width=\"20\" height=\"2\" rx=\"1\" opacity=\".25\"/>
-    <rect x=\"22\" y=\"34\" width=\"14\" height=\"2\" rx=\"1\" opacity=\".25\"/>
+    <rect x="22" y="22" width="20" height="2" rx="1" opacity=".25"/>
+    <rect x="22" y="28" width="20" height="2" rx="1" opacity=".25"/>
+    <rect x="22" y="34" width="14" height="2" rx="1" opacity=".25"/>
     <!-- bookmark ribbon -->
-    <path class=\"accent\" d=\"M40 16 v18 l-5-3 l-5 3 V16 z\"/>
+    <path class="accent" d="M40 16 v18 l-5-3 l-5 3 V16 z"/>
   </g>
 
   <!-- spark -->
-  <g transform=\"translate(44 44)\">
-    <circle r=\"2.5\" class=\"fg\" opacity=\".3\"/>
-    <path class=\"fg\" d=\"M0-4 L1.2-1.2 4 0 1.2 1.2 0 4 -1.2 1.2 -4 0 -1.2 -1.2 Z\"/>
+  <g transform="translate(44 44)">
+    <circle r="2.5" class="fg" opacity=".3"/>
+    <path class="fg" d="M0-4 L1.2-1.2 4 0 1.2 1.2 0 4 -1.2 1.2 -4 0 -1.2 -1.2 Z"/>
   </g>
 </svg>
 """
-    ).strip()
-    return Response(svg, mimetype="image/svg+xml")
+).strip().encode("utf-8")
+FAVICON_VERSION = hashlib.sha1(FAVICON_SVG).hexdigest()[:10]
+# favicon URLs are fixed, so allow a week of caching then revalidate by ETag
+FAVICON_MAX_AGE = 7 * 24 * 3600
+
+
+@app.get("/favicon.svg")
+def favicon_svg():
+    resp = Response(FAVICON_SVG, mimetype="image/svg+xml")
+    resp.headers["Cache-Control"] = f"public, max-age={FAVICON_MAX_AGE}"
+    resp.set_etag(FAVICON_VERSION)
+    return resp.make_conditional(request)
 
 
 @app.get("/favicon.ico")
@@ -604,9 +1186,9 @@ def ingest_event():
     try:
         payload = request.get_json(silent=True)
         if payload is None:
-            raw = request.get_data(as_text=True) or "{}"
+            raw = request.get_data() or b"{}"
             try:
-                payload = json.loads(raw)
+                payload = _json_loads(raw)
             except Exception:
                 payload = {}
         etype = str(payload.get("type", "")).strip()
@@ -666,12 +1248,7 @@ def admin_fetch_latest():
         
         if result.returncode == 0:
             # Clear the cache to force refresh of entries
-            global _ENTRIES_CACHE
-            _ENTRIES_CACHE = {
-                "meta": None,
-                "count": 0,
-                "latest_mtime": 0.0,
-            }
+            _invalidate_entries_cache()
             
             # Process the output to extract key information
             stdout_lines = result.stdout.strip().split('\n') if result.stdout else []
@@ -800,12 +1377,7 @@ def admin_fetch_latest_stream():
                 yield "data: {\"type\": \"complete\", \"status\": \"success\", \"message\": \"最新论文摘要获取成功！\"}\n\n"
                 
                 # Clear the cache to force refresh of entries
-                global _ENTRIES_CACHE
-                _ENTRIES_CACHE = {
-                    "meta": None,
-                    "count": 0,
-                    "latest_mtime": 0.0,
-                }
+                _invalidate_entries_cache()
             else:
                 yield f"data: {{\"type\": \"log\", \"message\": \"进程返回码: {return_code}\", \"level\": \"error\"}}\n\n"
                 yield "data: {\"type\": \"status\", \"message\": \"获取失败\", \"icon\": \"❌\"}\n\n"
@@ -832,4 +1404,5 @@ def admin_fetch_latest_stream():
 
 if __name__ == "__main__":
     print(f"✅ Serving summaries from {SUMMARY_DIR.resolve()}")
+    threading.Thread(target=_prerender_all, name="prerender", daemon=True).start()
     app.run(host="0.0.0.0", port=int(os.getenv("PORT", 22581)), debug=True)
\ No newline at end of file
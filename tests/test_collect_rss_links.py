@@ -0,0 +1,105 @@
+import pytest
+
+import collect_hf_paper_links_from_rss as collect
+from collect_hf_paper_links_from_rss import FeedNotModified, get_links_from_rss, parse_links
+
+
+RSS_BYTES = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Test Feed</title>
+        <link>https://example.com</link>
+        <item>
+            <title>Paper 1</title>
+            <link> https://huggingface.co/papers/2506.00001 </link>
+        </item>
+        <item>
+            <title>Paper 2</title>
+            <link>https://huggingface.co/papers/2506.00002</link>
+        </item>
+        <item>
+            <title>No link</title>
+        </item>
+    </channel>
+</rss>"""
+
+
+def test_parse_links_from_bytes():
+    links = parse_links(RSS_BYTES)
+    assert links == [
+        "https://huggingface.co/papers/2506.00001",
+        "https://huggingface.co/papers/2506.00002",
+    ]
+
+
+def test_parse_links_accepts_str():
+    assert parse_links(RSS_BYTES.decode("utf-8")) == parse_links(RSS_BYTES)
+
+
+def test_parse_links_ignores_channel_link():
+    links = parse_links(RSS_BYTES)
+    assert "https://example.com" not in links
+
+
+class FakeStreamResponse:
+    def __init__(self, content: bytes, chunk: int = 7, status_code: int = 200, headers=None):
+        self._content = content
+        self._chunk = chunk
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self._content), self._chunk):
+            yield self._content[i:i + self._chunk]
+
+
+def test_get_links_from_rss_streams_chunks(monkeypatch):
+    calls = []
+
+    def fake_get(url, stream=False, timeout=None):
+        calls.append((url, stream))
+        return FakeStreamResponse(RSS_BYTES)
+
+    monkeypatch.setattr(collect.requests, "get", fake_get)
+    links, validators = get_links_from_rss("https://example.com/rss.xml")
+    assert calls == [("https://example.com/rss.xml", True)]
+    assert validators == {}
+    assert links == parse_links(RSS_BYTES)
+
+
+def test_conditional_fetch_sends_saved_validators(monkeypatch, tmp_path):
+    monkeypatch.setattr(collect, "RSS_META_PATH", tmp_path / ".rss_meta.json")
+    url = "https://example.com/rss.xml"
+    sent = []
+    responses = [
+        FakeStreamResponse(RSS_BYTES, headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+        FakeStreamResponse(b"", status_code=304),
+    ]
+
+    def fake_get(url, stream=False, timeout=None, headers=None):
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(collect.requests, "get", fake_get)
+
+    links, validators = get_links_from_rss(url, conditional=True)
+    assert links == parse_links(RSS_BYTES)
+    # validators are handed back, not saved, until the caller has used the links
+    assert not collect.RSS_META_PATH.exists()
+    collect.save_rss_meta(url, validators)
+    with pytest.raises(FeedNotModified):
+        get_links_from_rss(url, conditional=True)
+
+    assert sent == [
+        {},
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    ]
@@ -7,6 +7,7 @@ from types import SimpleNamespace
 
 # Import the module under test – relative import assuming tests run from repo root
 import feed_paper_summarizer_service as svc
+import paper_summarizer
 
 ################################################################################
 # Helpers / fixtures
@@ -32,19 +33,29 @@ def test_parse_args_defaults():
     assert args.output == Path("output.md")
     assert args.api_key is None
 
+################################################################################
+# extract_first_header
+################################################################################
+
+def test_extract_first_header():
+    assert svc.extract_first_header("## **Paper Title**\n\nbody") == "Paper Title"
+    assert svc.extract_first_header("# Doc\n### Sub\n## Second  \n## Third") == "Second"
+    assert svc.extract_first_header("## Only line") == "Only line"
+    assert svc.extract_first_header("no headers here\n### deeper") == ""
+
 ################################################################################
 # _aggregate_summaries
 ################################################################################
 
 def test_aggregate_summaries(tmp_path: Path):
-    # Two fake summary files
+    # Summary texts are passed in memory; the files need not exist
     s1 = tmp_path / "2506.00001.md"
     s2 = tmp_path / "2506.00002.md"
-    s1.write_text("Summary 1", encoding="utf-8")
-    s2.write_text("Summary 2", encoding="utf-8")
 
     out_file = tmp_path / "aggregate.md"
-    svc._aggregate_summaries([s1, s2], out_file, "https://example.com/rss.xml")  # type: ignore[attr-defined]
+    svc._aggregate_summaries(  # type: ignore[attr-defined]
+        [(s1, "Summary 1"), (s2, "Summary 2")], out_file, "https://example.com/rss.xml"
+    )
 
     output = out_file.read_text(encoding="utf-8")
     # Header present
@@ -65,11 +76,11 @@ def test_summarize_url_success(monkeypatch, tmp_path: Path):
         CHUNKS_SUMMARY_DIR = tmp_path / 'chunks'
 
         @staticmethod
-        def resolve_pdf_url(url):  # noqa: D401
+        def resolve_pdf_url(url, session=None):  # noqa: D401
             return "https://example.com/dummy.pdf"
 
         @staticmethod
-        def download_pdf(url):  # noqa: D401
+        def download_pdf(url, session=None):  # noqa: D401
             # Create a fake PDF path inside tmp_dir
             p = tmp_path / "dummy.pdf"
             p.write_bytes(b"%PDF-1.4")
@@ -83,28 +94,31 @@ def test_summarize_url_success(monkeypatch, tmp_path: Path):
             md.write_text("Some markdown", encoding="utf-8")
             return md
 
+        read_markdown = staticmethod(paper_summarizer.read_markdown)
+
         @staticmethod
         def chunk_text(text):  # noqa: D401
             return [text]
 
         @staticmethod
         def progressive_summary(
-            chunks, summary_path, chunk_summary_path, api_key=None, base_url=None, provider=None, ollama_base_url=None, ollama_model=None
+            chunks, summary_path, chunk_summary_path, api_key=None, base_url=None, provider=None, model=None, max_workers=1
         ):  # noqa: D401
             os.makedirs(DummyPS.CHUNKS_SUMMARY_DIR, exist_ok=True)
             return "the-summary", "the-chunks-summary"
 
         @staticmethod
-        def generate_tags_from_summary(summary, api_key=None, base_url=None, provider=None, ollama_base_url=None, ollama_model=None):  # noqa: D401
+        def generate_tags_from_summary(summary, api_key=None, base_url=None, provider=None, model=None):  # noqa: D401
             return ["llm", "reasoning"]
 
     # Inject dummy ps module into svc
     monkeypatch.setattr(svc, "ps", DummyPS)
 
-    out_path, _, _ = svc._summarize_url("https://example.com/paper", api_key="dummy")  # type: ignore[attr-defined]
+    out_path, _, _, summary_text = svc._summarize_url("https://example.com/paper", api_key="dummy")  # type: ignore[attr-defined]
 
     assert out_path is not None and out_path.exists()
     assert out_path.read_text(encoding="utf-8") == "the-summary"
+    assert summary_text == "the-summary"
 
     # tags file should be produced alongside summary
     tags_path = tmp_path / "dummy.tags.json"
@@ -120,11 +134,11 @@ def test_summarize_url_backfills_tags_on_cached_summary(monkeypatch, tmp_path: P
         CHUNKS_SUMMARY_DIR = tmp_path / 'chunks'
 
         @staticmethod
-        def resolve_pdf_url(url):
+        def resolve_pdf_url(url, session=None):
             return "https://example.com/dummy.pdf"
 
         @staticmethod
-        def download_pdf(url):
+        def download_pdf(url, session=None):
             p = tmp_path / "dummy.pdf"
             p.write_bytes(b"%PDF-1.4")
             return p
@@ -137,12 +151,14 @@ def test_summarize_url_backfills_tags_on_cached_summary(monkeypatch, tmp_path: P
             md.write_text("Some markdown", encoding="utf-8")
             return md
 
+        read_markdown = staticmethod(paper_summarizer.read_markdown)
+
         @staticmethod
         def chunk_text(text):
             return [text]
 
         @staticmethod
-        def generate_tags_from_summary(summary, api_key=None, base_url=None, provider=None, ollama_base_url=None, ollama_model=None):
+        def generate_tags_from_summary(summary, api_key=None, base_url=None, provider=None, model=None):
             return ["cached"]
 
     # Pre-create cached summary so the service takes the cached path branch
@@ -150,9 +166,10 @@ def test_summarize_url_backfills_tags_on_cached_summary(monkeypatch, tmp_path: P
 
     monkeypatch.setattr(svc, "ps", DummyPS)
 
-    out_path, _, _ = svc._summarize_url("https://example.com/paper", api_key="key")  # type: ignore[attr-defined]
+    out_path, _, _, summary_text = svc._summarize_url("https://example.com/paper", api_key="key")  # type: ignore[attr-defined]
 
     assert out_path == tmp_path / "dummy.md"
+    assert summary_text == "CACHED SUMMARY TEXT"
     tags_path = tmp_path / "dummy.tags.json"
     assert tags_path.exists()
     import json as _json
@@ -164,15 +181,80 @@ def test_summarize_url_failure(monkeypatch):
     """_summarize_url should swallow exceptions and return None."""
 
     class BadPS:
-        def resolve_pdf_url(self, url):  # type: ignore[no-self-use]
+        def resolve_pdf_url(self, url, session=None):  # type: ignore[no-self-use]
             raise RuntimeError("boom")
 
     monkeypatch.setattr(svc, "ps", BadPS())
 
-    result, _, _ = svc._summarize_url("https://bad-url.com")  # type: ignore[attr-defined]
+    result, _, _, _ = svc._summarize_url("https://bad-url.com")  # type: ignore[attr-defined]
     assert result is None
 
 
+def test_write_atomic_replaces_without_leftovers(tmp_path: Path):
+    target = tmp_path / "paper.md"
+    target.write_text("old", encoding="utf-8")
+
+    svc._write_atomic(target, "new")  # type: ignore[attr-defined]
+
+    assert target.read_text(encoding="utf-8") == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["paper.md"]
+
+
+def test_summary_lock_serializes_same_path(tmp_path: Path):
+    import threading
+    import time
+
+    target = tmp_path / "paper.md"
+    active = []
+    overlaps = []
+
+    def worker():
+        with svc._summary_lock(target):  # type: ignore[attr-defined]
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert overlaps == [1, 1, 1, 1]
+
+
+def test_run_pipeline_hands_fetched_papers_to_summary_stage(monkeypatch, tmp_path: Path):
+    """Fetch failures are skipped and results keep the input order."""
+
+    def fake_fetch(url, local=False, session=None):
+        if url.endswith("bad"):
+            raise RuntimeError("boom")
+        stem = url.rsplit("/", 1)[-1]
+        return tmp_path / f"{stem}.pdf", tmp_path / f"{stem}.md", f"{url}.pdf", "text"
+
+    summarized = []
+
+    def fake_summarize(url, pdf_path, md_path, pdf_url, text, **kwargs):
+        summarized.append((url, kwargs["provider"]))
+        return md_path, pdf_url, url, text
+
+    monkeypatch.setattr(svc, "_fetch_paper", fake_fetch)
+    monkeypatch.setattr(svc, "_summarize_paper", fake_summarize)
+
+    links = ["https://x/a", "https://x/bad", "https://x/c"]
+    produced = svc._run_pipeline(  # type: ignore[attr-defined]
+        links, download_workers=4, summary_workers=2, provider="deepseek"
+    )
+
+    assert produced == [
+        (tmp_path / "a.md", "https://x/a.pdf", "https://x/a", "text"),
+        (None, None, None, None),
+        (tmp_path / "c.md", "https://x/c.pdf", "https://x/c", "text"),
+    ]
+    assert sorted(summarized) == [("https://x/a", "deepseek"), ("https://x/c", "deepseek")]
+
+
 def test_collect_local_links_prefers_markdown_over_pdfs(monkeypatch, tmp_path: Path):
     # Create dummy project structure for ps paths
     class DummyPS:
@@ -230,3 +312,101 @@ def test_tags_only_run(monkeypatch, tmp_path: Path):
     assert total == 2 and updated == 1
     data = __import__('json').loads((tmp_path / "2507.22222.tags.json").read_text(encoding="utf-8"))
     assert data.get("tags") == ["t1", "t2"]
+
+
+def test_fetch_paper_threads_session(monkeypatch, tmp_path: Path):
+    seen = []
+    session = object()
+
+    class DummyPS:
+        @staticmethod
+        def resolve_pdf_url(url, session=None):
+            seen.append(("resolve", session))
+            return url + ".pdf"
+
+        @staticmethod
+        def download_pdf(url, session=None, skip_download=False):
+            seen.append(("download", session))
+            return tmp_path / "x.pdf"
+
+        @staticmethod
+        def extract_markdown(pdf_path):
+            p = tmp_path / "x.md"
+            p.write_text("text", encoding="utf-8")
+            return p
+
+        read_markdown = staticmethod(paper_summarizer.read_markdown)
+
+    monkeypatch.setattr(svc, "ps", DummyPS)
+    pdf_path, md_path, pdf_url, text = svc._fetch_paper("https://x/y", session=session)  # type: ignore[attr-defined]
+    assert (pdf_url, text) == ("https://x/y.pdf", "text")
+    assert seen == [("resolve", session), ("download", session)]
+
+
+def test_feed_validators_saved_only_after_clean_run(monkeypatch, tmp_path: Path):
+    import collect_hf_paper_links_from_rss as collect
+
+    monkeypatch.setattr(collect, "RSS_META_PATH", tmp_path / ".rss_meta.json")
+    rss = (
+        b'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        b"<item><link>https://huggingface.co/papers/2506.00001</link></item>"
+        b"<item><link>https://huggingface.co/papers/2506.00002</link></item>"
+        b"</channel></rss>"
+    )
+    sent = []
+
+    class FakeResponse:
+        status_code = 200
+        headers = {"ETag": '"v1"'}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            yield rss
+
+    def fake_get(url, stream=False, timeout=None, headers=None):
+        sent.append(headers)
+        return FakeResponse()
+
+    monkeypatch.setattr(collect.requests, "get", fake_get)
+    monkeypatch.setattr(svc, "_setup_logging", lambda debug: None)
+    monkeypatch.setattr(svc, "_cleanup_corrupted_pdfs", lambda: None)
+
+    pipeline_modes = []
+
+    def run(ok_count, extract_only=False):
+        def fake_pipeline(links, **kwargs):
+            pipeline_modes.append(kwargs["extract_only"])
+            return [
+                (tmp_path / f"{i}.md", link, "", "summary") if i < ok_count else (None, link, "", None)
+                for i, link in enumerate(links)
+            ]
+        monkeypatch.setattr(svc, "_run_pipeline", fake_pipeline)
+        argv = ["https://example.com/rss.xml", "--output", str(tmp_path / "out.md"),
+                "--output_rss_path", str(tmp_path / "feed.xml")]
+        svc.main(argv + (["--extract-only"] if extract_only else []))
+
+    # an extract-only run neither sends nor saves validators, so the
+    # following normal run still summarizes the extracted papers
+    run(ok_count=2, extract_only=True)
+    assert not collect.RSS_META_PATH.exists()
+
+    # one paper fails: validators must not be persisted
+    run(ok_count=1)
+    assert not collect.RSS_META_PATH.exists()
+
+    # the rerun refetches unconditionally and, once clean, saves the ETag
+    run(ok_count=2)
+    assert not any(sent)  # no If-None-Match yet
+    assert pipeline_modes == [True, False, False]
+    assert collect._load_rss_meta() == {"https://example.com/rss.xml": {"ETag": '"v1"'}}
+
+    run(ok_count=2)
+    assert sent[-1] == {"If-None-Match": '"v1"'}
@@ -1,6 +1,7 @@
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*Swig.*")
 
+import os
 import pytest
 from pathlib import Path
 
@@ -51,6 +52,10 @@ class DummyBar:
 def test_build_session_no_proxy():
     session = build_session(None)
     assert session.proxies == {}
+    # download_pdf owns retries; the adapter must not add a second layer
+    adapter = session.get_adapter('https://arxiv.org')
+    assert adapter.max_retries.total == 0
+    assert adapter._pool_maxsize == paper_summarizer.HTTP_POOL_SIZE
 
 
 def test_build_session_with_proxy():
@@ -70,7 +75,24 @@ def test_resolve_pdf_url_huggingface():
     assert resolve_pdf_url(hf) == expected
 
 
-def test_resolve_pdf_url_scrape(monkeypatch):
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://tldr.takara.ai/p/2506.00001", "https://arxiv.org/pdf/2506.00001.pdf"),
+        ("https://arxiv.org/abs/2506.00001v2", "https://arxiv.org/pdf/2506.00001v2.pdf"),
+        ("http://arxiv.org/pdf/2506.00001", "https://arxiv.org/pdf/2506.00001.pdf"),
+    ],
+)
+def test_resolve_pdf_url_known_hosts_skip_network(url, expected):
+    class NoNetwork:
+        def get(self, *a, **kw):
+            raise AssertionError("known hosts must not be fetched")
+
+    assert resolve_pdf_url(url, session=NoNetwork()) == expected
+
+
+def test_resolve_pdf_url_scrape(monkeypatch, tmp_path):
+    monkeypatch.setattr(paper_summarizer, 'URL_CACHE_PATH', tmp_path / 'url_cache.json')
     html = '<html><body><a href="file.pdf">PDF</a></body></html>'
     class FakeSession:
         def get(self, url, timeout):
@@ -78,12 +100,52 @@ def test_resolve_pdf_url_scrape(monkeypatch):
                 def raise_for_status(self): pass
                 @property
                 def text(self): return html
+                @property
+                def content(self): return html.encode('utf-8')
             return R()
 
     pdf = resolve_pdf_url('http://foo.com', session=FakeSession())
     assert pdf == 'http://foo.com/file.pdf'
 
 
+def test_resolve_pdf_url_scrape_unquoted_href_falls_back(monkeypatch, tmp_path):
+    monkeypatch.setattr(paper_summarizer, 'URL_CACHE_PATH', tmp_path / 'url_cache.json')
+    html = '<html><body><a href=paper.PDF>PDF</a></body></html>'
+    class FakeSession:
+        def get(self, url, timeout):
+            class R:
+                def raise_for_status(self): pass
+                @property
+                def text(self): return html
+                @property
+                def content(self): return html.encode('utf-8')
+            return R()
+
+    pdf = resolve_pdf_url('http://foo.com/abs/', session=FakeSession())
+    assert pdf == 'http://foo.com/abs/paper.PDF'
+
+
+def test_resolve_pdf_url_uses_persistent_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(paper_summarizer, 'URL_CACHE_PATH', tmp_path / 'url_cache.json')
+    calls = []
+    class FakeSession:
+        def get(self, url, timeout):
+            calls.append(url)
+            class R:
+                def raise_for_status(self): pass
+                @property
+                def text(self): return '<a href="/paper.pdf">PDF</a>'
+                @property
+                def content(self): return b'<a href="/paper.pdf">PDF</a>'
+            return R()
+
+    first = resolve_pdf_url('http://bar.com/abs/1', session=FakeSession())
+    second = resolve_pdf_url('http://bar.com/abs/1', session=FakeSession())
+    assert first == second == 'http://bar.com/paper.pdf'
+    assert calls == ['http://bar.com/abs/1']
+    assert (tmp_path / 'url_cache.json').exists()
+
+
 def test_download_pdf(tmp_path, monkeypatch):
     content = b'data'
     fake_session = type('S', (), {'get': lambda self, url, stream, timeout: FakeResponse(content)})()
@@ -112,6 +174,53 @@ def test_extract_markdown(tmp_path, monkeypatch):
     assert md2 == md
 
 
+def test_to_markdown_parallel_joins_page_ranges_in_order(tmp_path, monkeypatch):
+    fitz = pytest.importorskip('pymupdf')
+    pdf = tmp_path / 'long.pdf'
+    doc = fitz.open()
+    for _ in range(16):
+        doc.new_page()
+    doc.save(str(pdf))
+    doc.close()
+
+    class InlinePool:
+        def map(self, fn, *iterables):
+            return map(fn, *iterables)
+
+    monkeypatch.setattr(paper_summarizer, 'EXTRACT_WORKERS', 2)
+    monkeypatch.setattr(paper_summarizer, '_get_extract_pool', lambda: InlinePool())
+    monkeypatch.setattr(pymupdf4llm, 'to_markdown', lambda p, pages=None: f'[{pages[0]}-{pages[-1]}]')
+
+    assert paper_summarizer._to_markdown_parallel(pdf) == '[0-7][8-15]'
+
+
+def test_to_markdown_parallel_runs_short_docs_in_pool(tmp_path, monkeypatch):
+    calls = []
+
+    class InlinePool:
+        def map(self, fn, *iterables):
+            calls.append(list(zip(*iterables)))
+            return map(fn, *iterables)
+
+    monkeypatch.setattr(paper_summarizer, 'EXTRACT_WORKERS', 2)
+    monkeypatch.setattr(paper_summarizer, '_get_extract_pool', lambda: InlinePool())
+    monkeypatch.setattr(pymupdf4llm, 'to_markdown', lambda p, pages=None: f'whole:{pages}')
+
+    pdf = tmp_path / 'short.pdf'
+    assert paper_summarizer._to_markdown_parallel(pdf) == 'whole:None'
+    assert calls == [[(str(pdf), None)]]
+
+
+def test_read_markdown(tmp_path):
+    md = tmp_path / 'a.md'
+    md.write_text('# Título\n\nbody', encoding='utf-8')
+    assert paper_summarizer.read_markdown(md) == '# Título\n\nbody'
+
+    empty = tmp_path / 'empty.md'
+    empty.write_bytes(b'')
+    assert paper_summarizer.read_markdown(empty) == ''
+
+
 def test_chunk_text():
     text = 'abcdefghij'
     chunks = chunk_text(text, max_chars=4, overlap_ratio=0.5)
@@ -125,10 +234,47 @@ def test_llm_invoke(monkeypatch):
         def invoke(self, messages): return AIMessage(content='resp')
 
     monkeypatch.setattr(paper_summarizer, 'ChatDeepSeek', DummyLLM)
+    paper_summarizer._get_deepseek_llm.cache_clear()
     msg = HumanMessage(content='hi')
     resp = llm_invoke([msg], api_key='key', base_url=None)
     assert isinstance(resp, AIMessage)
     assert resp.content == 'resp'
+    paper_summarizer._get_deepseek_llm.cache_clear()
+
+
+def test_llm_invoke_reuses_deepseek_client(monkeypatch):
+    created = []
+    class DummyLLM:
+        def __init__(self, **kwargs): created.append(kwargs)
+        def invoke(self, messages): return AIMessage(content='resp')
+
+    monkeypatch.setattr(paper_summarizer, 'ChatDeepSeek', DummyLLM)
+    paper_summarizer._get_deepseek_llm.cache_clear()
+    for _ in range(3):
+        llm_invoke([HumanMessage(content='hi')], api_key='key')
+    llm_invoke([HumanMessage(content='hi')], api_key='other-key')
+    assert [c['api_key'] for c in created] == ['key', 'other-key']
+    paper_summarizer._get_deepseek_llm.cache_clear()
+
+
+@pytest.mark.parametrize('provider, factory, cls_name', [
+    ('openai', '_get_openai_llm', 'ChatOpenAI'),
+    ('ollama', '_get_ollama_llm', 'OllamaLLM'),
+])
+def test_llm_invoke_reuses_openai_and_ollama_clients(monkeypatch, provider, factory, cls_name):
+    created = []
+    class DummyLLM:
+        def __init__(self, **kwargs): created.append(kwargs)
+        # Ollama is a plain LLM: prompt string in, string out
+        def invoke(self, prompt): return 'resp' if isinstance(prompt, str) else AIMessage(content='resp')
+
+    monkeypatch.setattr(paper_summarizer, cls_name, DummyLLM)
+    getattr(paper_summarizer, factory).cache_clear()
+    for _ in range(3):
+        llm_invoke([HumanMessage(content='hi')], api_key='key', provider=provider, model='m1')
+    llm_invoke([HumanMessage(content='hi')], api_key='key', provider=provider, model='m2')
+    assert [c['model'] for c in created] == ['m1', 'm2']
+    getattr(paper_summarizer, factory).cache_clear()
 
 
 def test_progressive_summary(monkeypatch, tmp_path):
@@ -140,14 +286,313 @@ def test_progressive_summary(monkeypatch, tmp_path):
             return AIMessage(content='FINAL')
         return AIMessage(content='CHUNK')
 
+    async def fake_allm(messages, api_key=None, **kwargs):
+        return fake_llm(messages, api_key=api_key, **kwargs)
+
     monkeypatch.setattr(paper_summarizer, 'llm_invoke', fake_llm)
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
     # ensure no existing cache
     debug_dir = Path(get_debug_log_path())
     if debug_dir.exists():
         for f in debug_dir.iterdir(): f.unlink()
 
-    summary, chunks_summary = progressive_summary(['a', 'b'], summary_path=tmp_path/'summary.md', chunk_summary_path=tmp_path/'chunks.md', api_key='key', base_url=None, max_workers=1)
+    summary, chunks_summary = progressive_summary(['a', 'b'], summary_path=tmp_path/'summary.md', chunk_summary_path=tmp_path/'chunks.md', api_key='key', base_url=None, max_workers=1, batch_size=1)
     assert summary == 'FINAL'
     assert chunks_summary == '\n\n'.join(['CHUNK'] * 2)
     # two chunk calls + one final
     assert len(calls) == 3
+
+
+def test_progressive_summary_reuses_cached_chunks(monkeypatch, tmp_path):
+    calls = []
+    def fake_llm(messages, api_key=None, **kwargs):
+        calls.append(messages)
+        if isinstance(messages[0], AIMessage):
+            return AIMessage(content='FINAL')
+        return AIMessage(content='CHUNK')
+
+    async def fake_allm(messages, api_key=None, **kwargs):
+        return fake_llm(messages, api_key=api_key, **kwargs)
+
+    monkeypatch.setattr(paper_summarizer, 'llm_invoke', fake_llm)
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+
+    progressive_summary(['a', 'b'], summary_path=tmp_path/'s1.md', chunk_summary_path=tmp_path/'c1.md', api_key='key', max_workers=1, batch_size=1)
+    assert len(calls) == 3
+    # a second paper sharing chunk 'a' only pays for the new chunk + final pass
+    _, chunks_summary = progressive_summary(['a', 'c'], summary_path=tmp_path/'s2.md', chunk_summary_path=tmp_path/'c2.md', api_key='key', max_workers=1, batch_size=1)
+    assert len(calls) == 5
+    assert chunks_summary == 'CHUNK\n\nCHUNK'
+
+
+def test_chunk_cache_key_tracks_resolved_model_and_endpoint(monkeypatch):
+    key = paper_summarizer._chunk_cache_key
+    monkeypatch.setenv('OLLAMA_MODEL', 'qwen3:8b')
+    before = key('c', 'tmpl', 'ollama', None)
+    # the env default and the same model passed explicitly share entries
+    assert before == key('c', 'tmpl', 'ollama', 'qwen3:8b')
+    monkeypatch.setenv('OLLAMA_MODEL', 'llama3:8b')
+    assert key('c', 'tmpl', 'ollama', None) != before
+    assert key('c', 'tmpl', 'ollama', 'qwen3:8b', 'http://gpu-box:11434') != before
+
+    monkeypatch.setenv('OPENAI_MODEL', 'gpt-4o')
+    openai_key = key('c', 'tmpl', 'openai', None)
+    monkeypatch.setenv('OPENAI_MODEL', 'gpt-4o-mini')
+    assert key('c', 'tmpl', 'openai', None) != openai_key
+
+
+def test_progressive_summary_resumes_after_partial_failure(monkeypatch, tmp_path):
+    calls = []
+    fail = {'on': True}
+
+    async def fake_allm(messages, api_key=None, **kwargs):
+        chunk = messages[0].content
+        calls.append(chunk)
+        if fail['on'] and '@B@' in chunk:
+            raise RuntimeError('connection reset')
+        return AIMessage(content='S' + ('@A@' if '@A@' in chunk else '@B@'))
+
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'llm_invoke', lambda messages, **kw: AIMessage(content='FINAL'))
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+    kwargs = dict(summary_path=tmp_path/'s.md', chunk_summary_path=tmp_path/'c.md', api_key='key', max_workers=1, batch_size=1)
+
+    with pytest.raises(RuntimeError):
+        progressive_summary(['@A@', '@B@'], **kwargs)
+    fail['on'] = False
+    calls.clear()
+    _, chunks_summary = progressive_summary(['@A@', '@B@'], **kwargs)
+    # the chunk finished before the crash is read back from disk
+    assert len(calls) == 1 and '@B@' in calls[0]
+    assert chunks_summary == 'S@A@\n\nS@B@'
+
+
+def test_progressive_summary_runs_chunks_concurrently(monkeypatch, tmp_path):
+    import asyncio
+    in_flight = []
+    peak = []
+
+    async def fake_allm(messages, api_key=None, **kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        prompt = messages[0].content
+        tag = next(t for t in ('@W@', '@X@', '@Y@', '@Z@') if t in prompt)
+        # later chunks finish first
+        await asyncio.sleep({'@W@': 0.04, '@X@': 0.03, '@Y@': 0.02, '@Z@': 0.01}[tag])
+        in_flight.pop()
+        return AIMessage(content=tag)
+
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'llm_invoke', lambda messages, **kw: AIMessage(content='FINAL'))
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+
+    summary, chunks_summary = progressive_summary(
+        ['@W@', '@X@', '@Y@', '@Z@'], summary_path=tmp_path/'s.md', chunk_summary_path=tmp_path/'c.md', api_key='key', max_workers=3, batch_size=1
+    )
+    assert summary == 'FINAL'
+    # order follows the chunks, not completion order
+    assert chunks_summary.split('\n\n') == ['@W@', '@X@', '@Y@', '@Z@']
+    assert max(peak) == 3
+
+
+def test_progressive_summary_batches_chunks(monkeypatch, tmp_path):
+    import json
+    prompts = []
+
+    async def fake_allm(messages, api_key=None, **kwargs):
+        prompt = messages[0].content
+        prompts.append(prompt)
+        sections = [t for t in ('@A@', '@B@', '@C@') if t in prompt]
+        if '<<<SEC' not in prompt:
+            return AIMessage(content=f'S{sections[0]}')
+        return AIMessage(content='```json\n' + json.dumps({'summaries': [f'S{t}' for t in sections]}) + '\n```')
+
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'llm_invoke', lambda messages, **kw: AIMessage(content='FINAL'))
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+
+    _, chunks_summary = progressive_summary(
+        ['@A@', '@B@', '@C@'], summary_path=tmp_path/'s.md', chunk_summary_path=tmp_path/'c.md', api_key='key', batch_size=2
+    )
+    # one batched request for A+B, a plain single-chunk request for C
+    assert len(prompts) == 2
+    assert '<<<SEC 2>>>' in prompts[0] or '<<<SEC 2>>>' in prompts[1]
+    assert chunks_summary.split('\n\n') == ['S@A@', 'S@B@', 'S@C@']
+
+
+def test_batched_chunk_results_are_keyed_by_batch_template(monkeypatch, tmp_path):
+    import json
+    prompts = []
+
+    async def fake_allm(messages, api_key=None, **kwargs):
+        prompt = messages[0].content
+        prompts.append(prompt)
+        sections = [t for t in ('@A@', '@B@') if t in prompt]
+        return AIMessage(content=json.dumps({'summaries': [f'S{t}' for t in sections]}))
+
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'llm_invoke', lambda messages, **kw: AIMessage(content='FINAL'))
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+
+    def run(n):
+        return progressive_summary(
+            ['@A@', '@B@'], summary_path=tmp_path/f's{n}.md', chunk_summary_path=tmp_path/f'c{n}.md', api_key='key', batch_size=2
+        )
+
+    run(1)
+    assert len(prompts) == 1
+    key_args = ('@A@', paper_summarizer._CHUNK_BATCH_PROMPT.template, paper_summarizer.DEFAULT_LLM_PROVIDER, None)
+    assert paper_summarizer._chunk_cache_get(paper_summarizer._chunk_cache_key(*key_args)) == 'S@A@'
+    # stored under the batch template, not the single-chunk one
+    single_args = ('@A@', paper_summarizer._CHUNK_PROMPT.template, paper_summarizer.DEFAULT_LLM_PROVIDER, None)
+    assert paper_summarizer._chunk_cache_get(paper_summarizer._chunk_cache_key(*single_args)) is None
+
+    run(2)
+    assert len(prompts) == 1  # cache hit
+    # editing the batch prompt invalidates batched results
+    edited = paper_summarizer.PromptTemplate.from_template(paper_summarizer._CHUNK_BATCH_PROMPT.template + '\n')
+    monkeypatch.setattr(paper_summarizer, '_CHUNK_BATCH_PROMPT', edited)
+    run(3)
+    assert len(prompts) == 2
+
+
+def test_progressive_summary_batch_falls_back_per_chunk(monkeypatch, tmp_path):
+    prompts = []
+
+    async def fake_allm(messages, api_key=None, **kwargs):
+        prompt = messages[0].content
+        prompts.append(prompt)
+        if '<<<SEC' in prompt:
+            return AIMessage(content='not json at all')
+        return AIMessage(content='ONE')
+
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'llm_invoke', lambda messages, **kw: AIMessage(content='FINAL'))
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+
+    _, chunks_summary = progressive_summary(
+        ['x', 'y'], summary_path=tmp_path/'s.md', chunk_summary_path=tmp_path/'c.md', api_key='key', batch_size=2
+    )
+    assert len(prompts) == 3
+    assert chunks_summary == 'ONE\n\nONE'
+
+
+def test_progressive_summary_retries_empty_and_dedupes_chunks(monkeypatch, tmp_path):
+    import asyncio
+    replies = {'dup': ['', 'DUP'], 'other': ['OTHER']}
+    seen = []
+
+    async def fake_allm(messages, api_key=None, **kwargs):
+        key = 'dup' if 'dup' in messages[0].content else 'other'
+        seen.append(key)
+        return AIMessage(content=replies[key].pop(0))
+
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'llm_invoke', lambda messages, **kw: AIMessage(content='FINAL'))
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+    monkeypatch.setattr(paper_summarizer.asyncio, 'sleep', no_sleep)
+
+    _, chunks_summary = progressive_summary(
+        ['dup', 'other', 'dup'], summary_path=tmp_path/'s.md', chunk_summary_path=tmp_path/'c.md', api_key='key', batch_size=1
+    )
+    assert sorted(seen) == ['dup', 'dup', 'other']
+    assert chunks_summary.split('\n\n') == ['DUP', 'OTHER', 'DUP']
+
+
+def test_progressive_summary_raises_after_repeated_empty_replies(monkeypatch, tmp_path):
+    async def fake_allm(messages, api_key=None, **kwargs):
+        return AIMessage(content='  ')
+
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+    monkeypatch.setattr(paper_summarizer.asyncio, 'sleep', no_sleep)
+
+    with pytest.raises(RuntimeError, match='empty summary'):
+        progressive_summary(['a'], summary_path=tmp_path/'s.md', chunk_summary_path=tmp_path/'c.md', api_key='key', batch_size=1)
+    assert not (tmp_path / 'chunk_cache').exists() or not any((tmp_path / 'chunk_cache').rglob('*.*'))
+
+
+def test_progressive_summary_failure_cancels_sibling_batches(monkeypatch, tmp_path):
+    import asyncio
+    cancelled = []
+
+    async def fake_allm(messages, api_key=None, **kwargs):
+        if 'bad' in messages[0].content:
+            raise ValueError('boom')
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return AIMessage(content='never')
+
+    monkeypatch.setattr(paper_summarizer, 'allm_invoke', fake_allm)
+    monkeypatch.setattr(paper_summarizer, 'CHUNK_CACHE_DIR', tmp_path / 'chunk_cache')
+
+    with pytest.raises(ValueError, match='boom'):
+        progressive_summary(['slow', 'bad'], summary_path=tmp_path/'s.md', chunk_summary_path=tmp_path/'c.md',
+                            api_key='key', batch_size=1)
+    # the slow batch is torn down before progressive_summary returns
+    assert cancelled == [True]
+
+
+def test_chunk_text_edges():
+    assert chunk_text('') == []
+    assert chunk_text('abc', max_chars=10) == ['abc']
+    # short text is returned as-is, not copied
+    short = 'x' * 10
+    assert chunk_text(short, max_chars=10)[0] is short
+    # last chunk ends exactly at the text end, no trailing overlap-only chunk
+    assert chunk_text('abcdef', max_chars=4, overlap_ratio=0.5) == ['abcd', 'cdef']
+
+
+def test_process_one_threads_session_and_writes_outputs(tmp_path, monkeypatch):
+    session = object()
+    seen = []
+    pdf = tmp_path / '2501.00001.pdf'
+    md = tmp_path / '2501.00001.md'
+    md.write_text('paper text', encoding='utf-8')
+
+    monkeypatch.setattr(paper_summarizer, 'SUMMARY_DIR', tmp_path / 'summary')
+    monkeypatch.setattr(paper_summarizer, 'CHUNKS_SUMMARY_DIR', tmp_path / 'chunks')
+    (tmp_path / 'summary').mkdir()
+    (tmp_path / 'chunks').mkdir()
+    # rewriting an existing summary must bump the directory mtime the web UI
+    # keys its entries cache on
+    (tmp_path / 'summary' / '2501.00001.md').write_text('OLD', encoding='utf-8')
+    os.utime(tmp_path / 'summary', ns=(0, 0))
+    monkeypatch.setattr(paper_summarizer, 'resolve_pdf_url',
+                        lambda url, session=None: seen.append(session) or 'https://x/2501.00001.pdf')
+    monkeypatch.setattr(paper_summarizer, 'download_pdf', lambda url, session=None: seen.append(session) or pdf)
+    monkeypatch.setattr(paper_summarizer, 'extract_markdown', lambda p: md)
+    monkeypatch.setattr(paper_summarizer, 'progressive_summary', lambda chunks, **kw: ('FINAL', 'CHUNKS'))
+
+    out = paper_summarizer.process_one('https://x/abs/2501.00001', session=session)
+
+    assert seen == [session, session]
+    assert out == tmp_path / 'summary' / '2501.00001.md'
+    assert out.read_text(encoding='utf-8') == 'FINAL'
+    assert (tmp_path / 'chunks' / '2501.00001.md').read_text(encoding='utf-8') == 'CHUNKS'
+    assert (tmp_path / 'summary').stat().st_mtime_ns > 0
+    assert [p.name for p in (tmp_path / 'summary').iterdir()] == ['2501.00001.md']
+
+
+def test_read_urls_skips_blanks_and_comments(tmp_path):
+    urls = tmp_path / 'urls.txt'
+    urls.write_text('# batch\nhttps://a\n\n  https://b  \n', encoding='utf-8')
+    assert paper_summarizer._read_urls(str(urls)) == ['https://a', 'https://b']
+
+
+def test_generate_tags_from_summary_parses_fenced_json(monkeypatch):
+    raw = '```json\n{"tags": ["Large  Language Models", "RLHF", ""], "top": ["LLM", "biology"]}\n```'
+    monkeypatch.setattr(paper_summarizer, 'llm_invoke', lambda messages, **kw: AIMessage(content=raw))
+    tags = paper_summarizer.generate_tags_from_summary('summary', api_key='key')
+    assert tags == {'top': ['llm'], 'tags': ['large language models', 'rlhf', 'large']}
@@ -2,14 +2,90 @@
 Test cases for RSS bugs in the feed service.
 """
 
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - lxml ships with feedgen
+    import xml.etree.ElementTree as ET
+import io
+from collections import deque, namedtuple
 from pathlib import Path
-import tempfile
-import os
 import pytest
 from feedgen.feed import FeedGenerator
 
 
+################################################################################
+# Sample feeds
+################################################################################
+
+# Single item, as in the bug-2 report
+ONE_ITEM_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Test Feed</title>
+        <link>https://example.com</link>
+        <description>Test Description</description>
+        <item>
+            <title>Paper 1</title>
+            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
+            <description>Summary 1</description>
+        </item>
+    </channel>
+</rss>"""
+
+# Single item carrying the metadata the bug-5 parser drops
+ONE_ITEM_WITH_METADATA_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Test Feed</title>
+        <link>https://example.com</link>
+        <description>Test Description</description>
+        <item>
+            <title>Paper Title</title>
+            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
+            <description>Paper description</description>
+            <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
+        </item>
+    </channel>
+</rss>"""
+
+# Feed before an incremental update
+INITIAL_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Research Paper Summaries</title>
+        <link>https://example.com</link>
+        <description>Summaries of research papers</description>
+        <item>
+            <title>Initial Paper</title>
+            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
+            <description>Initial summary</description>
+        </item>
+    </channel>
+</rss>"""
+
+# Two-item feed shaped like the service's output
+SAMPLE_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Research Paper Summaries</title>
+        <link>https://example.com</link>
+        <description>Summaries of research papers</description>
+        <item>
+            <title>Paper Title 1</title>
+            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
+            <description>Summary content 1</description>
+            <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
+        </item>
+        <item>
+            <title>Paper Title 2</title>
+            <link>https://arxiv.org/pdf/2506.00002.pdf</link>
+            <description>Summary content 2</description>
+            <pubDate>Mon, 02 Jan 2024 00:00:00 GMT</pubDate>
+        </item>
+    </channel>
+</rss>"""
+
+
 ################################################################################
 # RSS Bug Tests
 ################################################################################
@@ -35,68 +111,41 @@ def test_rss_bug_1_incremental_update_failure():
 
 def test_rss_bug_2_rss_building_failure():
     """Test Bug 2: RSS building failure due to incomplete entry handling."""
-    # Create a temporary RSS file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
-        f.write("""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-    <channel>
-        <title>Test Feed</title>
-        <link>https://example.com</link>
-        <description>Test Description</description>
-        <item>
-            <title>Paper 1</title>
-            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
-            <description>Summary 1</description>
-        </item>
-    </channel>
-</rss>""")
-        temp_file = f.name
-    
-    try:
-        # Test the RSS parsing logic that's used in the main function
-        existing_entries = []
-        assert os.path.exists(temp_file)
-        
-        tree = ET.parse(temp_file)
-        root = tree.getroot()
-        
-        # Extract existing RSS entries (items)
-        for item in root.findall(".//item"):
-            paper_url = item.find("link").text
-            existing_entries.append(paper_url)
-        
-        assert len(existing_entries) == 1
-        assert existing_entries[0] == "https://arxiv.org/pdf/2506.00001.pdf"
-        
-        # The bug: we only extract URLs but lose the actual RSS entry objects
-        # This makes it impossible to properly merge with new entries
-        # The test confirms that only URLs are extracted, not full RSS entry objects
-        assert all(isinstance(entry, str) for entry in existing_entries)
-        
-    finally:
-        os.unlink(temp_file)
+    # Test the RSS parsing logic that's used in the main function
+    existing_entries = []
+    # Extract existing RSS entries (items), streaming one <item> at a time
+    for _, item in ET.iterparse(io.BytesIO(ONE_ITEM_RSS), events=("end",)):
+        if item.tag != "item":
+            continue
+        existing_entries.append(item.findtext("link"))
+        item.clear()
+    
+    assert len(existing_entries) == 1
+    assert existing_entries[0] == "https://arxiv.org/pdf/2506.00001.pdf"
+    
+    # The bug: we only extract URLs but lose the actual RSS entry objects
+    # This makes it impossible to properly merge with new entries
+    # The test confirms that only URLs are extracted, not full RSS entry objects
+    assert all(isinstance(entry, str) for entry in existing_entries)
 
 
-def test_rss_bug_3_data_structure_inconsistency():
+@pytest.mark.parametrize(
+    "success, expected_subject",
+    [
+        (("summary1.md", "url1"), "Unknown"),  # Missing paper_subject
+        (("summary2.md", "url2", "Paper Title 2"), "Paper Title 2"),  # Has paper_subject
+    ],
+    ids=["path-url", "path-url-subject"],
+)
+def test_rss_bug_3_data_structure_inconsistency(success, expected_subject):
     """Test Bug 3: Data structure inconsistency in successes list."""
     # The successes list structure is inconsistent in the code
     # Sometimes it's (Path, str) and sometimes it's (Path, str, str)
     
-    successes_path1 = [("summary1.md", "url1")]  # Missing paper_subject
-    successes_path2 = [("summary2.md", "url2", "Paper Title 2")]  # Has paper_subject
-    
-    assert len(successes_path1[0]) == 2
-    assert len(successes_path2[0]) == 3
-    
     # The bug: the code assumes all items have 3 elements but some only have 2
-    for i, (path, paper_url, *rest) in enumerate(successes_path1):
-        paper_subject = rest[0] if rest else "Unknown"
-        assert paper_subject == "Unknown"
-        # This confirms the inconsistent data structure causes missing paper_subject
-    
-    for i, (path, paper_url, *rest) in enumerate(successes_path2):
-        paper_subject = rest[0] if rest else "Unknown"
-        assert paper_subject == "Paper Title 2"
+    path, paper_url, *rest = success
+    paper_subject = rest[0] if rest else "Unknown"
+    assert paper_subject == expected_subject
 
 
 def test_rss_bug_4_feed_generator_entry_type_mismatch():
@@ -131,67 +180,69 @@ def test_rss_bug_4_feed_generator_entry_type_mismatch():
 
 def test_rss_bug_5_rss_parsing_incomplete():
     """Test Bug 5: RSS parsing only extracts URLs, losing metadata."""
-    rss_content = """<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-    <channel>
-        <title>Test Feed</title>
-        <link>https://example.com</link>
-        <description>Test Description</description>
-        <item>
-            <title>Paper Title</title>
-            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
-            <description>Paper description</description>
-            <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
-        </item>
-    </channel>
-</rss>"""
+    root = ET.fromstring(ONE_ITEM_WITH_METADATA_RSS)
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
-        f.write(rss_content)
-        temp_file = f.name
+    # Current buggy approach: only extract URLs
+    urls_only = []
+    for item in root.findall(".//item"):
+        url = item.findtext("link")
+        urls_only.append(url)
     
-    try:
-        tree = ET.parse(temp_file)
-        root = tree.getroot()
-        
-        # Current buggy approach: only extract URLs
-        urls_only = []
-        for item in root.findall(".//item"):
-            url = item.find("link").text
-            urls_only.append(url)
-        
-        assert len(urls_only) == 1
-        assert urls_only[0] == "https://arxiv.org/pdf/2506.00001.pdf"
-        
-        # What we're losing: title, description, pubDate
-        for item in root.findall(".//item"):
-            title = item.find("title").text
-            description = item.find("description").text
-            pub_date = item.find("pubDate").text
-            
-            assert title == "Paper Title"
-            assert description == "Paper description"
-            assert pub_date == "Mon, 01 Jan 2024 00:00:00 GMT"
-        
-        # The bug: we only preserve URLs, losing all other RSS metadata
-        # This makes it impossible to properly reconstruct RSS entries
+    assert len(urls_only) == 1
+    assert urls_only[0] == "https://arxiv.org/pdf/2506.00001.pdf"
+    
+    # What we're losing: title, description, pubDate
+    for item in root.findall(".//item"):
+        title = item.findtext("title")
+        description = item.findtext("description")
+        pub_date = item.findtext("pubDate")
         
-    finally:
-        os.unlink(temp_file)
+        assert title == "Paper Title"
+        assert description == "Paper description"
+        assert pub_date == "Mon, 01 Jan 2024 00:00:00 GMT"
+    
+    # The bug: we only preserve URLs, losing all other RSS metadata
+    # This makes it impossible to properly reconstruct RSS entries
 
 
 ################################################################################
 # RSS Generation and Merging Tests
 ################################################################################
 
-def test_rss_generation_basic():
+RssItem = namedtuple("RssItem", "title link description pub_date")
+
+
+@pytest.fixture(scope="module")
+def sample_rss_root():
+    return ET.fromstring(SAMPLE_RSS)
+
+
+@pytest.fixture(scope="module")
+def summary_dir(tmp_path_factory):
+    """Summary files shared read-only by the tests in this module."""
+    d = tmp_path_factory.mktemp("summary")
+    (d / "2506.00001.md").write_text("## Paper Title 1\n\nSummary content 1", encoding="utf-8")
+    (d / "2506.00002.md").write_text("## Paper Title 2\n\nSummary content 2", encoding="utf-8")
+    return d
+
+
+@pytest.fixture(scope="session")
+def fg_factory():
+    """Return a callable building a FeedGenerator with the service's channel header."""
+    def make():
+        fg = FeedGenerator()
+        fg.title('Research Paper Summaries')
+        fg.link(href='https://example.com')
+        fg.description('Summaries of research papers')
+        return fg
+    return make
+
+
+def test_rss_generation_basic(fg_factory):
     """Test basic RSS file generation with mock content."""
     
     # Create a mock FeedGenerator
-    fg = FeedGenerator()
-    fg.title('Research Paper Summaries')
-    fg.link(href='https://example.com')
-    fg.description('Summaries of research papers')
+    fg = fg_factory()
     
     # Add mock entries
     entry1 = fg.add_entry()
@@ -205,10 +256,10 @@ def test_rss_generation_basic():
     entry2.description('<p>This is a test summary for paper 2</p>')
     
     # Verify entries were added correctly
-    assert len(fg.entry()) == 2
+    entries = fg.entry()
+    assert len(entries) == 2
     
     # Get all entries and verify they exist (order may vary)
-    entries = fg.entry()
     titles = [entry.title() for entry in entries]
     urls = [entry.link()[0]['href'] for entry in entries]
     
@@ -218,7 +269,7 @@ def test_rss_generation_basic():
     assert 'https://arxiv.org/pdf/2506.00002.pdf' in urls
     
     # Test RSS generation
-    rss_content = fg.rss_str(pretty=True).decode('utf-8')
+    rss_content = fg.rss_str().decode('utf-8')
     # Handle both single and double quotes in XML declaration
     assert '<?xml version=' in rss_content and 'encoding=' in rss_content
     assert '<rss' in rss_content and 'version="2.0"' in rss_content
@@ -229,344 +280,225 @@ def test_rss_generation_basic():
     assert 'https://arxiv.org/pdf/2506.00002.pdf' in rss_content
 
 
-def test_rss_merging_with_existing_file():
+def test_rss_merging_with_existing_file(fg_factory):
     """Test RSS merging when an existing RSS file exists."""
     
-    # Create a temporary existing RSS file
-    existing_rss_content = """<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-    <channel>
-        <title>Research Paper Summaries</title>
-        <link>https://example.com</link>
-        <description>Summaries of research papers</description>
-        <item>
-            <title>Existing Paper 1</title>
-            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
-            <description>Existing summary 1</description>
-        </item>
-        <item>
-            <title>Existing Paper 2</title>
-            <link>https://arxiv.org/pdf/2506.00002.pdf</link>
-            <description>Existing summary 2</description>
-        </item>
-    </channel>
-</rss>"""
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
-        f.write(existing_rss_content)
-        existing_rss_path = f.name
-    
-    try:
-        # Parse existing RSS to extract URLs (simulating the current logic)
-        existing_entries = []
-        tree = ET.parse(existing_rss_path)
-        root = tree.getroot()
-        
-        for item in root.findall(".//item"):
-            paper_url = item.find("link").text
-            existing_entries.append(paper_url)
-        
-        # Verify existing entries were extracted
-        assert len(existing_entries) == 2
-        assert "https://arxiv.org/pdf/2506.00001.pdf" in existing_entries
-        assert "https://arxiv.org/pdf/2506.00002.pdf" in existing_entries
-        
-        # Now simulate adding new entries
-        fg = FeedGenerator()
-        fg.title('Research Paper Summaries')
-        fg.link(href='https://example.com')
-        fg.description('Summaries of research papers')
-        
-        # Add new entry (not in existing)
-        new_entry = fg.add_entry()
-        new_entry.title('New Paper 3')
-        new_entry.link(href='https://arxiv.org/pdf/2506.00003.pdf')
-        new_entry.description('<p>New summary 3</p>')
-        
-        # Try to add existing entry (should be skipped)
-        duplicate_entry = fg.add_entry()
-        duplicate_entry.title('Existing Paper 1')
-        duplicate_entry.link(href='https://arxiv.org/pdf/2506.00001.pdf')
-        duplicate_entry.description('<p>Duplicate summary</p>')
-        
-        # Verify only new entry was added
-        assert len(fg.entry()) == 2  # 1 new + 1 duplicate
-        
-        # The current logic would add both, but the real logic should skip duplicates
-        # This test documents the current behavior
-        
-    finally:
-        os.unlink(existing_rss_path)
+    # Parse existing RSS to extract URLs (simulating the current logic)
+    existing_entries = set()
+    for _, item in ET.iterparse(io.BytesIO(SAMPLE_RSS), events=("end",)):
+        if item.tag != "item":
+            continue
+        existing_entries.add(item.findtext("link"))
+        item.clear()
+    
+    # Verify existing entries were extracted
+    assert len(existing_entries) == 2
+    assert "https://arxiv.org/pdf/2506.00001.pdf" in existing_entries
+    assert "https://arxiv.org/pdf/2506.00002.pdf" in existing_entries
+    
+    # Now simulate adding new entries
+    fg = fg_factory()
+    
+    # Add new entry (not in existing)
+    new_entry = fg.add_entry()
+    new_entry.title('New Paper 3')
+    new_entry.link(href='https://arxiv.org/pdf/2506.00003.pdf')
+    new_entry.description('<p>New summary 3</p>')
+    
+    # Try to add existing entry (should be skipped)
+    duplicate_entry = fg.add_entry()
+    duplicate_entry.title('Paper Title 1')
+    duplicate_entry.link(href='https://arxiv.org/pdf/2506.00001.pdf')
+    duplicate_entry.description('<p>Duplicate summary</p>')
+    
+    # Verify only new entry was added
+    assert len(fg.entry()) == 2  # 1 new + 1 duplicate
+    
+    # The current logic would add both, but the real logic should skip duplicates
+    # This test documents the current behavior
 
 
-def test_rss_merging_data_structure_handling():
+def test_rss_merging_data_structure_handling(fg_factory, summary_dir):
     """Test RSS merging with inconsistent data structures in successes list."""
     
-    # Create mock summary files with different data structures
-    with tempfile.TemporaryDirectory() as temp_dir:
-        summary_dir = Path(temp_dir) / "summary"
-        summary_dir.mkdir()
-        
-        # Create summary files
-        summary1_path = summary_dir / "2506.00001.md"
-        summary1_path.write_text("## Paper Title 1\n\nSummary content 1", encoding="utf-8")
-        
-        summary2_path = summary_dir / "2506.00002.md"
-        summary2_path.write_text("## Paper Title 2\n\nSummary content 2", encoding="utf-8")
-        
-        # Simulate the successes list with inconsistent structures
-        # Some items have 3 elements (path, url, subject), some have 2 (path, url)
-        successes = [
-            (summary1_path, "https://arxiv.org/pdf/2506.00001.pdf", "Paper Title 1"),  # 3 elements
-            (summary2_path, "https://arxiv.org/pdf/2506.00002.pdf"),  # 2 elements - missing subject
-        ]
-        
-        # Test the data structure handling logic
-        fg = FeedGenerator()
-        fg.title('Research Paper Summaries')
-        fg.link(href='https://example.com')
-        fg.description('Summaries of research papers')
-        
-        new_items = []
-        for path, paper_url, *rest in successes:
-            # Handle inconsistent data structure - some items might be missing paper_subject
-            paper_subject = rest[0] if rest else "Unknown Title"
-            
-            # Validate that the summary file exists
-            assert path.exists()
-            
-            # Read summary content
-            paper_summary_markdown_content = path.read_text(encoding="utf-8")
-            
-            # Add entry to RSS feed
-            entry = fg.add_entry()
-            entry.title(paper_subject)
-            entry.link(href=paper_url)
-            entry.description(f"<p>{paper_summary_markdown_content}</p>")
-            new_items.append(entry)
+    summary1_path = summary_dir / "2506.00001.md"
+    summary2_path = summary_dir / "2506.00002.md"
+    
+    # Simulate the successes list with inconsistent structures
+    # Some items have 3 elements (path, url, subject), some have 2 (path, url)
+    successes = [
+        (summary1_path, "https://arxiv.org/pdf/2506.00001.pdf", "Paper Title 1"),  # 3 elements
+        (summary2_path, "https://arxiv.org/pdf/2506.00002.pdf"),  # 2 elements - missing subject
+    ]
+    
+    # Test the data structure handling logic
+    fg = fg_factory()
+    
+    new_items = []
+    for path, paper_url, *rest in successes:
+        # Handle inconsistent data structure - some items might be missing paper_subject
+        paper_subject = rest[0] if rest else "Unknown Title"
         
-        # Verify entries were processed correctly
-        assert len(fg.entry()) == 2
+        # Validate that the summary file exists
+        assert path.exists()
         
-        # Get all entries and verify they exist (order may vary)
-        entries = fg.entry()
-        titles = [entry.title() for entry in entries]
-        urls = [entry.link()[0]['href'] for entry in entries]
+        # Read summary content
+        paper_summary_markdown_content = path.read_bytes().decode("utf-8")
         
-        assert "Paper Title 1" in titles
-        assert "Unknown Title" in titles  # Fallback for missing subject
-        assert "https://arxiv.org/pdf/2506.00001.pdf" in urls
-        assert "https://arxiv.org/pdf/2506.00002.pdf" in urls
+        # Add entry to RSS feed
+        entry = fg.add_entry()
+        entry.title(paper_subject)
+        entry.link(href=paper_url)
+        entry.description(f"<p>{paper_summary_markdown_content}</p>")
+        new_items.append(entry)
+    
+    # Verify entries were processed correctly
+    entries = fg.entry()
+    assert len(entries) == 2
+    
+    # Get all entries and verify they exist (order may vary)
+    titles = [entry.title() for entry in entries]
+    urls = [entry.link()[0]['href'] for entry in entries]
+    
+    assert "Paper Title 1" in titles
+    assert "Unknown Title" in titles  # Fallback for missing subject
+    assert "https://arxiv.org/pdf/2506.00001.pdf" in urls
+    assert "https://arxiv.org/pdf/2506.00002.pdf" in urls
 
 
-def test_rss_file_parsing_and_reconstruction():
+def test_rss_file_parsing_and_reconstruction(fg_factory, sample_rss_root):
     """Test parsing existing RSS file and reconstructing entries."""
     
-    # Create a comprehensive RSS file with metadata
-    rss_content = """<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-    <channel>
-        <title>Research Paper Summaries</title>
-        <link>https://example.com</link>
-        <description>Summaries of research papers</description>
-        <item>
-            <title>Paper Title 1</title>
-            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
-            <description>Summary content 1</description>
-            <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
-        </item>
-        <item>
-            <title>Paper Title 2</title>
-            <link>https://arxiv.org/pdf/2506.00002.pdf</link>
-            <description>Summary content 2</description>
-            <pubDate>Mon, 02 Jan 2024 00:00:00 GMT</pubDate>
-        </item>
-    </channel>
-</rss>"""
+    # Parsed once per module from SAMPLE_RSS; only read here
+    root = sample_rss_root
+    
+    # Extract all item information
+    items = []
+    for item in root.findall(".//item"):
+        items.append(RssItem(
+            item.findtext("title"),
+            item.findtext("link"),
+            item.findtext("description"),
+            item.findtext("pubDate"),
+        ))
+    
+    # Verify parsing
+    assert len(items) == 2
+    assert items[0].title == "Paper Title 1"
+    assert items[0].link == "https://arxiv.org/pdf/2506.00001.pdf"
+    assert items[0].description == "Summary content 1"
+    assert items[0].pub_date == "Mon, 01 Jan 2024 00:00:00 GMT"
+    
+    assert items[1].title == "Paper Title 2"
+    assert items[1].link == "https://arxiv.org/pdf/2506.00002.pdf"
+    assert items[1].description == "Summary content 2"
+    assert items[1].pub_date == "Mon, 02 Jan 2024 00:00:00 GMT"
+    
+    # Now test reconstruction using FeedGenerator
+    fg = fg_factory()
+    
+    # Reconstruct entries from parsed data
+    for item_data in items:
+        entry = fg.add_entry()
+        entry.title(item_data.title)
+        entry.link(href=item_data.link)
+        entry.description(item_data.description)
+        if item_data.pub_date:
+            entry.published(item_data.pub_date)
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
-        f.write(rss_content)
-        rss_path = f.name
+    # Verify reconstruction
+    entries = fg.entry()
+    assert len(entries) == 2
     
-    try:
-        # Parse the RSS file
-        tree = ET.parse(rss_path)
-        root = tree.getroot()
-        
-        # Extract all item information
-        items = []
-        for item in root.findall(".//item"):
-            title = item.find("title").text
-            link = item.find("link").text
-            description = item.find("description").text
-            pub_date = item.find("pubDate").text if item.find("pubDate") is not None else None
-            
-            items.append({
-                'title': title,
-                'link': link,
-                'description': description,
-                'pubDate': pub_date
-            })
-        
-        # Verify parsing
-        assert len(items) == 2
-        assert items[0]['title'] == "Paper Title 1"
-        assert items[0]['link'] == "https://arxiv.org/pdf/2506.00001.pdf"
-        assert items[0]['description'] == "Summary content 1"
-        assert items[0]['pubDate'] == "Mon, 01 Jan 2024 00:00:00 GMT"
-        
-        assert items[1]['title'] == "Paper Title 2"
-        assert items[1]['link'] == "https://arxiv.org/pdf/2506.00002.pdf"
-        assert items[1]['description'] == "Summary content 2"
-        assert items[1]['pubDate'] == "Mon, 02 Jan 2024 00:00:00 GMT"
-        
-        # Now test reconstruction using FeedGenerator
-        fg = FeedGenerator()
-        fg.title('Research Paper Summaries')
-        fg.link(href='https://example.com')
-        fg.description('Summaries of research papers')
-        
-        # Reconstruct entries from parsed data
-        for item_data in items:
-            entry = fg.add_entry()
-            entry.title(item_data['title'])
-            entry.link(href=item_data['link'])
-            entry.description(item_data['description'])
-            if item_data['pubDate']:
-                entry.published(item_data['pubDate'])
-        
-        # Verify reconstruction
-        assert len(fg.entry()) == 2
-        
-        # Get all entries and verify they exist (order may vary)
-        entries = fg.entry()
-        titles = [entry.title() for entry in entries]
-        assert "Paper Title 1" in titles
-        assert "Paper Title 2" in titles
-        
-        # Generate RSS and verify content
-        new_rss = fg.rss_str(pretty=True).decode('utf-8')
-        assert "Paper Title 1" in new_rss
-        assert "Paper Title 2" in new_rss
-        assert "https://arxiv.org/pdf/2506.00001.pdf" in new_rss
-        assert "https://arxiv.org/pdf/2506.00002.pdf" in new_rss
-        
-    finally:
-        os.unlink(rss_path)
+    # Get all entries and verify they exist (order may vary)
+    titles = [entry.title() for entry in entries]
+    assert "Paper Title 1" in titles
+    assert "Paper Title 2" in titles
+    
+    # Generate RSS and verify content
+    new_rss = fg.rss_str().decode('utf-8')
+    assert "Paper Title 1" in new_rss
+    assert "Paper Title 2" in new_rss
+    assert "https://arxiv.org/pdf/2506.00001.pdf" in new_rss
+    assert "https://arxiv.org/pdf/2506.00002.pdf" in new_rss
 
 
-def test_rss_truncation_to_limit():
+def test_rss_truncation_to_limit(fg_factory):
     """Test RSS feed truncation to maintain item limit."""
-    from feedgen.feed import FeedGenerator
     
-    # Create a FeedGenerator with more than 30 entries
-    fg = FeedGenerator()
-    fg.title('Research Paper Summaries')
-    fg.link(href='https://example.com')
-    fg.description('Summaries of research papers')
+    # 35 candidate items, but only the latest 30 should end up in the feed
+    candidates = (
+        (f'Paper {i}', f'https://arxiv.org/pdf/2506.{i:05d}.pdf', f'<p>Summary for paper {i}</p>')
+        for i in range(1, 36)
+    )
     
-    # Add 35 entries
-    for i in range(35):
+    # Truncate before building, so the 5 discarded items never become FeedEntry objects
+    fg = fg_factory()
+    for title, url, desc in deque(candidates, maxlen=30):
         entry = fg.add_entry()
-        entry.title(f'Paper {i+1}')
-        entry.link(href=f'https://arxiv.org/pdf/2506.{i+1:05d}.pdf')
-        entry.description(f'<p>Summary for paper {i+1}</p>')
-    
-    # Verify we have 35 entries initially
-    assert len(fg.entry()) == 35
+        entry.title(title)
+        entry.link(href=url)
+        entry.description(desc)
     
-    # Apply truncation to 30 items (simulating the current logic)
+    # Verify truncation worked
     entries = fg.entry()
-    if len(entries) > 30:
-        # Note: This is a simplified test - in real code you'd need to handle this differently
-        # since FeedGenerator doesn't allow direct assignment to entries
-        pass
+    assert len(entries) == 30
     
-    # Verify truncation worked (for this test, we'll just verify the original count)
-    assert len(fg.entry()) == 35
-    
-    # Verify we have the expected entries
-    entries = fg.entry()
-    # Get all titles and verify they exist (order may vary)
+    # Get all titles and verify the oldest items were dropped (order may vary)
     titles = [entry.title() for entry in entries]
-    assert "Paper 1" in titles
-    assert "Paper 30" in titles
+    assert "Paper 1" not in titles
+    assert "Paper 5" not in titles
+    assert "Paper 6" in titles
     assert "Paper 35" in titles
 
 
-def test_rss_incremental_update_simulation():
+def test_rss_incremental_update_simulation(fg_factory):
     """Test simulating incremental RSS updates with mock data."""
     
-    # Create initial RSS file
-    initial_rss = """<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-    <channel>
-        <title>Research Paper Summaries</title>
-        <link>https://example.com</link>
-        <description>Summaries of research papers</description>
-        <item>
-            <title>Initial Paper</title>
-            <link>https://arxiv.org/pdf/2506.00001.pdf</link>
-            <description>Initial summary</description>
-        </item>
-    </channel>
-</rss>"""
+    # Simulate reading existing RSS (INITIAL_RSS)
+    existing_entries = set()
+    for _, item in ET.iterparse(io.BytesIO(INITIAL_RSS), events=("end",)):
+        if item.tag != "item":
+            continue
+        existing_entries.add(item.findtext("link"))
+        item.clear()
+    
+    assert len(existing_entries) == 1
+    assert "https://arxiv.org/pdf/2506.00001.pdf" in existing_entries
+    
+    # Simulate new summaries being generated
+    new_successes = [
+        (Path("/mock/summary1.md"), "https://arxiv.org/pdf/2506.00002.pdf", "New Paper 1"),
+        (Path("/mock/summary2.md"), "https://arxiv.org/pdf/2506.00003.pdf", "New Paper 2"),
+    ]
+    
+    # Simulate the RSS update logic
+    fg = fg_factory()
+    
+    new_items = []
+    for path, paper_url, paper_subject in new_successes:
+        # Check if paper already exists
+        if paper_url not in existing_entries:
+            entry = fg.add_entry()
+            entry.title(paper_subject)
+            entry.link(href=paper_url)
+            entry.description(f'<p>Summary for {paper_subject}</p>')
+            new_items.append(entry)
+        else:
+            # This would be skipped in real logic
+            pass
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
-        f.write(initial_rss)
-        rss_path = f.name
+    # Verify new entries were added
+    entries = fg.entry()
+    assert len(entries) == 2
+    assert len(new_items) == 2
     
-    try:
-        # Simulate reading existing RSS
-        existing_entries = []
-        tree = ET.parse(rss_path)
-        root = tree.getroot()
-        
-        for item in root.findall(".//item"):
-            paper_url = item.find("link").text
-            existing_entries.append(paper_url)
-        
-        assert len(existing_entries) == 1
-        assert "https://arxiv.org/pdf/2506.00001.pdf" in existing_entries
-        
-        # Simulate new summaries being generated
-        new_successes = [
-            (Path("/mock/summary1.md"), "https://arxiv.org/pdf/2506.00002.pdf", "New Paper 1"),
-            (Path("/mock/summary2.md"), "https://arxiv.org/pdf/2506.00003.pdf", "New Paper 2"),
-        ]
-        
-        # Simulate the RSS update logic
-        fg = FeedGenerator()
-        fg.title('Research Paper Summaries')
-        fg.link(href='https://example.com')
-        fg.description('Summaries of research papers')
-        
-        new_items = []
-        for path, paper_url, paper_subject in new_successes:
-            # Check if paper already exists
-            if paper_url not in existing_entries:
-                entry = fg.add_entry()
-                entry.title(paper_subject)
-                entry.link(href=paper_url)
-                entry.description(f'<p>Summary for {paper_subject}</p>')
-                new_items.append(entry)
-            else:
-                # This would be skipped in real logic
-                pass
-        
-        # Verify new entries were added
-        assert len(fg.entry()) == 2
-        assert len(new_items) == 2
-        
-        # Verify URLs are correct
-        urls = [entry.link()[0]['href'] for entry in fg.entry()]
-        assert "https://arxiv.org/pdf/2506.00002.pdf" in urls
-        assert "https://arxiv.org/pdf/2506.00003.pdf" in urls
-        
-        # Verify titles are correct
-        titles = [entry.title() for entry in fg.entry()]
-        assert "New Paper 1" in titles
-        assert "New Paper 2" in titles
-        
-    finally:
-        os.unlink(rss_path)
+    # Verify URLs are correct
+    urls = [entry.link()[0]['href'] for entry in entries]
+    assert "https://arxiv.org/pdf/2506.00002.pdf" in urls
+    assert "https://arxiv.org/pdf/2506.00003.pdf" in urls
+    
+    # Verify titles are correct
+    titles = [entry.title() for entry in entries]
+    assert "New Paper 1" in titles
+    assert "New Paper 2" in titles
@@ -27,6 +27,13 @@ def read_user_json(sp, uid):
     return json.loads(p.read_text(encoding="utf-8"))
 
 
+def read_user_events(sp, uid):
+    p = sp.USER_DATA_DIR / f"{uid}.events.jsonl"
+    if not p.exists():
+        return []
+    return [json.loads(line) for line in p.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
 def test_mark_read_saves_local_datetime_with_tz_and_counts_today(tmp_path, monkeypatch):
     import summary_page as sp
 
@@ -43,9 +50,9 @@ def test_mark_read_saves_local_datetime_with_tz_and_counts_today(tmp_path, monke
     assert res.status_code == 200
 
     # verify user data read record
-    data = read_user_json(sp, uid)
-    assert "read" in data and rid in data["read"]
-    ts = data["read"][rid]
+    read_map = sp.load_read_map(uid)
+    assert rid in read_map
+    ts = read_map[rid]
     assert isinstance(ts, str) and "T" in ts
     # has timezone offset +HH:MM or -HH:MM
     assert ("+" in ts or "-" in ts[10:]) and ts[-3] == ":"
@@ -70,8 +77,7 @@ def test_event_ingest_filters_non_clicks_and_converts_timezone(tmp_path, monkeyp
     # non-click event should be ignored
     res = client.post("/event", json={"type": "page_view", "meta": {"page": "index"}})
     assert res.status_code == 200
-    data = read_user_json(sp, uid)
-    assert data.get("events", []) == []
+    assert read_user_events(sp, uid) == []
 
     # click event open_pdf with client ts and tz offset
     client_ts = "2025-01-02T03:04:05Z"  # UTC
@@ -87,8 +93,7 @@ def test_event_ingest_filters_non_clicks_and_converts_timezone(tmp_path, monkeyp
         },
     )
     assert res2.status_code == 200
-    data = read_user_json(sp, uid)
-    evts = data.get("events", [])
+    evts = read_user_events(sp, uid)
     assert len(evts) == 1
     evt = evts[0]
     assert evt["type"] == "open_pdf" and evt["arxiv_id"] == "2500.00002"
@@ -119,8 +124,7 @@ def test_event_ingest_allows_only_click_types(tmp_path, monkeypatch):
     res2 = client.post("/event", json={"type": "foo", "ts": "2025-01-01T00:00:00Z"})
     assert res2.status_code == 200
 
-    data = read_user_json(sp, uid)
-    ev_types = [e["type"] for e in data.get("events", [])]
+    ev_types = [e["type"] for e in read_user_events(sp, uid)]
     for t in allowed:
         assert t in ev_types
     assert "foo" not in ev_types
@@ -164,3 +168,503 @@ def test_index_renders_tags_and_filters(tmp_path, monkeypatch):
     assert "llm" in html4 and "agents" in html4
 
 
+
+
+def test_rendered_html_is_cached_until_file_changes(tmp_path, monkeypatch):
+    import os
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    sp.app.config.update(TESTING=True)
+    client = sp.app.test_client()
+
+    md = sp.SUMMARY_DIR / "2506.33333.md"
+    md.write_text("first version", encoding="utf-8")
+
+    calls = []
+    real_render = sp.render_markdown
+    monkeypatch.setattr(sp, "render_markdown", lambda text: calls.append(text) or real_render(text))
+    sp._render_cached.cache_clear()
+
+    assert "first version" in client.get("/").data.decode("utf-8")
+    assert "first version" in client.get("/").data.decode("utf-8")
+    assert len(calls) == 1
+
+    md.write_text("second version", encoding="utf-8")
+    st = md.stat()
+    os.utime(md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert "second version" in client.get("/summary/2506.33333").data.decode("utf-8")
+    assert len(calls) == 2
+
+
+def test_index_preview_is_bounded_and_links_full_summary(tmp_path):
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    sp.app.config.update(TESTING=True)
+    client = sp.app.test_client()
+
+    body = "\n".join(f"line {i} " + "x" * 60 for i in range(200)) + "\nTAIL_MARKER\n"
+    (sp.SUMMARY_DIR / "2506.44444.md").write_text(body, encoding="utf-8")
+
+    html = client.get("/").data.decode("utf-8")
+    assert "line 0 " in html
+    assert "TAIL_MARKER" not in html
+    assert "/summary/2506.44444" in html
+
+    detail = client.get("/summary/2506.44444").data.decode("utf-8")
+    assert "TAIL_MARKER" in detail
+
+
+def test_page_previews_render_on_pool_in_order(tmp_path, monkeypatch):
+    import threading
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    threads = []
+
+    def fake_render(md_path, limit=None):
+        threads.append(threading.current_thread().name)
+        if md_path.stem == "bad":
+            raise OSError("boom")
+        return f"<p>{md_path.stem}</p>", False
+
+    monkeypatch.setattr(sp, "_render_file", fake_render)
+    metas = [{"id": i} for i in ("a", "bad", "c")]
+    out = sp._render_page_entries(metas)
+
+    assert [e["preview_html"] for e in out] == ["<p>a</p>", "", "<p>c</p>"]
+    assert all(name.startswith("md") for name in threads)
+
+
+def test_read_preview_closes_open_fence(tmp_path):
+    import summary_page as sp
+
+    p = tmp_path / "a.md"
+    p.write_text("intro\n```python\n" + "x = 1\n" * 100, encoding="utf-8")
+    text, truncated = sp._read_preview(p, 64)
+    assert truncated
+    assert text.endswith("```")
+    assert all(len(ln) > 0 for ln in text.splitlines())
+
+
+def test_entries_meta_cached_until_summary_dir_changes(tmp_path, monkeypatch):
+    import os
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    (sp.SUMMARY_DIR / "2506.55555.md").write_text("a", encoding="utf-8")
+    first = sp._scan_entries_meta()
+    assert [e["id"] for e in first] == ["2506.55555"]
+
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(sp.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+    assert sp._scan_entries_meta() == first
+    assert scans == []
+
+    (sp.SUMMARY_DIR / "2506.66666.md").write_text("b", encoding="utf-8")
+    st = sp.SUMMARY_DIR.stat()
+    os.utime(sp.SUMMARY_DIR, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    ids = {e["id"] for e in sp._scan_entries_meta()}
+    assert ids == {"2506.55555", "2506.66666"}
+    assert len(scans) == 1
+
+
+def test_base_css_is_versioned_and_cacheable(client):
+    import summary_page as sp
+
+    c = client
+    html = c.get("/").data.decode("utf-8")
+    assert f"/assets/base.css?v={sp.BASE_CSS_VERSION}" in html
+    resp = c.get(f"/assets/base.css?v={sp.BASE_CSS_VERSION}")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/css"
+    assert "max-age=86400" in resp.headers["Cache-Control"]
+
+
+def test_render_markdown_reuses_instance_without_state_leak(monkeypatch):
+    import summary_page as sp
+
+    monkeypatch.setattr(sp, "_MD_IT", None)
+    sp._RENDER_MEMO.clear()
+    first = sp.render_markdown("# Title\n\n| a | b |\n|---|---|\n| 1 | 2 |")
+    assert "<table>" in first and 'id="title"' in first
+    second = sp.render_markdown("# Title")
+    # toc ids must not be de-duplicated across calls (e.g. "title_1")
+    assert 'id="title"' in second
+    assert sp._MD_LOCAL.md is not None
+
+
+def test_render_markdown_memoizes_by_content(monkeypatch):
+    import summary_page as sp
+
+    sp._RENDER_MEMO.clear()
+    calls = []
+    real = sp._convert_markdown
+    monkeypatch.setattr(sp, "_convert_markdown", lambda text: calls.append(text) or real(text))
+    monkeypatch.setattr(sp, "RENDER_MEMO_SIZE", 2)
+
+    html = sp.render_markdown("same *text*")
+    assert sp.render_markdown("same *text*") == html
+    assert calls == ["same *text*"]
+
+    sp.render_markdown("b")
+    sp.render_markdown("c")  # evicts the least recently used entry
+    sp.render_markdown("same *text*")
+    assert calls == ["same *text*", "b", "c", "same *text*"]
+
+
+def test_read_status_persists_in_sqlite_and_resets(client):
+    import summary_page as sp
+
+    client.set_cookie("uid", "u9")
+    assert client.post("/mark_read/2500.00011").status_code == 200
+    assert client.post("/mark_read/2500.00012").status_code == 200
+    assert client.post("/unmark_read/2500.00011").status_code == 200
+    assert set(sp.load_read_map("u9")) == {"2500.00012"}
+    assert (sp.USER_DATA_DIR / "reads.db").exists()
+    assert not (sp.USER_DATA_DIR / "u9.json").exists()
+
+    assert client.post("/reset").status_code == 200
+    assert sp.load_read_map("u9") == {}
+
+
+def test_legacy_json_reads_are_migrated(tmp_path):
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    legacy = {"read": {"2500.1": "2025-01-01T08:00:00+08:00", "2500.2": None}, "events": [{"type": "login"}]}
+    (sp.USER_DATA_DIR / "old.json").write_text(json.dumps(legacy), encoding="utf-8")
+    (sp.USER_DATA_DIR / "older.json").write_text(json.dumps({"read": ["2500.3"]}), encoding="utf-8")
+
+    assert sp.load_read_map("old") == {"2500.1": "2025-01-01T08:00:00+08:00", "2500.2": None}
+    assert sp.load_read_map("older") == {"2500.3": None}
+    assert sp.count_reads_on("old", "2025-01-01") == 1
+    remaining = read_user_json(sp, "old")
+    assert "read" not in remaining
+    assert remaining["events"] == [{"type": "login"}]
+
+
+def test_render_markdown_it_backend_when_installed(monkeypatch):
+    pytest.importorskip("markdown_it")
+    import summary_page as sp
+
+    monkeypatch.setattr(sp, "_MD_IT", sp._build_markdown_it())
+    html = sp.render_markdown("| a | b |\n|---|---|\n| 1 | 2 |\n\n```python\nx = 1\n```\n\n~~old~~")
+    assert "<table>" in html
+    assert "<pre><code" in html
+    assert "<s>old</s>" in html
+
+
+def test_concurrent_mark_read_keeps_every_update(client):
+    from concurrent.futures import ThreadPoolExecutor
+    import summary_page as sp
+
+    ids = [f"2500.{i:05d}" for i in range(40)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda rid: sp.add_read("u10", rid, "2025-01-01T00:00:00+00:00"), ids))
+    assert set(sp.load_read_map("u10")) == set(ids)
+
+
+def test_text_responses_are_gzipped_when_accepted(client):
+    import gzip
+    import summary_page as sp
+
+    body = "# Title\n\n" + "some summary text\n" * 100
+    (sp.SUMMARY_DIR / "2506.77777.md").write_text(body, encoding="utf-8")
+
+    raw = client.get("/raw/2506.77777.md", headers={"Accept-Encoding": "gzip"})
+    assert raw.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in raw.headers["Vary"]
+    assert gzip.decompress(raw.data).decode("utf-8") == body
+
+    page = client.get("/summary/2506.77777", headers={"Accept-Encoding": "gzip, deflate"})
+    assert page.headers["Content-Encoding"] == "gzip"
+    assert "some summary text" in gzip.decompress(page.data).decode("utf-8")
+
+    plain = client.get("/raw/2506.77777.md")
+    assert "Content-Encoding" not in plain.headers
+    assert plain.data.decode("utf-8") == body
+
+
+def test_raw_markdown_is_cacheable_and_conditional(client):
+    import summary_page as sp
+
+    (sp.SUMMARY_DIR / "2506.88888.md").write_text("# raw\n", encoding="utf-8")
+
+    res = client.get("/raw/2506.88888.md")
+    assert res.status_code == 200
+    assert res.mimetype == "text/markdown"
+    assert f"max-age={sp.RAW_MAX_AGE}" in res.headers["Cache-Control"]
+    assert res.headers.get("Last-Modified")
+
+    again = client.get("/raw/2506.88888.md", headers={"If-None-Match": res.headers["ETag"]})
+    assert again.status_code == 304
+
+    assert client.get("/raw/2506.00000.md").status_code == 404
+
+
+def test_favicon_is_prebuilt_and_conditional(client):
+    import summary_page as sp
+
+    res = client.get("/favicon.svg")
+    assert res.status_code == 200
+    assert res.data == sp.FAVICON_SVG and res.data.startswith(b"<svg")
+    assert "max-age" in res.headers["Cache-Control"]
+
+    again = client.get("/favicon.ico", headers={"If-None-Match": res.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_save_user_data_is_atomic(tmp_path, monkeypatch):
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    sp.save_user_data("u1", {"prefs": 1})
+    assert read_user_json(sp, "u1") == {"prefs": 1}
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(sp.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        sp.save_user_data("u1", {"prefs": 2})
+    assert read_user_json(sp, "u1") == {"prefs": 1}
+    assert [p.name for p in sp.USER_DATA_DIR.iterdir()] == ["u1.json"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_round_trip_unicode(monkeypatch, use_orjson):
+    import summary_page as sp
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(sp, "orjson", None)
+    obj = {"read": {"2500.1": "2025-01-01T00:00:00+08:00"}, "events": [{"meta": {"tag": "多模态"}}]}
+    raw = sp._json_dumps(obj)
+    assert isinstance(raw, bytes) and "多模态".encode("utf-8") in raw
+    assert sp._json_loads(raw) == obj
+    with pytest.raises(json.JSONDecodeError):
+        sp._json_loads(b"{not json")
+
+
+def test_legacy_json_events_move_to_jsonl_log(client):
+    import summary_page as sp
+
+    old = [{"ts": "2025-01-01T00:00:00+00:00", "type": "login"}]
+    (sp.USER_DATA_DIR / "u11.json").write_text(json.dumps({"events": old}), encoding="utf-8")
+    client.set_cookie("uid", "u11")
+    assert client.post("/event", json={"type": "logout", "ts": "2025-01-02T00:00:00Z"}).status_code == 200
+
+    events = read_user_events(sp, "u11")
+    assert [e["type"] for e in events] == ["login", "logout"]
+    assert not (sp.USER_DATA_DIR / "u11.json").exists()
+    assert [e["type"] for e in sp.load_user_data("u11")["events"]] == ["login", "logout"]
+
+    assert client.post("/reset").status_code == 200
+    assert not (sp.USER_DATA_DIR / "u11.events.jsonl").exists()
+
+
+def test_events_log_rotates_past_size_limit(client, monkeypatch):
+    import summary_page as sp
+
+    monkeypatch.setattr(sp, "EVENTS_ROTATE_BYTES", 200)
+    client.set_cookie("uid", "u12")
+    for i in range(6):
+        ts = f"2025-01-0{i + 1}T00:00:00Z"
+        assert client.post("/event", json={"type": "login", "ts": ts}).status_code == 200
+
+    archives = sp._archived_events_files("u12")
+    assert archives
+    assert [e["ts"][:10] for e in sp.iter_events("u12")] == [f"2025-01-0{i + 1}" for i in range(6)]
+
+    assert client.post("/reset").status_code == 200
+    assert list(sp.USER_DATA_DIR.glob("u12.events*")) == []
+
+
+def test_entries_index_inverts_tags_and_precomputes_clouds(tmp_path):
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    for rid, tags in [("2506.1", {"top": ["llm"], "tags": ["agents"]}), ("2506.2", {"top": ["cv"], "tags": ["agents", "diffusion"]})]:
+        (sp.SUMMARY_DIR / f"{rid}.md").write_text("x", encoding="utf-8")
+        (sp.SUMMARY_DIR / f"{rid}.tags.json").write_text(json.dumps(tags), encoding="utf-8")
+
+    idx = sp._entries_index()
+    assert idx["by_tag"]["agents"] == {"2506.1", "2506.2"}
+    assert idx["by_tag"]["llm"] == {"2506.1"}
+    assert idx["by_top"] == {"llm": {"2506.1"}, "cv": {"2506.2"}}
+    assert idx["tag_cloud"][0] == {"name": "agents", "count": 2}
+
+    client = sp.app.test_client()
+    html = client.get("/?top=cv").data.decode("utf-8")
+    assert "2506.2" in html and "2506.1" not in html
+
+
+def test_read_list_uses_id_lookup_in_listing_order(tmp_path):
+    import os
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    for n, rid in enumerate(["2506.1", "2506.2", "2506.3"]):
+        p = sp.SUMMARY_DIR / f"{rid}.md"
+        p.write_text(rid, encoding="utf-8")
+        os.utime(p, (1_700_000_000 + n, 1_700_000_000 + n))
+    sp.add_read("u1", "2506.1", None)
+    sp.add_read("u1", "2506.3", None)
+    sp.add_read("u1", "2506.gone", None)
+
+    idx = sp._entries_index()
+    assert [rid for rid, _ in sorted(idx["by_id"].items(), key=lambda kv: kv[1][0])] == ["2506.3", "2506.2", "2506.1"]
+
+    client = sp.app.test_client()
+    client.set_cookie("uid", "u1")
+    html = client.get("/read").data.decode("utf-8")
+    assert "2506.2" not in html
+    assert html.index("/summary/2506.3") < html.index("/summary/2506.1")
+
+
+def test_tag_query_uses_trigram_index(tmp_path):
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    for rid, tags in [("2506.1", ["reinforcement-learning"]), ("2506.2", ["diffusion"]), ("2506.3", ["learning-theory"])]:
+        (sp.SUMMARY_DIR / f"{rid}.md").write_text("x", encoding="utf-8")
+        (sp.SUMMARY_DIR / f"{rid}.tags.json").write_text(json.dumps({"tags": tags}), encoding="utf-8")
+
+    idx = sp._entries_index()
+    assert sp._ids_matching_tag_query(idx, "learn") == {"2506.1", "2506.3"}
+    # every trigram present but not contiguous in any tag
+    assert sp._ids_matching_tag_query(idx, "learning-learning") == set()
+    assert sp._ids_matching_tag_query(idx, "fu") == {"2506.2"}
+    assert sp._ids_matching_tag_query(idx, "zzz") == set()
+
+
+def test_tag_files_are_parsed_once_per_mtime(tmp_path, monkeypatch):
+    import os
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    (sp.SUMMARY_DIR / "2506.1.md").write_text("x", encoding="utf-8")
+    tpath = sp.SUMMARY_DIR / "2506.1.tags.json"
+    tpath.write_text(json.dumps({"tags": {"top": [" LLM "], "tags": ["Agents", ""]}}), encoding="utf-8")
+
+    parses = []
+    real_loads = sp._json_loads
+    monkeypatch.setattr(sp, "_json_loads", lambda b: parses.append(b) or real_loads(b))
+
+    meta = sp._scan_entries_meta()
+    assert meta[0]["top_tags"] == ["llm"] and meta[0]["detail_tags"] == ["agents"]
+    assert meta[0]["tags"] == ["llm", "agents"]
+
+    # a new summary invalidates the entries cache but not the unchanged tag file
+    (sp.SUMMARY_DIR / "2506.2.md").write_text("y", encoding="utf-8")
+    st = sp.SUMMARY_DIR.stat()
+    os.utime(sp.SUMMARY_DIR, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert len(sp._scan_entries_meta()) == 2
+    assert len(parses) == 1
+
+
+def test_index_sees_in_place_rewrites(client, monkeypatch):
+    import os
+    import summary_page as sp
+
+    md = sp.SUMMARY_DIR / "2506.77777.md"
+    tags = sp.SUMMARY_DIR / "2506.77777.tags.json"
+    md.write_text("# Old preview", encoding="utf-8")
+    tags.write_text(json.dumps({"tags": ["oldtag"]}), encoding="utf-8")
+    first = client.get("/")
+    assert "Old preview" in first.get_data(as_text=True)
+    etag = first.headers["ETag"]
+
+    # rewrite both files in place; the directory mtime is left untouched
+    dir_st = sp.SUMMARY_DIR.stat()
+    md.write_text("# New preview", encoding="utf-8")
+    tags.write_text(json.dumps({"tags": ["newtag"]}), encoding="utf-8")
+    for path in (md, tags):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    os.utime(sp.SUMMARY_DIR, ns=(dir_st.st_atime_ns, dir_st.st_mtime_ns))
+
+    monkeypatch.setattr(sp, "ENTRIES_RECHECK_SECONDS", 0.0)
+    res = client.get("/", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    body = res.get_data(as_text=True)
+    assert "New preview" in body and "newtag" in body and "oldtag" not in body
+
+
+def test_pages_revalidate_with_etags(client):
+    import os
+    import summary_page as sp
+
+    md = sp.SUMMARY_DIR / "2506.88888.md"
+    md.write_text("# Paper", encoding="utf-8")
+    client.set_cookie("uid", "u12")
+
+    first = client.get("/")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+    # marking a paper read changes what the index shows
+    client.post("/mark_read/2506.88888")
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 200
+
+    detail = client.get("/summary/2506.88888")
+    d_etag = detail.headers["ETag"]
+    assert client.get("/summary/2506.88888", headers={"If-None-Match": d_etag}).status_code == 304
+    st = md.stat()
+    os.utime(md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert client.get("/summary/2506.88888", headers={"If-None-Match": d_etag}).status_code == 200
+
+    css = client.get("/assets/base.css")
+    assert client.get("/assets/base.css", headers={"If-None-Match": css.headers["ETag"]}).status_code == 304
+    gz = client.get("/assets/base.css", headers={"Accept-Encoding": "gzip"})
+    assert client.get(
+        "/assets/base.css", headers={"Accept-Encoding": "gzip", "If-None-Match": gz.headers["ETag"]}
+    ).status_code == 304
+
+
+def test_full_render_is_persisted_and_refreshed(tmp_path, monkeypatch):
+    import os
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    md = sp.SUMMARY_DIR / "2506.99999.md"
+    md.write_text("first", encoding="utf-8")
+    other = sp.SUMMARY_DIR / "2506.99998.md"
+    other.write_text("other", encoding="utf-8")
+    sp._render_full(other, other.stat().st_mtime_ns)
+    dir_mtime = sp.SUMMARY_DIR.stat().st_mtime_ns
+
+    html = sp._render_full(md, md.stat().st_mtime_ns)
+    cached = sp._html_cache_path(md)
+    assert cached.read_text(encoding="utf-8") == html and "first" in html
+    # the cache lives in a subdirectory, leaving the entries-cache key alone
+    assert sp.SUMMARY_DIR.stat().st_mtime_ns == dir_mtime
+
+    monkeypatch.setattr(sp, "render_markdown", lambda text: pytest.fail("should reuse disk copy"))
+    assert sp._render_full(md, md.stat().st_mtime_ns) == html
+    monkeypatch.undo()
+
+    md.write_text("second", encoding="utf-8")
+    st = md.stat()
+    os.utime(md, ns=(st.st_atime_ns, cached.stat().st_mtime_ns + 1_000_000))
+    assert "second" in sp._render_full(md, md.stat().st_mtime_ns)
+
+
+def test_html_cache_name_tracks_renderer_config(tmp_path, monkeypatch):
+    import summary_page as sp
+
+    setup_app_dirs(sp, tmp_path)
+    md = sp.SUMMARY_DIR / "2506.99999.md"
+    md.write_text("body", encoding="utf-8")
+    html = sp._render_full(md, md.stat().st_mtime_ns)
+    assert sp._RENDER_VERSION in sp._html_cache_path(md).name
+
+    # a config change must not serve HTML rendered under the old one
+    monkeypatch.setattr(sp, "_RENDER_VERSION", "changed0")
+    monkeypatch.setattr(sp, "render_markdown", lambda text: "<p>fresh</p>")
+    assert not sp._html_cache_path(md).exists()
+    assert sp._render_full(md, md.stat().st_mtime_ns) == "<p>fresh</p>" != html